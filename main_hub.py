@@ -0,0 +1,6 @@
+from src.app_hub import AppHub
+
+
+if __name__ == "__main__":
+    app = AppHub()
+    app.start()
@@ -0,0 +1,156 @@
+import asyncio
+from functools import partial
+import logging
+from typing import Any, Optional
+from fastapi import FastAPI
+import uvicorn
+from src.device_camera.factory import DeviceCameraFactory
+from src.device_door.factory import DeviceDoorFactory
+from src.env import Env
+from src.health_check.health_check_http_api import HealthCheckHttpApi
+from src.image_classifier.impl_batching import BatchingImageClassifier
+from src.image_classifier.impl_process_pool import ProcessPoolImageClassifier
+from src.image_classifier.impl_yolo import YoloImageClassifier, YoloModelSize
+from src.library.life_cycle import LifeCycle
+from src.shared.http_api import HttpApi
+from src.smart_door.config import Config
+from src.smart_door.core.model import DEFAULT_CAMERA_ID
+from src.smart_door.smart_door import Runtime
+from src.smart_door_hub.smart_door_hub import DoorId, HubDoor, SmartDoorHub
+from src.smart_door_hub.smart_door_hub_http_api import SmartDoorHubHttpApi
+
+DEFAULT_DOOR_ID: DoorId = "main"
+
+
+class AppHub(LifeCycle):
+    """
+    Headless entry point that runs many doors from one box: one YOLO model in
+    one worker process serves every door, with concurrent requests micro
+    batched, and their status is served over HTTP on /doors. With the cascade
+    enabled a nano model in its own worker screens frames first. The doors
+    run on the server's asyncio loop rather than on threads of their own.
+    """
+
+    _logger: logging.Logger
+    _image_classifier: ProcessPoolImageClassifier
+    _batching_image_classifier: BatchingImageClassifier
+    _fast_image_classifier: Optional[ProcessPoolImageClassifier]
+    _fast_batching_image_classifier: Optional[BatchingImageClassifier]
+    _smart_door_hub: SmartDoorHub
+    _server: uvicorn.Server
+
+    def __init__(
+        self,
+        doors: Optional[dict[DoorId, HubDoor]] = None,
+        config: Optional[Config] = None,
+        port: int = 8000,
+    ) -> None:
+        logging.basicConfig(level=logging.INFO)
+
+        self._logger = logging.getLogger("app")
+        config = config if config is not None else Config()
+
+        self._image_classifier = ProcessPoolImageClassifier(
+            create_image_classifier=partial(
+                YoloImageClassifier,
+                model_size=YoloModelSize.EXTRA_LARGE,
+                region_of_interest=config.classification_region_of_interest,
+                image_size=config.classification_image_size,
+            )
+        )
+
+        # Doors classifying at the same moment share one model batch.
+        self._batching_image_classifier = BatchingImageClassifier(
+            image_classifier=self._image_classifier
+        )
+
+        self._fast_image_classifier = None
+        self._fast_batching_image_classifier = None
+        if config.classification_cascade_enabled:
+            self._fast_image_classifier = ProcessPoolImageClassifier(
+                create_image_classifier=partial(
+                    YoloImageClassifier,
+                    model_size=YoloModelSize.NANO,
+                    confidence_threshold=config.classification_cascade_min_weight,
+                    region_of_interest=config.classification_region_of_interest,
+                    image_size=config.classification_image_size,
+                )
+            )
+            self._fast_batching_image_classifier = BatchingImageClassifier(
+                image_classifier=self._fast_image_classifier
+            )
+
+        self._smart_door_hub = SmartDoorHub(
+            image_classifier=self._batching_image_classifier,
+            fast_image_classifier=self._fast_batching_image_classifier,
+            doors=doors if doors is not None else self._doors_from_env(),
+            logger=self._logger,
+            config=config,
+            runtime=Runtime.ASYNCIO,
+        )
+
+        kwargs: dict[str, Any] = {
+            "logger": self._logger,
+            "smart_door_hub": self._smart_door_hub,
+        }
+        http_apis: list[HttpApi] = [
+            HealthCheckHttpApi(**kwargs),
+            SmartDoorHubHttpApi(**kwargs),
+        ]
+
+        self.app = FastAPI()
+        for http_api in http_apis:
+            self.app.include_router(http_api.api_router)
+
+        self._server = uvicorn.Server(
+            uvicorn.Config(self.app, host="0.0.0.0", port=port, log_level="info")
+        )
+
+    def _doors_from_env(self) -> dict[DoorId, HubDoor]:
+        """The env describes a single door and camera."""
+        env = Env.load()
+        return {
+            DEFAULT_DOOR_ID: HubDoor(
+                device_door=DeviceDoorFactory(logger=self._logger).create_from_env(
+                    env=env
+                ),
+                device_cameras={
+                    DEFAULT_CAMERA_ID: DeviceCameraFactory(
+                        logger=self._logger
+                    ).create_from_env(env=env)
+                },
+            )
+        }
+
+    def start(self) -> None:
+        self._logger.info("Starting")
+        self._image_classifier.start()
+        self._batching_image_classifier.start()
+        if self._fast_image_classifier is not None:
+            self._fast_image_classifier.start()
+        if self._fast_batching_image_classifier is not None:
+            self._fast_batching_image_classifier.start()
+        try:
+            asyncio.run(self._serve())
+        finally:
+            self.stop()
+
+    async def _serve(self) -> None:
+        self._smart_door_hub.start()
+        try:
+            await self._server.serve()
+        finally:
+            # Stop the doors while their loop is still running.
+            self._smart_door_hub.stop()
+
+    def stop(self) -> None:
+        self._logger.info("Stopping")
+        self._server.should_exit = True
+        self._smart_door_hub.stop()
+        self._batching_image_classifier.stop()
+        self._image_classifier.stop()
+        if self._fast_batching_image_classifier is not None:
+            self._fast_batching_image_classifier.stop()
+        if self._fast_image_classifier is not None:
+            self._fast_image_classifier.stop()
+        self._logger.info("Stopped")
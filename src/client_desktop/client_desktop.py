@@ -1,14 +1,17 @@
+from functools import partial
 import logging
 from typing import Optional
 from src.client_desktop.gui.gui import Gui
 from src.device_camera.interface import DeviceCamera
 from src.device_door.factory import DeviceDoorFactory
 from src.library.life_cycle import LifeCycle
+from src.smart_door.config import Config
+from src.smart_door.core.model import DEFAULT_CAMERA_ID
 from src.smart_door.smart_door import SmartDoor
 from src.device_door.impl_fake import FakeDeviceDoor
 from src.device_door.interface import DeviceDoor
 from src.image_classifier.impl_yolo import YoloImageClassifier, YoloModelSize
-from src.image_classifier.interface import ImageClassifier
+from src.image_classifier.impl_process_pool import ProcessPoolImageClassifier
 from src.env import Env
 from src.device_camera.factory import DeviceCameraFactory
 
@@ -16,7 +19,8 @@ from src.device_camera.factory import DeviceCameraFactory
 class DesktopClient(LifeCycle):
     _logger: logging.Logger
     _gui: Gui
-    _image_classifier: ImageClassifier
+    _image_classifier: ProcessPoolImageClassifier
+    _fast_image_classifier: Optional[ProcessPoolImageClassifier]
     _device_door: DeviceDoor
     _device_camera: DeviceCamera
     _smart_door: SmartDoor
@@ -24,10 +28,29 @@ class DesktopClient(LifeCycle):
     def __init__(self, env: Env, logger: logging.Logger) -> None:
         self._logger = logger.getChild("client_desktop")
 
-        self._image_classifier = YoloImageClassifier(
-            model_size=YoloModelSize.EXTRA_LARGE
+        config = Config()
+
+        self._image_classifier = ProcessPoolImageClassifier(
+            create_image_classifier=partial(
+                YoloImageClassifier,
+                model_size=YoloModelSize.EXTRA_LARGE,
+                region_of_interest=config.classification_region_of_interest,
+                image_size=config.classification_image_size,
+            )
         )
 
+        self._fast_image_classifier = None
+        if config.classification_cascade_enabled:
+            self._fast_image_classifier = ProcessPoolImageClassifier(
+                create_image_classifier=partial(
+                    YoloImageClassifier,
+                    model_size=YoloModelSize.NANO,
+                    confidence_threshold=config.classification_cascade_min_weight,
+                    region_of_interest=config.classification_region_of_interest,
+                    image_size=config.classification_image_size,
+                )
+            )
+
         device_door_factory = DeviceDoorFactory(logger=self._logger)
 
         device_door = device_door_factory.create_from_env(env=env)
@@ -42,9 +65,11 @@ class DesktopClient(LifeCycle):
 
         self._smart_door = SmartDoor(
             image_classifier=self._image_classifier,
-            device_camera=self._device_camera,
+            fast_image_classifier=self._fast_image_classifier,
+            device_cameras={DEFAULT_CAMERA_ID: self._device_camera},
             device_door=self._device_door,
             logger=self._logger,
+            config=config,
         )
 
         self._gui = Gui(
@@ -55,6 +80,9 @@ class DesktopClient(LifeCycle):
 
     def start(self) -> None:
         self._logger.info("Starting")
+        self._image_classifier.start()
+        if self._fast_image_classifier is not None:
+            self._fast_image_classifier.start()
         self._device_door.start()
         self._device_camera.start()
         self._smart_door.start()
@@ -66,5 +94,24 @@ class DesktopClient(LifeCycle):
         self._gui.stop()
         self._device_camera.stop()
         self._smart_door.stop()
+        self._log_classification_stats()
         self._device_door.stop()
+        self._image_classifier.stop()
+        if self._fast_image_classifier is not None:
+            self._fast_image_classifier.stop()
         self._logger.info("Stopped")
+
+    def _log_classification_stats(self) -> None:
+        cascade_stats = self._smart_door.classification_cascade_stats()
+        if cascade_stats is not None:
+            self._logger.info(
+                "Cascade escalated %d of %d frames (%.0f%%)",
+                cascade_stats.escalated,
+                cascade_stats.classified,
+                cascade_stats.escalation_rate * 100,
+            )
+        cache_stats = self._smart_door.classification_cache_stats()
+        if cache_stats is not None:
+            self._logger.info(
+                "Classification cache hit rate %.0f%%", cache_stats.hit_rate * 100
+            )
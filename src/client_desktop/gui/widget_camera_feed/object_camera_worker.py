@@ -1,6 +1,7 @@
 from PySide6.QtCore import QTimer, Signal, QObject  # type: ignore
 from PySide6.QtGui import QImage  # type: ignore
 from src.device_camera.interface import DeviceCamera
+from src.image.channel_order import ChannelOrder
 
 
 class ObjectCameraWorker(QObject):
@@ -25,12 +26,15 @@ class ObjectCameraWorker(QObject):
             return
 
         image = image[0]
-        image = image.np_array
-        height, width, _ = image.shape
-        bytes_per_line = 3 * width
-        q_image = QImage(
-            image.data, width, height, bytes_per_line, QImage.Format_RGB888
+        image_format = (
+            QImage.Format_BGR888
+            if image.channel_order == ChannelOrder.BGR
+            else QImage.Format_RGB888
         )
+        array = image.np_array
+        height, width, _ = array.shape
+        bytes_per_line = array.strides[0]
+        q_image = QImage(array.data, width, height, bytes_per_line, image_format)
         self.image_ready.emit(q_image)
 
     def process(self):
@@ -54,6 +54,7 @@ class DeviceCameraFactory:
             wyze_device=wyze_device,
             host_ip=env.wyze_bridge_host_ip,
             api_key=env.wyze_bridge_api_key,
+            use_substream=env.wyze_bridge_substream,
         )
         return wyze_device_camera
 
@@ -0,0 +1,291 @@
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Optional
+import secrets
+import threading
+import numpy as np
+
+DEFAULT_CAPACITY = 4
+
+# Header layout, as int64 values at the start of the block:
+# [latest_sequence, capacity, height, width, channels, generation,
+#  slot_sequence * capacity]
+# generation is the block's own until the writer replaces the block, then the
+# replacement's.
+_HEADER_FIELDS = 6
+_GENERATION = 5
+_NO_SEQUENCE = -1
+
+
+class FrameRingBuffer:
+    """
+    Fixed number of preallocated frame slots written round-robin by a camera's
+    capture thread and read by sequence number.
+
+    Slots are allocated from the first frame and reused for every frame after
+    that, so the capture loop does not allocate per frame. read() returns a view
+    into a slot without copying; the view stays valid until capacity newer
+    frames have been written, which is_valid() reports. Readers that keep a
+    view while the writer runs should check is_valid() again when done.
+
+    With shared_memory=True the header and slots live in one
+    multiprocessing.shared_memory block, so another process can attach() by
+    name and read frames directly. A new frame shape needs a new block; the
+    writer then points the old block at the new one, and attached readers
+    follow it on their next read. In-process consumers can block in
+    wait_for_frame() instead of polling.
+    """
+
+    _capacity: int
+    _use_shared_memory: bool
+    _shared_memory: Optional[SharedMemory]
+    _base_name: str
+    _generation: int
+    _owner: bool
+    _header: np.ndarray
+    _slots: Optional[np.ndarray]
+    _new_frame: threading.Condition
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, shared_memory: bool = False):
+        if capacity < 2:
+            raise ValueError(f"capacity must be at least 2, got {capacity}")
+
+        self._capacity = capacity
+        self._use_shared_memory = shared_memory
+        self._shared_memory = None
+        self._base_name = f"frb_{secrets.token_hex(6)}"
+        self._generation = _NO_SEQUENCE
+        self._owner = True
+        self._header = _new_header(capacity)
+        self._slots = None
+        self._new_frame = threading.Condition()
+
+    @classmethod
+    def attach(cls, name: str) -> "FrameRingBuffer":
+        """Open a read-only view of a shared memory ring buffer from another process."""
+        shared_memory = SharedMemory(name=name)
+        capacity = int(np.ndarray((2,), dtype=np.int64, buffer=shared_memory.buf)[1])
+
+        buffer = cls(capacity=capacity, shared_memory=True)
+        buffer._owner = False
+        buffer._base_name = name.rpartition("_")[0]
+        buffer._map(shared_memory)
+        return buffer
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def name(self) -> Optional[str]:
+        """Name of the shared memory block, once the first frame is written."""
+        return self._shared_memory.name if self._shared_memory else None
+
+    @property
+    def latest_sequence(self) -> Optional[int]:
+        self._follow()
+        sequence = int(self._header[0])
+        return None if sequence == _NO_SEQUENCE else sequence
+
+    def write(
+        self, fill: Callable[[Optional[np.ndarray]], Optional[np.ndarray]]
+    ) -> Optional[int]:
+        """
+        Write the next frame. fill receives the destination slot (None before
+        the first frame) and returns the frame, ideally decoded into that slot.
+        A frame that is not the slot is copied in. Returns the new sequence
+        number, or None when fill returns None.
+        """
+        if not self._owner:
+            raise RuntimeError("Attached ring buffers are read-only")
+
+        sequence = int(self._header[0]) + 1
+        index = sequence % self._capacity
+        slot = self._slots[index] if self._slots is not None else None
+
+        # Invalidate the slot first so readers never trust a half-written frame.
+        with self._new_frame:
+            self._header[_HEADER_FIELDS + index] = _NO_SEQUENCE
+
+        frame = fill(slot)
+        if frame is None:
+            return None
+        if frame.dtype != np.uint8:
+            raise ValueError(f"Frames must be uint8, got {frame.dtype}")
+
+        if slot is None or frame.shape != slot.shape:
+            self._allocate(frame.shape)
+            assert self._slots is not None
+            slot = self._slots[index]
+
+        if not _is_same_buffer(frame, slot):
+            np.copyto(slot, frame)
+
+        with self._new_frame:
+            self._header[_HEADER_FIELDS + index] = sequence
+            self._header[0] = sequence
+            self._new_frame.notify_all()
+
+        return sequence
+
+    def wait_for_frame(
+        self, after: Optional[int] = None, timeout: Optional[float] = None
+    ) -> Optional[int]:
+        """
+        Block until a frame newer than sequence after is written, then return
+        the latest sequence. Returns None on timeout.
+        """
+
+        def has_newer() -> bool:
+            latest = self.latest_sequence
+            return latest is not None and (after is None or latest > after)
+
+        with self._new_frame:
+            if not self._new_frame.wait_for(has_newer, timeout=timeout):
+                return None
+            return self.latest_sequence
+
+    def read(self, sequence: int) -> Optional[np.ndarray]:
+        """View of the frame with this sequence number, or None once overwritten."""
+        self._follow()
+        if self._slots is None or not self.is_valid(sequence):
+            return None
+        return self._slots[sequence % self._capacity]
+
+    def read_latest(self) -> Optional[tuple[int, np.ndarray]]:
+        sequence = self.latest_sequence
+        if sequence is None:
+            return None
+        frame = self.read(sequence)
+        return (sequence, frame) if frame is not None else None
+
+    def is_valid(self, sequence: int) -> bool:
+        """True while the slot for this sequence still holds that frame."""
+        index = _HEADER_FIELDS + sequence % self._capacity
+        return sequence >= 0 and int(self._header[index]) == sequence
+
+    def clear(self) -> None:
+        """Drop every frame. Sequence numbers keep counting up from where they were."""
+        with self._new_frame:
+            self._header[_HEADER_FIELDS:] = _NO_SEQUENCE
+
+    def close(self) -> None:
+        self._slots = None
+        self._header = _new_header(self._capacity)
+        if self._shared_memory is not None:
+            _release(self._shared_memory, unlink=self._owner)
+            self._shared_memory = None
+
+    def _allocate(self, shape: tuple[int, ...]) -> None:
+        """(Re)allocate every slot for a new frame shape; old frames are dropped."""
+        latest_sequence = int(self._header[0])
+        height, width = shape[0], shape[1]
+        channels = shape[2] if len(shape) > 2 else 1
+
+        if not self._use_shared_memory:
+            self._slots = np.empty((self._capacity, *shape), dtype=np.uint8)
+            self._header[1:_GENERATION] = [self._capacity, height, width, channels]
+        else:
+            generation = self._generation + 1
+            header_size = _header_nbytes(self._capacity)
+            shared_memory = SharedMemory(
+                name=_block_name(self._base_name, generation),
+                create=True,
+                size=header_size + self._capacity * height * width * channels,
+            )
+            old_shared_memory = self._shared_memory
+            old_header = self._header
+            self._header = np.ndarray(
+                (_HEADER_FIELDS + self._capacity,),
+                dtype=np.int64,
+                buffer=shared_memory.buf,
+            )
+            self._header[:_HEADER_FIELDS] = [
+                _NO_SEQUENCE,
+                self._capacity,
+                height,
+                width,
+                channels,
+                generation,
+            ]
+            self._map(shared_memory)
+            if old_shared_memory is not None:
+                # Readers still mapping the old block see its frames go and
+                # the generation to follow.
+                old_header[_HEADER_FIELDS:] = _NO_SEQUENCE
+                old_header[_GENERATION] = generation
+                _release(old_shared_memory, unlink=True)
+
+        self._header[_HEADER_FIELDS:] = _NO_SEQUENCE
+        self._header[0] = latest_sequence
+
+    def _follow(self) -> None:
+        """Move an attached reader onto the block that replaced its own, if any."""
+        if self._owner or self._shared_memory is None:
+            return
+
+        generation = int(self._header[_GENERATION])
+        if generation == self._generation:
+            return
+
+        try:
+            shared_memory = SharedMemory(name=_block_name(self._base_name, generation))
+        except FileNotFoundError:
+            raise RuntimeError(
+                f"Ring buffer {self._base_name} was reallocated more than once "
+                "since the last read; attach() to its current name again"
+            ) from None
+
+        old_shared_memory = self._shared_memory
+        self._map(shared_memory)
+        _release(old_shared_memory, unlink=False)
+
+    def _map(self, shared_memory: SharedMemory) -> None:
+        self._shared_memory = shared_memory
+        self._header = np.ndarray(
+            (_HEADER_FIELDS + self._capacity,),
+            dtype=np.int64,
+            buffer=shared_memory.buf,
+        )
+        self._generation = int(self._header[_GENERATION])
+        height, width, channels = (int(v) for v in self._header[2:_GENERATION])
+        shape = (height, width) if channels == 1 else (height, width, channels)
+        self._slots = np.ndarray(
+            (self._capacity, *shape),
+            dtype=np.uint8,
+            buffer=shared_memory.buf,
+            offset=_header_nbytes(self._capacity),
+        )
+
+
+def _release(shared_memory: SharedMemory, unlink: bool) -> None:
+    if unlink:
+        shared_memory.unlink()
+    try:
+        shared_memory.close()
+    except BufferError:
+        # A reader still holds a view; the mapping is freed once it is dropped.
+        pass
+
+
+def _block_name(base_name: str, generation: int) -> str:
+    return f"{base_name}_{generation}"
+
+
+def _is_same_buffer(frame: np.ndarray, slot: np.ndarray) -> bool:
+    """OpenCV returns a new array object even when it decoded into the slot."""
+    return (
+        frame.__array_interface__["data"][0] == slot.__array_interface__["data"][0]
+        and frame.strides == slot.strides
+    )
+
+
+def _new_header(capacity: int) -> np.ndarray:
+    header = np.full(_HEADER_FIELDS + capacity, _NO_SEQUENCE, dtype=np.int64)
+    header[1] = capacity
+    return header
+
+
+def _header_nbytes(capacity: int) -> int:
+    """Header size rounded up to a cache line so slots start aligned."""
+    nbytes = (_HEADER_FIELDS + capacity) * np.dtype(np.int64).itemsize
+    return -(-nbytes // 64) * 64
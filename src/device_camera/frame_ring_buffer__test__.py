@@ -0,0 +1,112 @@
+import threading
+import numpy as np
+from src.device_camera.frame_ring_buffer import FrameRingBuffer
+
+
+def _frame(value: int) -> np.ndarray:
+    return np.full((4, 6, 3), value, dtype=np.uint8)
+
+
+def test_slots_are_reused_and_read_without_copy() -> None:
+    frames = FrameRingBuffer(capacity=2)
+
+    first = frames.write(lambda slot: _frame(1))
+    assert first == 0
+
+    slot_seen: list = []
+
+    def fill_in_place(slot):
+        slot_seen.append(slot)
+        slot[...] = 2
+        return slot
+
+    second = frames.write(fill_in_place)
+    assert second == 1
+    assert slot_seen[0] is not None
+
+    view = frames.read(1)
+    assert view is not None
+    assert np.shares_memory(view, slot_seen[0])
+    assert int(view[0, 0, 0]) == 2
+
+
+def test_overwritten_sequence_is_no_longer_valid() -> None:
+    frames = FrameRingBuffer(capacity=2)
+
+    for value in range(3):
+        frames.write(lambda slot, value=value: _frame(value))
+
+    assert frames.latest_sequence == 2
+    assert not frames.is_valid(0)
+    assert frames.read(0) is None
+
+    latest = frames.read_latest()
+    assert latest is not None
+    assert latest[0] == 2
+    assert int(latest[1][0, 0, 0]) == 2
+
+
+def test_failed_fill_keeps_latest_frame() -> None:
+    frames = FrameRingBuffer(capacity=3)
+
+    frames.write(lambda slot: _frame(5))
+    assert frames.write(lambda slot: None) is None
+
+    assert frames.latest_sequence == 0
+
+
+def test_shared_memory_reader_sees_writes() -> None:
+    frames = FrameRingBuffer(capacity=2, shared_memory=True)
+    frames.write(lambda slot: _frame(7))
+
+    assert frames.name is not None
+    reader = FrameRingBuffer.attach(frames.name)
+
+    try:
+        latest = reader.read_latest()
+        assert latest is not None
+        assert latest[0] == 0
+        assert int(latest[1][0, 0, 0]) == 7
+
+        frames.write(lambda slot: _frame(8))
+        assert reader.latest_sequence == 1
+        del latest
+    finally:
+        reader.close()
+        frames.close()
+
+
+def test_wait_for_frame_wakes_on_write() -> None:
+    frames = FrameRingBuffer(capacity=2)
+    frames.write(lambda slot: _frame(1))
+
+    assert frames.wait_for_frame(after=0, timeout=0.01) is None
+
+    writer = threading.Timer(0.01, lambda: frames.write(lambda slot: _frame(2)))
+    writer.start()
+
+    assert frames.wait_for_frame(after=0, timeout=1) == 1
+    writer.join()
+
+
+def test_shared_memory_reader_follows_a_new_frame_shape() -> None:
+    frames = FrameRingBuffer(capacity=2, shared_memory=True)
+    frames.write(lambda slot: _frame(7))
+
+    assert frames.name is not None
+    reader = FrameRingBuffer.attach(frames.name)
+
+    try:
+        frames.write(lambda slot: np.full((8, 10, 3), 9, dtype=np.uint8))
+        assert reader.read(0) is None
+
+        latest = reader.read_latest()
+        assert latest is not None
+        assert latest[0] == 1
+        assert latest[1].shape == (8, 10, 3)
+        assert int(latest[1][0, 0, 0]) == 9
+        assert reader.name == frames.name
+        del latest
+    finally:
+        reader.close()
+        frames.close()
@@ -10,17 +10,17 @@ from .interface import DeviceCamera
 from .event import EventCamera, EventCameraConnected, EventCameraDisconnected
 
 IMAGES = [
-    Image.from_file(assets_dir("images/empty_security_footage/1.jpeg")),
-    Image.from_file(assets_dir("images/empty_security_footage/2.jpeg")),
-    Image.from_file(assets_dir("images/empty_security_footage/3.jpeg")),
+    Image.from_file(assets_dir("images/empty_security_footage/1.jpeg"), lazy=True),
+    Image.from_file(assets_dir("images/empty_security_footage/2.jpeg"), lazy=True),
+    Image.from_file(assets_dir("images/empty_security_footage/3.jpeg"), lazy=True),
     #
-    Image.from_file(assets_dir("images/dog_security_footage/1.jpeg")),
-    Image.from_file(assets_dir("images/dog_security_footage/2.jpeg")),
-    Image.from_file(assets_dir("images/dog_security_footage/3.jpeg")),
+    Image.from_file(assets_dir("images/dog_security_footage/1.jpeg"), lazy=True),
+    Image.from_file(assets_dir("images/dog_security_footage/2.jpeg"), lazy=True),
+    Image.from_file(assets_dir("images/dog_security_footage/3.jpeg"), lazy=True),
     #
-    Image.from_file(assets_dir("images/cat_security_footage/1.jpeg")),
-    Image.from_file(assets_dir("images/cat_security_footage/2.jpeg")),
-    Image.from_file(assets_dir("images/cat_security_footage/3.jpeg")),
+    Image.from_file(assets_dir("images/cat_security_footage/1.jpeg"), lazy=True),
+    Image.from_file(assets_dir("images/cat_security_footage/2.jpeg"), lazy=True),
+    Image.from_file(assets_dir("images/cat_security_footage/3.jpeg"), lazy=True),
 ]
 
 
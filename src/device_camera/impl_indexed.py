@@ -1,10 +1,13 @@
 import cv2  # type: ignore
+import numpy as np
 import threading
 from logging import Logger
 from typing import List, Optional, Iterator
 from itertools import cycle
+from src.image.channel_order import ChannelOrder
 from src.image.image import Image
 from src.library.pub_sub import PubSub, Sub
+from .frame_ring_buffer import FrameRingBuffer
 from .interface import DeviceCamera
 from .event import (
     EventCamera,
@@ -19,23 +22,44 @@ class IndexedDeviceCamera(DeviceCamera):
     _device_id_cycle: Iterator[int]
     _pub_sub: PubSub[EventCamera]
     _lock: threading.Lock
+    _cap_lock: threading.Lock
     _cap: Optional[cv2.VideoCapture]
-    _latest_frame: Optional[cv2.typing.MatLike]
+    _frames: FrameRingBuffer
     _connected: bool
     _frame_thread: Optional[threading.Thread]
     _running: bool
+    _grab_only: bool
+    _grab_sequence: int
+    _captured: Optional[tuple[int, Image]]
 
-    def __init__(self, logger: Logger, device_ids: List[int]):
+    def __init__(
+        self,
+        logger: Logger,
+        device_ids: List[int],
+        frames: Optional[FrameRingBuffer] = None,
+        grab_only: bool = True,
+    ):
+        """
+        Args:
+            grab_only: Only grab() in the background loop, which keeps the
+                       camera's queue drained without decoding, and decode the
+                       newest grabbed frame when capture() is called.
+        """
         self._logger = logger.getChild("indexed_device_camera")
         self._device_ids = device_ids
         self._device_id_cycle = cycle(device_ids)
         self._pub_sub = PubSub[EventCamera]()
         self._lock = threading.Lock()
+        # Guards I/O on the capture; always taken before _lock.
+        self._cap_lock = threading.Lock()
         self._cap = None
-        self._latest_frame = None
+        self._frames = frames if frames is not None else FrameRingBuffer()
         self._connected = False
         self._frame_thread = None
         self._running = False
+        self._grab_only = grab_only
+        self._grab_sequence = 0
+        self._captured = None
         self._logger.info(f"Initialized for camera IDs: {device_ids}")
 
     def start(self) -> None:
@@ -83,10 +107,12 @@ class IndexedDeviceCamera(DeviceCamera):
             else:
                 consecutive_failures = 0  # Reset counter on successful frame
 
-            threading.Event().wait(0.03)  # ~30 FPS
+            # grab() blocks until the camera's next frame, so it paces itself
+            if not self._grab_only:
+                threading.Event().wait(0.03)  # ~30 FPS
 
     def _cleanup_camera(self) -> None:
-        with self._lock:
+        with self._cap_lock, self._lock:
             self._release_capture()
             self._reset_frame()
             self._handle_disconnection()
@@ -103,7 +129,8 @@ class IndexedDeviceCamera(DeviceCamera):
         self._cap = None
 
     def _reset_frame(self) -> None:
-        self._latest_frame = None
+        self._frames.clear()
+        self._captured = None
 
     def _handle_disconnection(self) -> None:
         if not self._connected:
@@ -114,13 +141,57 @@ class IndexedDeviceCamera(DeviceCamera):
         self._logger.info("Camera disconnection event published")
 
     def capture(self) -> List[Image]:
+        if self._grab_only:
+            return self._capture_grabbed()
+
         with self._lock:
-            if not self._connected or self._latest_frame is None:
+            latest = self._frames.read_latest() if self._connected else None
+            if latest is None:
                 self._logger.debug("No frame available for capture")
                 return []
-            # Convert color space BGR (OpenCV default) to RGB
-            frame_rgb = cv2.cvtColor(self._latest_frame, cv2.COLOR_BGR2RGB)
-            return [Image.from_np_array(frame_rgb)]
+            # Copy out of the ring buffer slot, which is reused for later frames.
+            # Keep OpenCV's BGR order; consumers convert only if they need to
+            _, frame = latest
+            return [Image.from_np_array(frame.copy(), channel_order=ChannelOrder.BGR)]
+
+    def _capture_grabbed(self) -> List[Image]:
+        """
+        Decode the newest grabbed frame, once per grab. Repeated captures of the
+        same frame return the same Image, so its cached conversions are reused.
+        """
+        with self._lock:
+            if not self._connected:
+                self._logger.debug("No frame available for capture")
+                return []
+            if self._captured is not None and self._captured[0] == self._grab_sequence:
+                return [self._captured[1]]
+
+        with self._cap_lock:
+            if not self._cap:
+                return []
+            grab_sequence = self._grab_sequence
+            cap = self._cap
+            sequence = self._frames.write(lambda slot: _retrieve_into(cap, slot))
+
+        if sequence is None:
+            self._logger.warning("Failed to retrieve grabbed frame")
+            return []
+
+        frame = self._frames.read(sequence)
+        if frame is None:
+            return []
+
+        # Copy out of the ring buffer slot, which is reused for later frames.
+        # Keep OpenCV's BGR order; consumers convert only if they need to
+        image = Image.from_np_array(frame.copy(), channel_order=ChannelOrder.BGR)
+
+        with self._lock:
+            self._captured = (grab_sequence, image)
+
+        return [image]
+
+    def frames(self) -> FrameRingBuffer:
+        return self._frames
 
     def events(self) -> PubSub[EventCamera]:
         return self._pub_sub
@@ -151,7 +222,7 @@ class IndexedDeviceCamera(DeviceCamera):
 
             with self._lock:
                 self._cap = cap
-                self._latest_frame = test_frame  # Store the test frame
+                self._frames.write(lambda _: test_frame)  # Store the test frame
                 self._connected = True
                 self._publish_event(EventCameraConnected())
             self._logger.info(f"Successfully connected to camera {device_id}")
@@ -161,7 +232,7 @@ class IndexedDeviceCamera(DeviceCamera):
             return False
 
     def _handle_connection_failure(self) -> None:
-        with self._lock:
+        with self._cap_lock, self._lock:
             if self._cap:
                 try:
                     self._cap.release()
@@ -175,7 +246,7 @@ class IndexedDeviceCamera(DeviceCamera):
                 self._logger.info(
                     "Camera disconnection event published due to connection failure"
                 )
-            self._latest_frame = None
+            self._reset_frame()
 
     def _publish_event(self, event: EventCamera) -> None:
         try:
@@ -186,19 +257,53 @@ class IndexedDeviceCamera(DeviceCamera):
     def _get_next_device_id(self) -> int:
         return next(self._device_id_cycle)
 
+    def _read_into(self, slot: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """Decode the next frame, straight into the ring buffer slot when sizes match."""
+        assert self._cap is not None
+        ret, frame = self._cap.read(slot) if slot is not None else self._cap.read()
+        return frame if ret else None
+
     def _process_frames(self) -> bool:
+        if self._grab_only:
+            return self._grab_frame()
+
         with self._lock:
             if not self._cap:
                 return False
 
             try:
-                ret, frame = self._cap.read()
-                if not ret or frame is None:
+                sequence = self._frames.write(self._read_into)
+                if sequence is None:
                     self._logger.warning("Failed to read frame from camera")
                     return False
 
-                self._latest_frame = frame
                 return True
             except Exception as e:
                 self._logger.error(f"Error reading frame: {e}")
                 return False
+
+    def _grab_frame(self) -> bool:
+        """Advance to the next frame without decoding it."""
+        with self._cap_lock:
+            if not self._cap:
+                return False
+
+            try:
+                if not self._cap.grab():
+                    self._logger.warning("Failed to grab frame from camera")
+                    return False
+            except Exception as e:
+                self._logger.error(f"Error grabbing frame: {e}")
+                return False
+
+            with self._lock:
+                self._grab_sequence += 1
+            return True
+
+
+def _retrieve_into(
+    cap: cv2.VideoCapture, slot: Optional[np.ndarray]
+) -> Optional[np.ndarray]:
+    """Decode the grabbed frame, straight into the ring buffer slot when sizes match."""
+    ret, frame = cap.retrieve(slot) if slot is not None else cap.retrieve()
+    return frame if ret else None
@@ -0,0 +1,49 @@
+import logging
+import numpy as np
+from src.device_camera.impl_indexed import IndexedDeviceCamera
+
+
+class _CountingCapture:
+    def __init__(self) -> None:
+        self.grabs = 0
+        self.retrieves = 0
+
+    def grab(self) -> bool:
+        self.grabs += 1
+        return True
+
+    def retrieve(self, image=None):
+        self.retrieves += 1
+        return True, np.full((4, 6, 3), self.grabs, dtype=np.uint8)
+
+    def release(self) -> None:
+        pass
+
+
+def _connected_camera(cap: _CountingCapture) -> IndexedDeviceCamera:
+    camera = IndexedDeviceCamera(logger=logging.getLogger("test"), device_ids=[0])
+    camera._cap = cap  # type: ignore[assignment]
+    camera._connected = True
+    return camera
+
+
+def test_grab_only_decodes_once_per_grabbed_frame() -> None:
+    cap = _CountingCapture()
+    camera = _connected_camera(cap)
+
+    for _ in range(5):
+        assert camera._process_frames()
+
+    first = camera.capture()
+    second = camera.capture()
+
+    assert cap.grabs == 5
+    assert cap.retrieves == 1
+    assert first[0] is second[0]
+    assert int(first[0].np_array[0, 0, 0]) == 5
+
+    camera._process_frames()
+    third = camera.capture()
+
+    assert cap.retrieves == 2
+    assert int(third[0].np_array[0, 0, 0]) == 6
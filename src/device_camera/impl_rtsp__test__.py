@@ -0,0 +1,140 @@
+import logging
+import threading
+import time
+from pathlib import Path
+import cv2  # type: ignore
+import numpy as np
+from src.device_camera.impl_rtsp import (
+    MAX_DROPPED_FRAMES,
+    RtspDecoderOptions,
+    RtspDeviceCamera,
+)
+
+
+class _BackloggedCapture:
+    """
+    Live frames carry the current stream time; the backlog's frames are a
+    second behind it.
+    """
+
+    def __init__(self, backlog: int, timestamps: bool = True) -> None:
+        self.backlog = backlog
+        self.grabs = 0
+        self._timestamps = timestamps
+        self._started_at = time.monotonic() - 10
+        self._position_msec = 0.0
+
+    def grab(self) -> bool:
+        self.grabs += 1
+        live_msec = (time.monotonic() - self._started_at) * 1000
+        if self.backlog > 0:
+            self.backlog -= 1
+            self._position_msec = live_msec - 1000
+        else:
+            self._position_msec = live_msec
+        return True
+
+    def get(self, prop: int) -> float:
+        assert prop == cv2.CAP_PROP_POS_MSEC
+        return self._position_msec if self._timestamps else 0.0
+
+
+def _camera() -> RtspDeviceCamera:
+    return RtspDeviceCamera(
+        logger=logging.getLogger("test"), rtsp_url="rtsp://localhost/test"
+    )
+
+
+def test_backlogged_frames_are_grabbed_but_not_retrieved() -> None:
+    camera = _camera()
+    cap = _BackloggedCapture(backlog=0)
+    assert camera._grab_newest(cap)  # type: ignore[arg-type]
+    assert cap.grabs == 1
+
+    # Even when each grab takes as long as a live frame, the backlog drains.
+    cap.backlog = 3
+    assert camera._grab_newest(cap)  # type: ignore[arg-type]
+
+    assert cap.grabs == 1 + 4
+
+
+def test_frames_without_timestamps_count_as_live() -> None:
+    cap = _BackloggedCapture(backlog=3, timestamps=False)
+
+    assert _camera()._grab_newest(cap)  # type: ignore[arg-type]
+
+    assert cap.grabs == 1
+
+
+def test_dropping_is_bounded() -> None:
+    camera = _camera()
+    cap = _BackloggedCapture(backlog=0)
+    assert camera._grab_newest(cap)  # type: ignore[arg-type]
+
+    cap.backlog = 1000
+    assert camera._grab_newest(cap)  # type: ignore[arg-type]
+
+    assert cap.grabs == 1 + MAX_DROPPED_FRAMES + 1
+
+
+def test_stop_leaves_the_capture_to_a_busy_polling_thread() -> None:
+    camera = _camera()
+    release = threading.Event()
+    released: list[bool] = []
+
+    class _Capture:
+        def release(self) -> None:
+            released.append(True)
+
+    def busy_polling_thread() -> None:
+        release.wait()
+        with camera._lock:
+            camera._release_capture()
+
+    camera._connection_timeout = 0.0
+    camera._cap = _Capture()  # type: ignore[assignment]
+    camera._frame_polling_thread = threading.Thread(target=busy_polling_thread)
+    camera._frame_polling_thread.start()
+
+    camera.stop()
+    assert released == []
+
+    release.set()
+    camera._frame_polling_thread.join()
+    assert released == [True]
+
+
+def test_decoder_options_to_ffmpeg_options() -> None:
+    options = RtspDecoderOptions(threads=2, low_latency=True, transport="tcp")
+
+    assert options.to_ffmpeg_options() == (
+        "rtsp_transport;tcp|threads;2|fflags;nobuffer|flags;low_delay"
+    )
+
+
+def test_substream_is_captured_and_downscaled_after_decode(tmp_path: Path) -> None:
+    substream = str(tmp_path / "sub.avi")
+    writer = cv2.VideoWriter(substream, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+    for _ in range(MAX_DROPPED_FRAMES):
+        writer.write(np.full((48, 64, 3), 128, dtype=np.uint8))
+    writer.release()
+
+    camera = RtspDeviceCamera(
+        logger=logging.getLogger("test"),
+        rtsp_url="rtsp://localhost/main",
+        substream_url=substream,
+        decoder_options=RtspDecoderOptions(transport=None, downscale_width=32),
+    )
+
+    assert camera.recording_url == "rtsp://localhost/main"
+    assert camera.capture_url == substream
+
+    assert camera._attempt_connection()
+    try:
+        assert camera._process_frames()
+        images = camera.capture()
+    finally:
+        camera.stop()
+
+    assert len(images) == 1
+    assert (images[0].width, images[0].height) == (32, 24)
@@ -1,23 +1,29 @@
 from src.image.image import Image
 from src.library.pub_sub import PubSub, Sub
+from src.library.scheduler import Scheduler, Timer, default_scheduler
 from .event import EventCamera, EventCameraConnected, EventCameraDisconnected
+from .frame_ring_buffer import FrameRingBuffer
 from .interface import DeviceCamera
 from src.library.wyze_sdk.wyze_client import WyzeClient, WyzeDevice
 import threading
-import time
+import numpy as np
+from datetime import timedelta
 from logging import Logger
 from typing import Optional, Union
 
+CAPTURE_INTERVAL = timedelta(seconds=0.1)  # 10 FPS
+
 
 class WyzeSdkCamera(DeviceCamera):
     _logger: Logger
     _wyze_client: WyzeClient
     _wyze_device: WyzeDevice
     _pub_sub: PubSub[EventCamera]
-    _capture_thread: Optional[threading.Thread]
+    _scheduler: Scheduler
+    _capture_timer: Optional[Timer]
     _running: bool
     _lock: threading.Lock
-    _latest_frame: Optional[Image]
+    _frames: FrameRingBuffer
     _connected: bool
 
     def __init__(
@@ -25,15 +31,18 @@ class WyzeSdkCamera(DeviceCamera):
         logger: Logger,
         wyze_client: WyzeClient,
         wyze_device: WyzeDevice,
+        frames: Optional[FrameRingBuffer] = None,
+        scheduler: Optional[Scheduler] = None,
     ):
         self._logger = logger.getChild("wyze_device_camera")
         self._wyze_device = wyze_device
         self._wyze_client = wyze_client
         self._pub_sub = PubSub[EventCamera]()
-        self._capture_thread = None
+        self._scheduler = scheduler if scheduler is not None else default_scheduler()
+        self._capture_timer = None
         self._running = False
         self._lock = threading.Lock()
-        self._latest_frame = None
+        self._frames = frames if frames is not None else FrameRingBuffer()
         self._connected = False
 
         self._log_list_cameras()
@@ -61,9 +70,12 @@ class WyzeSdkCamera(DeviceCamera):
             return
 
         self._running = True
-        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
-        self._capture_thread.start()
-        self._logger.info("Capture thread started.")
+        # The SDK call blocks, so it runs off the scheduler thread; a capture
+        # still in flight makes the next one skip.
+        self._capture_timer = self._scheduler.call_every(
+            CAPTURE_INTERVAL, self._capture_once, blocking=True
+        )
+        self._logger.info("Capture timer started.")
 
     def stop(self) -> None:
         self._logger.info("Stopping WyzeSdkCamera...")
@@ -72,11 +84,9 @@ class WyzeSdkCamera(DeviceCamera):
             return
 
         self._running = False
-        if self._capture_thread:
-            self._capture_thread.join(timeout=5.0)
-            if self._capture_thread.is_alive():
-                self._logger.warning("Capture thread did not exit cleanly.")
-            self._capture_thread = None
+        if self._capture_timer is not None:
+            self._capture_timer()
+            self._capture_timer = None
 
     def is_connected(self) -> bool:
         with self._lock:
@@ -103,7 +113,7 @@ class WyzeSdkCamera(DeviceCamera):
             if self._connected:
                 self._connected = False
                 self._pub_sub.publish(EventCameraDisconnected())
-            self._latest_frame = None
+            self._frames.clear()
 
     def _process_frames(self) -> None:
         try:
@@ -113,9 +123,9 @@ class WyzeSdkCamera(DeviceCamera):
             )
 
             if response and response.data:
-                frame = Image.from_np_array(response.data)
+                frame = np.asarray(response.data)
                 with self._lock:
-                    self._latest_frame = frame
+                    self._frames.write(lambda _: frame)
                     if not self._connected:
                         self._connected = True
                         self._pub_sub.publish(EventCameraConnected())
@@ -125,20 +135,24 @@ class WyzeSdkCamera(DeviceCamera):
             self._logger.error(f"Error capturing frame: {e}")
             self._handle_connection_failure()
 
-    def _capture_loop(self) -> None:
-        while self._running:
-            if not self.is_connected():
-                if not self._attempt_connection():
-                    continue
+    def _capture_once(self) -> None:
+        if not self.is_connected():
+            if not self._attempt_connection():
+                return
 
-            self._process_frames()
-            time.sleep(0.1)  # 10 FPS
+        self._process_frames()
 
     def capture(self) -> list[Image]:
         with self._lock:
-            if self._latest_frame is None:
+            latest = self._frames.read_latest()
+            if latest is None:
                 return []
-            return [self._latest_frame]
+            # Copy out of the ring buffer slot, which is reused for later frames.
+            _, frame = latest
+            return [Image.from_np_array(frame.copy())]
+
+    def frames(self) -> FrameRingBuffer:
+        return self._frames
 
     def events(self) -> PubSub[EventCamera]:
         return self._pub_sub
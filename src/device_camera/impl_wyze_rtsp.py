@@ -1,10 +1,12 @@
 import logging
 import time
+from typing import Optional
 from src.image.image import Image
 from src.library.pub_sub import PubSub
 from .event import EventCamera
+from .frame_ring_buffer import FrameRingBuffer
 from .interface import DeviceCamera
-from .impl_rtsp import RtspDeviceCamera
+from .impl_rtsp import RtspDecoderOptions, RtspDeviceCamera
 from src.library.docker_wyze_bridge import DockerWyzeBridge
 from src.library.wyze_sdk.wyze_client import WyzeClient, WyzeDevice
 
@@ -23,6 +25,8 @@ class WyzeRtspDeviceCamera(DeviceCamera):
         wyze_device: WyzeDevice,
         host_ip: str,
         api_key: str,
+        use_substream: bool = False,
+        decoder_options: Optional[RtspDecoderOptions] = None,
     ):
         """
         Initialize a Wyze camera that uses RTSP via Docker Wyze Bridge.
@@ -33,6 +37,8 @@ class WyzeRtspDeviceCamera(DeviceCamera):
             wyze_device: The Wyze device to connect to
             host_ip: Host IP for the Docker Wyze Bridge
             api_key: API key for the Docker Wyze Bridge
+            use_substream: Capture from the bridge's low resolution substream
+            decoder_options: Decoder settings for the RTSP stream
         """
         self._logger = logger.getChild("wyze_rtsp_device_camera")
         self._wyze_client = wyze_client
@@ -48,7 +54,12 @@ class WyzeRtspDeviceCamera(DeviceCamera):
 
         # Create the underlying RTSP camera
         self._rtsp_camera = RtspDeviceCamera(
-            logger=self._logger, rtsp_url=self._wyze_bridge.rtsp_url
+            logger=self._logger,
+            rtsp_url=self._wyze_bridge.rtsp_url,
+            substream_url=(
+                self._wyze_bridge.rtsp_substream_url if use_substream else None
+            ),
+            decoder_options=decoder_options,
         )
 
         self._logger.info(f"Initialized WyzeRtspDeviceCamera for {wyze_device.name}")
@@ -89,6 +100,10 @@ class WyzeRtspDeviceCamera(DeviceCamera):
         """Get the event subscriber for camera events."""
         return self._rtsp_camera.events()
 
+    def frames(self) -> Optional[FrameRingBuffer]:
+        """Ring buffer the underlying RTSP camera decodes into."""
+        return self._rtsp_camera.frames()
+
     def is_connected(self) -> bool:
         """Check if the camera is currently connected."""
         return self._rtsp_camera.is_connected()
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 from src.image.image import Image
 from src.library.life_cycle import LifeCycle
 from src.library.pub_sub import PubSub
 from .event import EventCamera
+from .frame_ring_buffer import FrameRingBuffer
 
 
 class RecoverableConnectionError(Exception):
@@ -28,6 +30,10 @@ class DeviceCamera(LifeCycle, ABC):
         """Get the event subscriber for camera events."""
         pass
 
+    def frames(self) -> Optional[FrameRingBuffer]:
+        """Ring buffer of recent frames for zero-copy readers, if the camera has one."""
+        return None
+
     @abstractmethod
     def is_connected(self) -> bool:
         """Check if the camera is currently connected."""
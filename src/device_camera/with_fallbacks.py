@@ -1,3 +1,4 @@
+from src.device_camera.frame_ring_buffer import FrameRingBuffer
 from src.device_camera.interface import DeviceCamera
 from src.image.image import Image
 from src.library.pub_sub import PubSub
@@ -131,6 +132,9 @@ class WithFallbacks(DeviceCamera):
     def events(self) -> PubSub[EventCamera]:
         return self._events
 
+    def frames(self) -> Optional[FrameRingBuffer]:
+        return self._current_device.frames()
+
     def is_connected(self) -> bool:
         with self._lock:
             connected = self._connected and self._current_device.is_connected()
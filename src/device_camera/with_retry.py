@@ -1,6 +1,7 @@
 import threading
 import time
 from typing import Optional, Callable
+from src.device_camera.frame_ring_buffer import FrameRingBuffer
 from src.device_camera.interface import DeviceCamera
 from src.image.image import Image
 from src.library.pub_sub import PubSub
@@ -99,6 +100,9 @@ class WithRetry(DeviceCamera):
     def events(self) -> PubSub[EventCamera]:
         return self._wrapped.events()
 
+    def frames(self) -> Optional[FrameRingBuffer]:
+        return self._wrapped.frames()
+
     def _attempt_connection(self) -> bool:
         return self._wrapped._attempt_connection()
 
@@ -13,6 +13,7 @@ class Env:
     wyze_password: SecretString
     wyze_bridge_host_ip: str
     wyze_bridge_api_key: str
+    wyze_bridge_substream: bool
     kasa_device_ip: str
 
     @classmethod
@@ -41,6 +42,10 @@ class Env:
             os.getenv("WYZE_BRIDGE_API_KEY", "My-Custom-API-Key-For-WebUI")
         )
 
+        wyze_bridge_substream = (
+            os.getenv("WYZE_BRIDGE_SUBSTREAM", "false").lower() == "true"
+        )
+
         kasa_device_ip = _ensure_non_empty_string(os.getenv("KASA_DEVICE_IP"))
 
         env = cls(
@@ -50,6 +55,7 @@ class Env:
             wyze_password=wyze_password,
             wyze_bridge_host_ip=wyze_bridge_host_ip,
             wyze_bridge_api_key=wyze_bridge_api_key,
+            wyze_bridge_substream=wyze_bridge_substream,
             kasa_device_ip=kasa_device_ip,
         )
 
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ChannelOrder(Enum):
+    RGB = "rgb"
+    BGR = "bgr"
@@ -4,28 +4,56 @@ import io
 import base64
 from typing import Optional, Union
 import os
+from src.image.channel_order import ChannelOrder
 
 
 class Image:
-    _array: np.ndarray
+    __slots__ = (
+        "_array",
+        "_source",
+        "_draft_size",
+        "_channel_order",
+        "_path",
+        "_pil_image",
+        "_bytes",
+        "_base64",
+    )
+
+    _array: Optional[np.ndarray]
+    _source: Optional[Union[str, bytes]]
+    _draft_size: Optional[tuple[int, int]]
+    _channel_order: ChannelOrder
     _path: Optional[str]
     _pil_image: Optional[PILImage.Image]
-    _bytes: Optional[bytes]
+    _bytes: dict[tuple[str, Optional[int]], bytes]
+    _base64: dict[tuple[str, Optional[int]], str]
 
     def __init__(
         self,
         data: Optional[Union[np.ndarray, PILImage.Image, bytes]] = None,
         path: Optional[str] = None,
+        channel_order: ChannelOrder = ChannelOrder.RGB,
+        lazy: bool = False,
+        draft_size: Optional[tuple[int, int]] = None,
     ) -> None:
-        """Initialize with numpy array, PIL image, path, or bytes"""
+        """
+        Initialize with numpy array, PIL image, path, or bytes.
+
+        With lazy=True a path or encoded bytes are kept as-is and only decoded on
+        first pixel access. draft_size (width, height) lets the JPEG decoder scale
+        down while decoding, to the smallest size that is still at least that big.
+        """
         self._path = None
+        self._source = None
+        self._draft_size = draft_size
+        self._channel_order = channel_order
         if path is not None:
             self._path = path
-            self._load_from_path(path)
+            self._load_from_path(path, lazy=lazy)
         elif data is not None:
-            self._load_from_data(data)
+            self._load_from_data(data, lazy=lazy)
         else:
-            self._array = np.zeros((1, 1, 3), dtype=np.uint8)
+            self._set_array(np.zeros((1, 1, 3), dtype=np.uint8), channel_order)
 
     @classmethod
     def _validate_np_array(cls, data: np.ndarray) -> None:
@@ -39,68 +67,153 @@ class Image:
             raise ValueError(f"Expected 1, 3, or 4 channels, got {data.shape[2]}")
 
     @classmethod
-    def from_np_array(cls, data: np.ndarray) -> "Image":
+    def from_np_array(
+        cls, data: np.ndarray, channel_order: ChannelOrder = ChannelOrder.RGB
+    ) -> "Image":
+        """Wrap the array without copying it. The caller must not mutate it afterwards."""
         cls._validate_np_array(data)
-        image = cls()
-        image._array = data
-        return image
+        return cls(data=data, channel_order=channel_order)
 
     @classmethod
-    def from_file(cls, path: str) -> "Image":
-        image = cls()
-        image._path = path
-        image._load_from_path(path)
-        return image
+    def from_file(
+        cls,
+        path: str,
+        lazy: bool = False,
+        draft_size: Optional[tuple[int, int]] = None,
+    ) -> "Image":
+        return cls(path=path, lazy=lazy, draft_size=draft_size)
 
-    def _load_from_path(self, path: str) -> None:
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        lazy: bool = False,
+        draft_size: Optional[tuple[int, int]] = None,
+    ) -> "Image":
+        return cls(data=data, lazy=lazy, draft_size=draft_size)
+
+    def _load_from_path(self, path: str, lazy: bool = False) -> None:
         """Load image from file path"""
-        pil_image = PILImage.open(path)
-        self._array = np.array(pil_image)
+        self._load_from_encoded(path, lazy=lazy)
 
-    def _load_from_data(self, data: Union[np.ndarray, PILImage.Image, bytes]) -> None:
+    def _load_from_data(
+        self, data: Union[np.ndarray, PILImage.Image, bytes], lazy: bool = False
+    ) -> None:
         """Load from numpy array, PIL image, or bytes"""
         if isinstance(data, np.ndarray):
-            self._array = data
+            self._set_array(data, self._channel_order)
         elif isinstance(data, PILImage.Image):
-            self._array = np.array(data)
+            self._set_array(np.array(data), ChannelOrder.RGB)
         elif isinstance(data, bytes):
-            buffer = io.BytesIO(data)
-            pil_image = PILImage.open(buffer)
-            self._array = np.array(pil_image)
+            self._load_from_encoded(data, lazy=lazy)
         else:
             raise TypeError(f"Unsupported data type: {type(data)}")
 
+    def _load_from_encoded(self, source: Union[str, bytes], lazy: bool) -> None:
+        if lazy:
+            self._set_source(source)
+        else:
+            self._set_array(self._decode(source), ChannelOrder.RGB)
+
+    def _decode(self, source: Union[str, bytes]) -> np.ndarray:
+        pil_image = PILImage.open(
+            io.BytesIO(source) if isinstance(source, bytes) else source
+        )
+        if self._draft_size is not None:
+            # Only JPEG supports this; other formats ignore it and decode at full size
+            pil_image.draft(pil_image.mode, self._draft_size)
+        return np.array(pil_image)
+
+    def _set_source(self, source: Union[str, bytes]) -> None:
+        """Hold encoded data to be decoded on first pixel access"""
+        self._set_array(None, ChannelOrder.RGB)
+        self._source = source
+
+    def _set_array(
+        self, array: Optional[np.ndarray], channel_order: ChannelOrder
+    ) -> None:
+        """Replace the pixel data and drop every representation derived from it"""
+        self._array = array
+        self._source = None
+        self._channel_order = channel_order
+        self._pil_image = None
+        self._bytes = {}
+        self._base64 = {}
+
+    def _ensure_decoded(self) -> np.ndarray:
+        array = self._array
+        if array is None:
+            source = self._source
+            if source is None:
+                raise ValueError("Image has neither pixel data nor a source to decode")
+            array = self._decode(source)
+            self._set_array(array, ChannelOrder.RGB)
+        return array
+
     @property
-    def np_array(self) -> np.ndarray:
-        """Get numpy array representation"""
-        return self._array
+    def is_decoded(self) -> bool:
+        return self._array is not None
 
     @property
-    def pil_image(self) -> PILImage.Image:
-        """Get PIL image representation"""
-        return PILImage.fromarray(self._array)
+    def np_array(self) -> np.ndarray:
+        """Get numpy array representation in its stored channel order"""
+        return self._ensure_decoded()
 
-    def to_bytes(self, format: str = "JPEG") -> bytes:
-        """Convert to bytes with specified format"""
-        buffer = io.BytesIO()
-        self.pil_image.save(buffer, format=format)
-        return buffer.getvalue()
+    @property
+    def channel_order(self) -> ChannelOrder:
+        return self._channel_order
+
+    def to_np_array(self, channel_order: ChannelOrder) -> np.ndarray:
+        """Get numpy array in the given channel order, as a view when possible"""
+        array = self._ensure_decoded()
+        if channel_order == self._channel_order or self.channels < 3:
+            return array
+        if self.channels == 3:
+            return array[:, :, ::-1]
+        return array[:, :, [2, 1, 0, 3]]
 
-    def to_base64(self, format: str = "JPEG") -> str:
-        """Convert to base64 string"""
-        return base64.b64encode(self.to_bytes(format)).decode("utf-8")
+    @property
+    def pil_image(self) -> PILImage.Image:
+        """Get PIL image representation, built once and shared. Do not mutate it."""
+        if self._pil_image is None:
+            self._pil_image = PILImage.fromarray(self.to_np_array(ChannelOrder.RGB))
+        return self._pil_image
+
+    def to_bytes(self, format: str = "JPEG", quality: Optional[int] = None) -> bytes:
+        """Convert to bytes with specified format, cached per format and quality"""
+        key = (format, quality)
+        encoded = self._bytes.get(key)
+        if encoded is None:
+            buffer = io.BytesIO()
+            if quality is None:
+                self.pil_image.save(buffer, format=format)
+            else:
+                self.pil_image.save(buffer, format=format, quality=quality)
+            encoded = buffer.getvalue()
+            self._bytes[key] = encoded
+        return encoded
+
+    def to_base64(self, format: str = "JPEG", quality: Optional[int] = None) -> str:
+        """Convert to base64 string, cached per format and quality"""
+        key = (format, quality)
+        encoded = self._base64.get(key)
+        if encoded is None:
+            encoded = base64.b64encode(self.to_bytes(format, quality)).decode("utf-8")
+            self._base64[key] = encoded
+        return encoded
 
     @property
     def width(self) -> int:
-        return self._array.shape[1]
+        return self._ensure_decoded().shape[1]
 
     @property
     def height(self) -> int:
-        return self._array.shape[0]
+        return self._ensure_decoded().shape[0]
 
     @property
     def channels(self) -> int:
-        return self._array.shape[2] if len(self._array.shape) > 2 else 1
+        shape = self._ensure_decoded().shape
+        return shape[2] if len(shape) > 2 else 1
 
     @property
     def filename(self) -> Optional[str]:
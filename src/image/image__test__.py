@@ -0,0 +1,71 @@
+import numpy as np
+from src.assets import assets_dir
+from src.image.channel_order import ChannelOrder
+from src.image.image import Image
+
+
+def test_from_np_array_does_not_copy() -> None:
+    array = np.zeros((2, 3, 3), dtype=np.uint8)
+
+    image = Image.from_np_array(array, channel_order=ChannelOrder.BGR)
+
+    assert image.np_array is array
+    assert image.channel_order == ChannelOrder.BGR
+
+
+def test_to_np_array_reorders_channels_as_view() -> None:
+    array = np.array([[[1, 2, 3]]], dtype=np.uint8)
+    image = Image.from_np_array(array, channel_order=ChannelOrder.BGR)
+
+    rgb = image.to_np_array(ChannelOrder.RGB)
+
+    assert rgb.tolist() == [[[3, 2, 1]]]
+    assert np.shares_memory(rgb, array)
+    assert image.to_np_array(ChannelOrder.BGR) is array
+
+
+def test_pil_image_is_rgb_for_bgr_frames() -> None:
+    array = np.array([[[0, 0, 255]]], dtype=np.uint8)
+    image = Image.from_np_array(array, channel_order=ChannelOrder.BGR)
+
+    assert image.pil_image.getpixel((0, 0)) == (255, 0, 0)
+
+
+def test_representations_are_cached() -> None:
+    image = Image.from_np_array(np.zeros((8, 8, 3), dtype=np.uint8))
+
+    assert image.pil_image is image.pil_image
+    assert image.to_bytes() is image.to_bytes()
+    assert image.to_base64() is image.to_base64()
+    assert image.to_bytes(quality=10) is not image.to_bytes(quality=90)
+
+
+def test_image_uses_slots() -> None:
+    image = Image()
+
+    assert not hasattr(image, "__dict__")
+
+
+def test_lazy_file_decodes_on_first_pixel_access() -> None:
+    image = Image.from_file(
+        assets_dir("images/dog_clear_front/1.jpeg"),
+        lazy=True,
+    )
+
+    assert not image.is_decoded
+    assert image.filename == "1.jpeg"
+
+    eager = Image.from_file(assets_dir("images/dog_clear_front/1.jpeg"))
+
+    assert image.np_array.shape == eager.np_array.shape
+    assert image.is_decoded
+
+
+def test_draft_size_decodes_jpeg_at_reduced_size() -> None:
+    eager = Image.from_file(assets_dir("images/dog_clear_front/1.jpeg"))
+    target = (eager.width // 4, eager.height // 4)
+
+    image = Image.from_bytes(eager.to_bytes(), lazy=True, draft_size=target)
+
+    assert target[0] <= image.width < eager.width
+    assert target[1] <= image.height < eager.height
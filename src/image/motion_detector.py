@@ -0,0 +1,92 @@
+import cv2  # type: ignore
+import numpy as np
+import threading
+from typing import Optional
+from src.image.image import Image
+
+
+class MotionDetector:
+    """
+    Cheap frame-difference motion check.
+
+    Frames are shrunk to a small grayscale thumbnail and compared pixel by pixel.
+    The thumbnail of the reference frame is kept, so comparing many frames
+    against the same reference only shrinks the reference once. Safe to call
+    from several effect workers at once.
+    """
+
+    _reference: Optional[Image]
+    _reference_thumbnail: Optional[np.ndarray]
+    _lock: threading.Lock
+
+    def __init__(self) -> None:
+        self._reference = None
+        self._reference_thumbnail = None
+        self._lock = threading.Lock()
+
+    def changed_ratio(
+        self,
+        images: list[Image],
+        references: list[Image],
+        thumbnail_width: int,
+        pixel_threshold: int,
+    ) -> Optional[float]:
+        """
+        Fraction of thumbnail pixels whose brightness changed by more than
+        pixel_threshold, taking the largest over all image pairs. None when the
+        frames cannot be compared.
+        """
+        if not images or len(images) != len(references):
+            return None
+
+        ratios = [
+            self._changed_ratio(
+                image=image,
+                reference=reference,
+                thumbnail_width=thumbnail_width,
+                pixel_threshold=pixel_threshold,
+            )
+            for image, reference in zip(images, references)
+        ]
+
+        if any(ratio is None for ratio in ratios):
+            return None
+
+        return max(ratio for ratio in ratios if ratio is not None)
+
+    def _changed_ratio(
+        self,
+        image: Image,
+        reference: Image,
+        thumbnail_width: int,
+        pixel_threshold: int,
+    ) -> Optional[float]:
+        thumbnail = to_thumbnail(image, thumbnail_width)
+        reference_thumbnail = self._to_reference_thumbnail(reference, thumbnail_width)
+
+        if thumbnail.shape != reference_thumbnail.shape:
+            return None
+
+        changed = np.abs(thumbnail - reference_thumbnail) > pixel_threshold
+        return float(np.count_nonzero(changed)) / changed.size
+
+    def _to_reference_thumbnail(self, reference: Image, width: int) -> np.ndarray:
+        with self._lock:
+            if (
+                reference is not self._reference
+                or self._reference_thumbnail is None
+                or self._reference_thumbnail.shape[1] != width
+            ):
+                self._reference = reference
+                self._reference_thumbnail = to_thumbnail(reference, width)
+            return self._reference_thumbnail
+
+
+def to_thumbnail(image: Image, width: int) -> np.ndarray:
+    """Grayscale thumbnail as float32; channel order does not matter here."""
+    array = image.np_array
+    height = max(1, round(array.shape[0] * width / array.shape[1]))
+    thumbnail = cv2.resize(array, (width, height), interpolation=cv2.INTER_AREA)
+    if thumbnail.ndim == 3:
+        return thumbnail[:, :, :3].mean(axis=2, dtype=np.float32)
+    return thumbnail.astype(np.float32)
@@ -0,0 +1,49 @@
+import numpy as np
+from src.image.image import Image
+from src.image.motion_detector import MotionDetector
+
+
+def _frame(value: int) -> Image:
+    return Image.from_np_array(np.full((120, 160, 3), value, dtype=np.uint8))
+
+
+def test_identical_frames_have_no_motion() -> None:
+    detector = MotionDetector()
+
+    ratio = detector.changed_ratio(
+        images=[_frame(100)],
+        references=[_frame(100)],
+        thumbnail_width=32,
+        pixel_threshold=25,
+    )
+
+    assert ratio == 0.0
+
+
+def test_changed_region_is_reported_as_ratio() -> None:
+    detector = MotionDetector()
+    array = np.full((120, 160, 3), 100, dtype=np.uint8)
+    array[:, :80] = 255
+
+    ratio = detector.changed_ratio(
+        images=[Image.from_np_array(array)],
+        references=[_frame(100)],
+        thumbnail_width=32,
+        pixel_threshold=25,
+    )
+
+    assert ratio == 0.5
+
+
+def test_mismatched_frames_cannot_be_compared() -> None:
+    detector = MotionDetector()
+
+    assert (
+        detector.changed_ratio(
+            images=[_frame(100)],
+            references=[],
+            thumbnail_width=32,
+            pixel_threshold=25,
+        )
+        is None
+    )
@@ -0,0 +1,48 @@
+from enum import Enum
+import cv2  # type: ignore
+import numpy as np
+from src.image.image import Image
+
+DEFAULT_HASH_SIZE = 16
+
+
+class HashMethod(Enum):
+    AVERAGE = "average"
+    DIFFERENCE = "difference"
+
+
+def perceptual_hash(
+    image: Image,
+    method: HashMethod = HashMethod.DIFFERENCE,
+    hash_size: int = DEFAULT_HASH_SIZE,
+) -> int:
+    """
+    hash_size * hash_size bit fingerprint of the frame's coarse structure.
+    Near-identical frames (sensor noise, compression artifacts) differ in few
+    bits, so hamming_distance() measures how alike two frames look.
+    """
+    if hash_size < 2:
+        raise ValueError(f"hash_size must be at least 2, got {hash_size}")
+
+    if method == HashMethod.AVERAGE:
+        thumbnail = _to_gray_thumbnail(image, width=hash_size, height=hash_size)
+        bits = thumbnail > thumbnail.mean()
+    else:
+        thumbnail = _to_gray_thumbnail(image, width=hash_size + 1, height=hash_size)
+        bits = thumbnail[:, 1:] > thumbnail[:, :-1]
+
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def _to_gray_thumbnail(image: Image, width: int, height: int) -> np.ndarray:
+    """Channel order does not matter since channels are averaged."""
+    thumbnail = cv2.resize(
+        image.np_array, (width, height), interpolation=cv2.INTER_AREA
+    )
+    if thumbnail.ndim == 3:
+        return thumbnail[:, :, :3].mean(axis=2, dtype=np.float32)
+    return thumbnail.astype(np.float32)
@@ -0,0 +1,34 @@
+import cv2  # type: ignore
+import numpy as np
+import pytest
+from src.image.channel_order import ChannelOrder
+from src.image.image import Image
+from src.image.perceptual_hash import HashMethod, hamming_distance, perceptual_hash
+
+
+def _scene(seed: int) -> np.ndarray:
+    """Smooth random shapes, like real footage rather than white noise."""
+    coarse = np.random.default_rng(seed).integers(0, 256, (6, 8, 3), dtype=np.uint8)
+    return cv2.resize(coarse, (160, 120), interpolation=cv2.INTER_CUBIC)
+
+
+@pytest.mark.parametrize("method", list(HashMethod))
+def test_noisy_copy_is_close_and_other_scene_is_far(method: HashMethod) -> None:
+    scene = _scene(seed=1)
+    noise = np.random.default_rng(2).integers(-3, 4, scene.shape)
+    noisy = np.clip(scene.astype(int) + noise, 0, 255).astype(np.uint8)
+
+    scene_hash = perceptual_hash(Image.from_np_array(scene), method=method)
+    noisy_hash = perceptual_hash(Image.from_np_array(noisy), method=method)
+    other_hash = perceptual_hash(Image.from_np_array(_scene(seed=3)), method=method)
+
+    assert hamming_distance(scene_hash, noisy_hash) <= 8
+    assert hamming_distance(scene_hash, other_hash) > 64
+
+
+def test_channel_order_does_not_change_the_hash() -> None:
+    scene = _scene(seed=4)
+
+    assert perceptual_hash(Image.from_np_array(scene)) == perceptual_hash(
+        Image.from_np_array(scene[:, :, ::-1], channel_order=ChannelOrder.BGR)
+    )
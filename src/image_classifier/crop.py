@@ -0,0 +1,72 @@
+from dataclasses import dataclass, field
+from typing import Optional
+import cv2  # type: ignore
+import numpy as np
+from src.image_classifier.bounding_box import BoundingBox
+
+
+@dataclass
+class CropTransform:
+    """Maps pixel coordinates in a cropped, resized image back to the full frame."""
+
+    x_offset: float = field(default=0)
+    y_offset: float = field(default=0)
+    x_scale: float = field(default=1)
+    y_scale: float = field(default=1)
+
+    def to_frame(self, xyxy: np.ndarray) -> np.ndarray:
+        """Map an (N, 4) array of x_min, y_min, x_max, y_max boxes."""
+        scale = np.array(
+            [self.x_scale, self.y_scale, self.x_scale, self.y_scale], dtype=np.float32
+        )
+        offset = np.array(
+            [self.x_offset, self.y_offset, self.x_offset, self.y_offset],
+            dtype=np.float32,
+        )
+        return xyxy * scale + offset
+
+
+def validate_region(region: BoundingBox) -> None:
+    if not (0 <= region.x_min < region.x_max <= 1):
+        raise ValueError(f"Region x range must be within [0, 1], got {region}")
+    if not (0 <= region.y_min < region.y_max <= 1):
+        raise ValueError(f"Region y range must be within [0, 1], got {region}")
+
+
+def crop_and_resize(
+    array: np.ndarray,
+    region: Optional[BoundingBox],
+    max_size: Optional[int],
+) -> tuple[np.ndarray, CropTransform]:
+    """
+    Crop to a region given in normalized coordinates, then shrink so the longest
+    side is at most max_size. The crop is a view; only the resize allocates.
+    """
+    height, width = array.shape[:2]
+
+    x_offset, y_offset = 0, 0
+    if region is not None:
+        x_offset = int(region.x_min * width)
+        y_offset = int(region.y_min * height)
+        x_end = max(x_offset + 1, int(round(region.x_max * width)))
+        y_end = max(y_offset + 1, int(round(region.y_max * height)))
+        array = array[y_offset:y_end, x_offset:x_end]
+
+    crop_height, crop_width = array.shape[:2]
+    transform = CropTransform(x_offset=x_offset, y_offset=y_offset)
+
+    if max_size is None or max(crop_height, crop_width) <= max_size:
+        return array, transform
+
+    ratio = max_size / max(crop_height, crop_width)
+    resized_width = max(1, round(crop_width * ratio))
+    resized_height = max(1, round(crop_height * ratio))
+    resized = cv2.resize(
+        np.ascontiguousarray(array),
+        (resized_width, resized_height),
+        interpolation=cv2.INTER_AREA,
+    )
+
+    transform.x_scale = crop_width / resized_width
+    transform.y_scale = crop_height / resized_height
+    return resized, transform
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from src.image_classifier.bounding_box import BoundingBox
+from src.image_classifier.crop import crop_and_resize, validate_region
+
+
+def test_crop_is_a_view_of_the_region() -> None:
+    array = np.zeros((100, 200, 3), dtype=np.uint8)
+
+    cropped, transform = crop_and_resize(
+        array,
+        region=BoundingBox(x_min=0.5, y_min=0.25, x_max=1.0, y_max=0.75),
+        max_size=None,
+    )
+
+    assert cropped.shape == (50, 100, 3)
+    assert np.shares_memory(cropped, array)
+    assert (transform.x_offset, transform.y_offset) == (100, 25)
+
+
+def test_boxes_map_back_to_full_frame() -> None:
+    array = np.zeros((1000, 2000, 3), dtype=np.uint8)
+
+    resized, transform = crop_and_resize(
+        array,
+        region=BoundingBox(x_min=0.5, y_min=0.0, x_max=1.0, y_max=1.0),
+        max_size=500,
+    )
+
+    assert resized.shape == (500, 500, 3)
+
+    boxes = transform.to_frame(np.array([[0, 0, 500, 250]], dtype=np.float32))
+
+    assert boxes.tolist() == [[1000, 0, 2000, 500]]
+
+
+def test_invalid_region_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        validate_region(BoundingBox(x_min=0.5, y_min=0, x_max=0.2, y_max=1))
@@ -0,0 +1,183 @@
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Optional
+import threading
+import time
+from src.image.image import Image
+from src.library.life_cycle import LifeCycle
+from .interface import ImageClassifier, Classification
+
+DEFAULT_MAX_BATCH_SIZE = 8
+DEFAULT_MAX_WAIT = timedelta(milliseconds=5)
+
+
+@dataclass
+class _Request:
+    images: list[Image]
+    enqueued_at: float
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Optional[list[list[Classification]]] = None
+    error: Optional[BaseException] = None
+
+
+class BatchingImageClassifier(ImageClassifier, LifeCycle):
+    """
+    Collects classify calls from concurrent callers and runs them through the
+    wrapped classifier as one model batch, then hands each caller the
+    classifications of its own images.
+
+    A batch is sent once it holds max_batch_size images or the oldest waiting
+    call has waited max_wait, whichever comes first; a lower max_wait favours
+    latency, a higher one throughput. Calls are batched strictly in arrival
+    order and never split, so a caller is never overtaken by later callers. A
+    call larger than max_batch_size runs as a batch of its own.
+
+    The wrapped classifier should implement classify_each for real batching;
+    failures of a batch are raised in every caller of that batch.
+    """
+
+    _image_classifier: ImageClassifier
+    _max_batch_size: int
+    _max_wait: timedelta
+    _pending: deque[_Request]
+    _condition: threading.Condition
+    _thread: Optional[threading.Thread]
+    _running: bool
+
+    def __init__(
+        self,
+        image_classifier: ImageClassifier,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: timedelta = DEFAULT_MAX_WAIT,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        if max_wait < timedelta(0):
+            raise ValueError(f"max_wait must not be negative, got {max_wait}")
+
+        self._image_classifier = image_classifier
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._pending = deque()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def classify(self, images: list[Image]) -> list[Classification]:
+        return [
+            classification
+            for classifications in self.classify_each(images=images)
+            for classification in classifications
+        ]
+
+    def classify_each(self, images: list[Image]) -> list[list[Classification]]:
+        if not images:
+            return []
+
+        self.start()
+
+        request = _Request(images=list(images), enqueued_at=time.monotonic())
+        with self._condition:
+            self._pending.append(request)
+            self._condition.notify_all()
+
+        request.done.wait()
+
+        if request.error is not None:
+            raise request.error
+        assert request.result is not None
+        return request.result
+
+    def warm_up(self) -> None:
+        self._image_classifier.warm_up()
+
+    def _take_batch(self) -> Optional[list[_Request]]:
+        """Wait until a batch is full or due. None once stopped."""
+        with self._condition:
+            while True:
+                if not self._running:
+                    return None
+
+                if self._pending:
+                    deadline = (
+                        self._pending[0].enqueued_at + self._max_wait.total_seconds()
+                    )
+                    remaining = deadline - time.monotonic()
+                    if self._pending_image_count() >= self._max_batch_size:
+                        break
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(timeout=remaining)
+                else:
+                    self._condition.wait()
+
+            batch = [self._pending.popleft()]
+            image_count = len(batch[0].images)
+            while (
+                self._pending
+                and image_count + len(self._pending[0].images) <= self._max_batch_size
+            ):
+                request = self._pending.popleft()
+                image_count += len(request.images)
+                batch.append(request)
+            return batch
+
+    def _pending_image_count(self) -> int:
+        return sum(len(request.images) for request in self._pending)
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if batch is None:
+                return
+            self._run_batch(batch)
+
+    def _run_batch(self, batch: list[_Request]) -> None:
+        images = [image for request in batch for image in request.images]
+
+        try:
+            results = self._image_classifier.classify_each(images=images)
+            if len(results) != len(images):
+                raise RuntimeError(
+                    f"Expected classifications for {len(images)} images, "
+                    f"got {len(results)}"
+                )
+        except BaseException as error:
+            for request in batch:
+                request.error = error
+                request.done.set()
+            return
+
+        start = 0
+        for request in batch:
+            end = start + len(request.images)
+            request.result = results[start:end]
+            start = end
+            request.done.set()
+
+    def start(self) -> None:
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            pending = list(self._pending)
+            self._pending.clear()
+            self._condition.notify_all()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        for request in pending:
+            request.error = RuntimeError("BatchingImageClassifier stopped")
+            request.done.set()
@@ -0,0 +1,105 @@
+from datetime import timedelta
+import threading
+import numpy as np
+import pytest
+from src.image.image import Image
+from src.image_classifier.classification import Classification
+from src.image_classifier.impl_batching import BatchingImageClassifier
+from src.image_classifier.interface import ImageClassifier
+
+
+class _RecordingImageClassifier(ImageClassifier):
+    """Labels every image with its pixel value and records each batch."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+
+    def classify(self, images: list[Image]) -> list[Classification]:
+        raise AssertionError("Batches should go through classify_each")
+
+    def classify_each(self, images: list[Image]) -> list[list[Classification]]:
+        self.batch_sizes.append(len(images))
+        return [
+            [Classification(label=str(int(image.np_array[0, 0, 0])))]
+            for image in images
+        ]
+
+
+class _FailingImageClassifier(ImageClassifier):
+    def classify(self, images: list[Image]) -> list[Classification]:
+        raise ValueError("model failed")
+
+
+def _image(value: int) -> Image:
+    return Image.from_np_array(np.full((2, 2, 3), value, dtype=np.uint8))
+
+
+def _classify_concurrently(
+    image_classifier: ImageClassifier, calls: list[list[Image]]
+) -> list[list[Classification]]:
+    results: list[list[Classification]] = [[] for _ in calls]
+
+    def call(index: int) -> None:
+        results[index] = image_classifier.classify(images=calls[index])
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(calls))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+def test_concurrent_calls_share_a_batch_and_get_their_own_results() -> None:
+    inner = _RecordingImageClassifier()
+    image_classifier = BatchingImageClassifier(
+        image_classifier=inner, max_batch_size=4, max_wait=timedelta(seconds=1)
+    )
+
+    try:
+        results = _classify_concurrently(
+            image_classifier,
+            calls=[[_image(1)], [_image(2), _image(3)], [_image(4)]],
+        )
+    finally:
+        image_classifier.stop()
+
+    assert [[c.label for c in result] for result in results] == [
+        ["1"],
+        ["2", "3"],
+        ["4"],
+    ]
+    assert inner.batch_sizes == [4]
+
+
+def test_batches_never_exceed_max_batch_size() -> None:
+    inner = _RecordingImageClassifier()
+    image_classifier = BatchingImageClassifier(
+        image_classifier=inner, max_batch_size=2, max_wait=timedelta(milliseconds=50)
+    )
+
+    try:
+        results = _classify_concurrently(
+            image_classifier, calls=[[_image(value)] for value in range(5)]
+        )
+    finally:
+        image_classifier.stop()
+
+    assert [[c.label for c in result] for result in results] == [
+        [str(value)] for value in range(5)
+    ]
+    assert sum(inner.batch_sizes) == 5
+    assert max(inner.batch_sizes) <= 2
+
+
+def test_batch_failure_is_raised_in_the_caller() -> None:
+    image_classifier = BatchingImageClassifier(
+        image_classifier=_FailingImageClassifier(), max_wait=timedelta(0)
+    )
+
+    try:
+        with pytest.raises(ValueError):
+            image_classifier.classify(images=[_image(1)])
+    finally:
+        image_classifier.stop()
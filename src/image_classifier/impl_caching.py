@@ -0,0 +1,163 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional
+import threading
+import time
+from src.image.image import Image
+from src.image.perceptual_hash import (
+    DEFAULT_HASH_SIZE,
+    HashMethod,
+    hamming_distance,
+    perceptual_hash,
+)
+from .interface import ImageClassifier, Classification
+
+DEFAULT_MAX_DISTANCE = 4
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_TTL = timedelta(seconds=10)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    classifications: list[Classification]
+    stored_at: float
+
+
+class CachingImageClassifier(ImageClassifier):
+    """
+    Reuses the classifications of a recently classified frame that looks the
+    same, so a static scene is not run through the model over and over.
+
+    Frames are compared by perceptual hash: a frame whose hash is within
+    max_distance bits of a cached one gets that entry's classifications. Keep
+    max_distance low, since a small pet entering a large frame only flips a few
+    bits. Entries expire after ttl so a cached result is never trusted for
+    long, and the least recently used entry is dropped beyond max_entries.
+    """
+
+    _image_classifier: ImageClassifier
+    _method: HashMethod
+    _hash_size: int
+    _max_distance: int
+    _max_entries: int
+    _ttl: timedelta
+    _entries: OrderedDict[int, _Entry]
+    _hits: int
+    _misses: int
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        image_classifier: ImageClassifier,
+        method: HashMethod = HashMethod.DIFFERENCE,
+        hash_size: int = DEFAULT_HASH_SIZE,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: timedelta = DEFAULT_TTL,
+    ) -> None:
+        if max_distance < 0:
+            raise ValueError(f"max_distance must not be negative, got {max_distance}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        self._image_classifier = image_classifier
+        self._method = method
+        self._hash_size = hash_size
+        self._max_distance = max_distance
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def classify(self, images: list[Image]) -> list[Classification]:
+        return [
+            classification
+            for classifications in self.classify_each(images=images)
+            for classification in classifications
+        ]
+
+    def classify_each(self, images: list[Image]) -> list[list[Classification]]:
+        hashes = [
+            perceptual_hash(image, method=self._method, hash_size=self._hash_size)
+            for image in images
+        ]
+
+        results: list[Optional[list[Classification]]] = [
+            self._lookup(image_hash) for image_hash in hashes
+        ]
+        misses = [i for i, result in enumerate(results) if result is None]
+
+        if misses:
+            classified = self._image_classifier.classify_each(
+                images=[images[i] for i in misses]
+            )
+            for i, classifications in zip(misses, classified):
+                results[i] = classifications
+                self._store(hashes[i], classifications)
+
+        return [list(result) if result is not None else [] for result in results]
+
+    def warm_up(self) -> None:
+        self._image_classifier.warm_up()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, image_hash: int) -> Optional[list[Classification]]:
+        with self._lock:
+            self._evict_expired(time.monotonic())
+
+            best: Optional[tuple[int, int]] = None
+            for cached_hash in self._entries:
+                distance = hamming_distance(image_hash, cached_hash)
+                if distance <= self._max_distance and (
+                    best is None or distance < best[0]
+                ):
+                    best = (distance, cached_hash)
+
+            if best is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(best[1])
+            return self._entries[best[1]].classifications
+
+    def _store(self, image_hash: int, classifications: list[Classification]) -> None:
+        with self._lock:
+            self._entries[image_hash] = _Entry(
+                classifications=list(classifications), stored_at=time.monotonic()
+            )
+            self._entries.move_to_end(image_hash)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _evict_expired(self, now: float) -> None:
+        """Caller holds the lock."""
+        ttl = self._ttl.total_seconds()
+        expired = [
+            image_hash
+            for image_hash, entry in self._entries.items()
+            if now - entry.stored_at >= ttl
+        ]
+        for image_hash in expired:
+            del self._entries[image_hash]
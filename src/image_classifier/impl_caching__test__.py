@@ -0,0 +1,64 @@
+from datetime import timedelta
+import numpy as np
+from src.image.image import Image
+from src.image_classifier.classification import Classification
+from src.image_classifier.impl_caching import CachingImageClassifier
+from src.image_classifier.interface import ImageClassifier
+
+
+class _CountingImageClassifier(ImageClassifier):
+    def __init__(self) -> None:
+        self.classified = 0
+
+    def classify(self, images: list[Image]) -> list[Classification]:
+        self.classified += len(images)
+        return [Classification(label="dog", weight=0.9) for _ in images]
+
+
+def _scene(seed: int) -> Image:
+    array = np.random.default_rng(seed).integers(0, 256, (60, 80, 3), dtype=np.uint8)
+    return Image.from_np_array(array)
+
+
+def test_repeated_scene_is_served_from_cache() -> None:
+    inner = _CountingImageClassifier()
+    image_classifier = CachingImageClassifier(image_classifier=inner)
+
+    first = image_classifier.classify(images=[_scene(seed=1)])
+    second = image_classifier.classify(images=[_scene(seed=1), _scene(seed=2)])
+
+    assert first == [Classification(label="dog", weight=0.9)]
+    assert len(second) == 2
+    assert inner.classified == 2
+
+    stats = image_classifier.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+    assert stats.hit_rate == 1 / 3
+
+
+def test_expired_entries_are_classified_again() -> None:
+    inner = _CountingImageClassifier()
+    image_classifier = CachingImageClassifier(image_classifier=inner, ttl=timedelta(0))
+
+    image_classifier.classify(images=[_scene(seed=1)])
+    image_classifier.classify(images=[_scene(seed=1)])
+
+    assert inner.classified == 2
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    inner = _CountingImageClassifier()
+    image_classifier = CachingImageClassifier(image_classifier=inner, max_entries=2)
+
+    image_classifier.classify(images=[_scene(seed=1)])
+    image_classifier.classify(images=[_scene(seed=2)])
+    image_classifier.classify(images=[_scene(seed=1)])
+    image_classifier.classify(images=[_scene(seed=3)])
+
+    assert inner.classified == 3
+
+    image_classifier.classify(images=[_scene(seed=1)])
+    assert inner.classified == 3
+
+    image_classifier.classify(images=[_scene(seed=2)])
+    assert inner.classified == 4
@@ -0,0 +1,105 @@
+from dataclasses import dataclass
+import threading
+from src.image.image import Image
+from .interface import ImageClassifier, Classification
+
+
+@dataclass(frozen=True)
+class CascadeStats:
+    classified: int = 0
+    escalated: int = 0
+
+    @property
+    def escalation_rate(self) -> float:
+        return self.escalated / self.classified if self.classified else 0.0
+
+
+class CascadeImageClassifier(ImageClassifier):
+    """
+    Runs a fast classifier on every image and a slower, more accurate one only
+    on images the fast one is unsure about.
+
+    An image is escalated when the fast classifier reports one of labels with
+    a weight in [min_weight, max_weight): too strong to ignore, too weak to
+    act on. The fast classifier's own confidence threshold should be at most
+    min_weight, otherwise weak detections never show up to be escalated.
+    Images that are escalated get the accurate classifier's classifications
+    instead of the fast ones.
+    """
+
+    _fast: ImageClassifier
+    _accurate: ImageClassifier
+    _labels: set[str]
+    _min_weight: float
+    _max_weight: float
+    _classified: int
+    _escalated: int
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        fast: ImageClassifier,
+        accurate: ImageClassifier,
+        labels: set[str],
+        min_weight: float,
+        max_weight: float,
+    ) -> None:
+        if not 0 <= min_weight <= max_weight <= 1:
+            raise ValueError(
+                f"Expected 0 <= min_weight <= max_weight <= 1, got {min_weight}, {max_weight}"
+            )
+
+        self._fast = fast
+        self._accurate = accurate
+        self._labels = set(labels)
+        self._min_weight = min_weight
+        self._max_weight = max_weight
+        self._classified = 0
+        self._escalated = 0
+        self._lock = threading.Lock()
+
+    def classify(self, images: list[Image]) -> list[Classification]:
+        return [
+            classification
+            for classifications in self.classify_each(images=images)
+            for classification in classifications
+        ]
+
+    def classify_each(self, images: list[Image]) -> list[list[Classification]]:
+        if not images:
+            return []
+
+        results = self._fast.classify_each(images=images)
+        escalate = [
+            i
+            for i, classifications in enumerate(results)
+            if self._is_ambiguous(classifications)
+        ]
+
+        if escalate:
+            accurate_results = self._accurate.classify_each(
+                images=[images[i] for i in escalate]
+            )
+            for i, classifications in zip(escalate, accurate_results):
+                results[i] = classifications
+
+        with self._lock:
+            self._classified += len(images)
+            self._escalated += len(escalate)
+
+        return results
+
+    def warm_up(self) -> None:
+        self._fast.warm_up()
+        self._accurate.warm_up()
+
+    def stats(self) -> CascadeStats:
+        with self._lock:
+            return CascadeStats(classified=self._classified, escalated=self._escalated)
+
+    def _is_ambiguous(self, classifications: list[Classification]) -> bool:
+        return any(
+            classification.label in self._labels
+            and self._min_weight <= classification.weight < self._max_weight
+            for classification in classifications
+        )
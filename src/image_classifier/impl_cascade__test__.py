@@ -0,0 +1,68 @@
+import numpy as np
+from src.image.image import Image
+from src.image_classifier.classification import Classification
+from src.image_classifier.impl_cascade import CascadeImageClassifier
+from src.image_classifier.interface import ImageClassifier
+
+
+class _WeightImageClassifier(ImageClassifier):
+    """Reports its label with the image's pixel value as weight in percent."""
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.classified = 0
+
+    def classify(self, images: list[Image]) -> list[Classification]:
+        self.classified += len(images)
+        return [
+            Classification(
+                label=self.label, weight=float(image.np_array[0, 0, 0]) / 100
+            )
+            for image in images
+        ]
+
+
+def _image(percent: int) -> Image:
+    return Image.from_np_array(np.full((2, 2, 3), percent, dtype=np.uint8))
+
+
+def test_only_ambiguous_images_are_escalated() -> None:
+    fast = _WeightImageClassifier(label="dog")
+    accurate = _WeightImageClassifier(label="accurate")
+    image_classifier = CascadeImageClassifier(
+        fast=fast,
+        accurate=accurate,
+        labels={"dog", "cat"},
+        min_weight=0.3,
+        max_weight=0.7,
+    )
+
+    results = image_classifier.classify_each(
+        images=[_image(10), _image(50), _image(90)]
+    )
+
+    assert [[c.label for c in result] for result in results] == [
+        ["dog"],
+        ["accurate"],
+        ["dog"],
+    ]
+    assert accurate.classified == 1
+
+    stats = image_classifier.stats()
+    assert (stats.classified, stats.escalated) == (3, 1)
+    assert stats.escalation_rate == 1 / 3
+
+
+def test_labels_outside_the_lists_are_never_escalated() -> None:
+    accurate = _WeightImageClassifier(label="accurate")
+    image_classifier = CascadeImageClassifier(
+        fast=_WeightImageClassifier(label="person"),
+        accurate=accurate,
+        labels={"dog", "cat"},
+        min_weight=0.3,
+        max_weight=0.7,
+    )
+
+    image_classifier.classify(images=[_image(50)])
+
+    assert accurate.classified == 0
@@ -0,0 +1,276 @@
+from dataclasses import dataclass
+import os
+from typing import Iterator, Optional
+import threading
+import cv2  # type: ignore
+import numpy as np
+import onnxruntime as ort  # type: ignore
+from src.image.channel_order import ChannelOrder
+from src.image.image import Image
+from src.image_classifier.bounding_box import BoundingBox
+from src.image_classifier.crop import CropTransform, crop_and_resize, validate_region
+from src.image_classifier.impl_yolo import (
+    COCO_DATASET_CLASS_INDICES,
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    DEFAULT_IMAGE_SIZE,
+    DEFAULT_MAX_BATCH_SIZE,
+    YoloModelSize,
+)
+from src.image_classifier.nms import non_max_suppression
+from .interface import ImageClassifier, Classification, to_warm_up_images
+
+DEFAULT_IOU_THRESHOLD = 0.7
+DEFAULT_INTRA_OP_THREADS = 0  # 0 lets the runtime use every physical core
+MAX_DETECTIONS = 300
+# Gray the letterbox padding the same way ultralytics does.
+PADDING_VALUE = 114 / 255
+
+# Tried in order; OpenVINO is only available with the onnxruntime-openvino build.
+PREFERRED_PROVIDERS = ["OpenVINOExecutionProvider", "CPUExecutionProvider"]
+
+
+def to_onnx_filename(model_size: YoloModelSize, int8: bool = False) -> str:
+    stem, _ = os.path.splitext(model_size.to_filename())
+    return f"{stem}.int8.onnx" if int8 else f"{stem}.onnx"
+
+
+def export_onnx(model_size: YoloModelSize, image_size: int, int8: bool = False) -> str:
+    """
+    Export the checkpoint to ONNX next to it, once, and return the path. INT8
+    uses dynamic quantization of the weights, which needs no calibration data.
+    """
+    path = to_onnx_filename(model_size, int8=int8)
+    if os.path.exists(path):
+        return path
+
+    float_path = to_onnx_filename(model_size)
+    if not os.path.exists(float_path):
+        from ultralytics import YOLO  # type: ignore
+
+        exported = YOLO(model_size.to_filename()).export(
+            format="onnx", imgsz=image_size, dynamic=True
+        )
+        if os.path.abspath(exported) != os.path.abspath(float_path):
+            os.replace(exported, float_path)
+
+    if int8:
+        from onnxruntime.quantization import QuantType, quantize_dynamic  # type: ignore
+
+        quantize_dynamic(float_path, path, weight_type=QuantType.QUInt8)
+
+    return path
+
+
+@dataclass
+class _Letterbox:
+    """Where an image of shape (height, width) sits in the square model input."""
+
+    shape: tuple[int, int]
+    gain: float
+    left: int
+    top: int
+
+    def to_image(self, xyxy: np.ndarray) -> np.ndarray:
+        """Map an (N, 4) array of boxes in model input pixels to image pixels."""
+        return (xyxy - [self.left, self.top, self.left, self.top]) / self.gain
+
+
+class OnnxYoloImageClassifier(ImageClassifier):
+    """
+    YoloImageClassifier on ONNX Runtime instead of torch eager mode, for CPU
+    only boxes. The checkpoint is exported to ONNX on first use. Frames are
+    letterboxed the way ultralytics does into one preallocated input batch,
+    and the raw predictions are decoded and suppressed with NumPy.
+    Classifications and full-frame bounding boxes match YoloImageClassifier.
+    Calls from several threads take turns on the input batch.
+    """
+
+    def __init__(
+        self,
+        model_size: YoloModelSize,
+        confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        iou_threshold: float = DEFAULT_IOU_THRESHOLD,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        region_of_interest: Optional[BoundingBox] = None,
+        image_size: int = DEFAULT_IMAGE_SIZE,
+        int8: bool = False,
+        intra_op_threads: int = DEFAULT_INTRA_OP_THREADS,
+        model_path: Optional[str] = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        if image_size < 32 or image_size % 32 != 0:
+            raise ValueError(
+                f"image_size must be a multiple of 32 and at least 32, got {image_size}"
+            )
+        if region_of_interest is not None:
+            validate_region(region_of_interest)
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        available = ort.get_available_providers()
+        self._session = ort.InferenceSession(
+            (
+                model_path
+                if model_path is not None
+                else export_onnx(model_size, image_size=image_size, int8=int8)
+            ),
+            sess_options=options,
+            providers=[p for p in PREFERRED_PROVIDERS if p in available],
+        )
+        self._input_name = self._session.get_inputs()[0].name
+        self._confidence_threshold = confidence_threshold
+        self._iou_threshold = iou_threshold
+        self._class_indices = COCO_DATASET_CLASS_INDICES
+        self._labels = list(self._class_indices)
+        self._class_columns = 4 + np.array(list(self._class_indices.values()))
+        self._max_batch_size = max_batch_size
+        self._region_of_interest = region_of_interest
+        self._image_size = image_size
+        self._inputs = np.empty(
+            (max_batch_size, 3, image_size, image_size), dtype=np.float32
+        )
+        # Held from filling the input batch until the session is done with it.
+        self._inputs_lock = threading.Lock()
+
+    def classify(self, images: list[Image]) -> list[Classification]:
+        return [
+            classification
+            for classifications in self._classify_images(images)
+            for classification in classifications
+        ]
+
+    def classify_each(self, images: list[Image]) -> list[list[Classification]]:
+        return list(self._classify_images(images))
+
+    def warm_up(self) -> None:
+        self.classify_each(
+            images=to_warm_up_images(self._image_size, self._max_batch_size)
+        )
+
+    def _classify_images(self, images: list[Image]) -> Iterator[list[Classification]]:
+        for start in range(0, len(images), self._max_batch_size):
+            batch = images[start : start + self._max_batch_size]
+            with self._inputs_lock:
+                inputs = [
+                    self._fill_input(index, image) for index, image in enumerate(batch)
+                ]
+                (predictions,) = self._session.run(
+                    None, {self._input_name: self._inputs[: len(batch)]}
+                )
+            for prediction, (transform, letterbox) in zip(predictions, inputs):
+                yield list(
+                    self._decode(
+                        prediction=prediction, transform=transform, letterbox=letterbox
+                    )
+                )
+
+    def _fill_input(self, index: int, image: Image) -> tuple[CropTransform, _Letterbox]:
+        """
+        Crop and shrink the frame like YoloImageClassifier, then letterbox it as
+        normalized RGB into its input slot.
+        """
+        array, transform = crop_and_resize(
+            _to_rgb(image),
+            region=self._region_of_interest,
+            max_size=self._image_size,
+        )
+        return transform, _letterbox(array, self._inputs[index])
+
+    def _decode(
+        self,
+        prediction: np.ndarray,
+        transform: CropTransform,
+        letterbox: _Letterbox,
+    ) -> Iterator[Classification]:
+        """prediction is (4 + classes, anchors): center x, y, width, height, scores."""
+        class_scores = prediction[self._class_columns]
+        best = class_scores.argmax(axis=0)
+        scores = class_scores[best, np.arange(class_scores.shape[1])]
+
+        candidates = scores >= self._confidence_threshold
+        if not candidates.any():
+            return
+
+        scores = scores[candidates]
+        best = best[candidates]
+        x_center, y_center, width, height = prediction[:4, candidates]
+        xyxy = np.stack(
+            [
+                x_center - width / 2,
+                y_center - height / 2,
+                x_center + width / 2,
+                y_center + height / 2,
+            ],
+            axis=1,
+        )
+
+        keep = non_max_suppression(
+            xyxy,
+            scores,
+            best,
+            iou_threshold=self._iou_threshold,
+            max_detections=MAX_DETECTIONS,
+        )
+        # Boxes may reach into the padding; clip them to the image like ultralytics.
+        image_height, image_width = letterbox.shape
+        kept_xyxy = np.clip(
+            letterbox.to_image(xyxy[keep]),
+            0,
+            [image_width, image_height, image_width, image_height],
+        )
+        frame_xyxy = transform.to_frame(kept_xyxy)
+
+        for (x_min, y_min, x_max, y_max), score, label_index in zip(
+            frame_xyxy.tolist(), scores[keep].tolist(), best[keep].tolist()
+        ):
+            yield Classification(
+                label=self._labels[label_index],
+                weight=score,
+                bounding_box=BoundingBox(
+                    x_min=x_min, y_min=y_min, x_max=x_max, y_max=y_max
+                ),
+            )
+
+
+def _letterbox(array: np.ndarray, slot: np.ndarray) -> _Letterbox:
+    """
+    Scale an RGB image to fit the (3, size, size) slot, up or down, and center
+    it on gray padding, as ultralytics' LetterBox does.
+    """
+    height, width = array.shape[:2]
+    size = slot.shape[1]
+    gain = min(size / height, size / width)
+    resized_width, resized_height = round(width * gain), round(height * gain)
+    if (resized_width, resized_height) != (width, height):
+        array = cv2.resize(
+            np.ascontiguousarray(array),
+            (resized_width, resized_height),
+            interpolation=cv2.INTER_LINEAR,
+        )
+
+    # Same rounding as ultralytics, so an odd padding puts the extra pixel
+    # bottom and right.
+    left = round((size - resized_width) / 2 - 0.1)
+    top = round((size - resized_height) / 2 - 0.1)
+
+    slot[:, :top, :] = PADDING_VALUE
+    slot[:, top + resized_height :, :] = PADDING_VALUE
+    slot[:, top : top + resized_height, :left] = PADDING_VALUE
+    slot[:, top : top + resized_height, left + resized_width :] = PADDING_VALUE
+    np.multiply(
+        array.transpose(2, 0, 1),
+        1 / 255,
+        out=slot[:, top : top + resized_height, left : left + resized_width],
+    )
+    return _Letterbox(shape=(height, width), gain=gain, left=left, top=top)
+
+
+def _to_rgb(image: Image) -> np.ndarray:
+    if image.channels == 1:
+        return np.repeat(np.atleast_3d(image.np_array), 3, axis=2)
+    return image.to_np_array(ChannelOrder.RGB)[:, :, :3]
@@ -1,14 +1,17 @@
+import math
+import numpy as np
 import timm  # type: ignore
 import torch  # type: ignore
 import torchvision.transforms as T  # type: ignore
-from typing import List
+from typing import Any, List
 import logging
 
+from src.image.channel_order import ChannelOrder
 from src.image.image import Image
 from src.image_classifier.bounding_box import (
     BoundingBox,
 )  # Keep for interface compatibility
-from .interface import ImageClassifier, Classification
+from .interface import ImageClassifier, Classification, to_warm_up_images
 from enum import Enum
 
 # --- Configuration ---
@@ -33,6 +36,11 @@ DEFAULT_MODEL_NAME = PretrainedModelName.EFFICIENTNET_B3
 # Common ranges: Cat ~281-285, Dog ~151-275
 CAT_INDICES = list(range(281, 286))
 DOG_INDICES = list(range(151, 276))
+LABELS = ["cat", "dog"]
+
+# Report a label when its summed probability is above this
+MIN_PROBABILITY = 0.1
+DEFAULT_MAX_BATCH_SIZE = 8
 
 # --- Implementation ---
 
@@ -43,26 +51,64 @@ class PretrainedImageClassifier(ImageClassifier):
         model_name: PretrainedModelName = DEFAULT_MODEL_NAME,
         device: str = "cuda" if torch.cuda.is_available() else "cpu",
         logger: logging.Logger = logging.getLogger(__name__),
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        inference_mode: bool = True,
+        channels_last: bool = False,
+        compile_model: bool = False,
     ) -> None:
+        """
+        Images are stacked into batches of up to max_batch_size and run in one
+        forward pass each. inference_mode uses torch.inference_mode instead of
+        no_grad; channels_last suits convolutional models on CPU; compile_model
+        runs torch.compile, which pays off after the first batches.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+
         self._device = device
         self._model_name = model_name
         self._cat_indices = CAT_INDICES
         self._dog_indices = DOG_INDICES
         self._logger = logger
+        self._max_batch_size = max_batch_size
+        self._inference_mode = inference_mode
+        self._memory_format = (
+            torch.channels_last if channels_last else torch.contiguous_format
+        )
 
         self._logger.info(f"Using device: {self._device}")
         self._logger.info(f"Loading pre-trained model: {model_name}")
 
         try:
             self._model = timm.create_model(model_name.value, pretrained=True)
-            self._model = self._model.to(self._device)
+            self._model = self._model.to(
+                self._device, memory_format=self._memory_format
+            )
             self._model.eval()  # Set model to evaluation mode
 
-            # Get model-specific preprocessing steps
+            # Get model-specific preprocessing steps, applied to tensors so frames
+            # go straight from numpy to the model without a PIL round-trip
             data_config = timm.data.resolve_model_data_config(self._model)
-            self._transforms = timm.data.create_transform(
-                **data_config, is_training=False
+            self._input_size = data_config["input_size"]
+            self._resize = _create_resize_transform(data_config)
+            self._normalize = T.Compose(
+                [
+                    T.ConvertImageDtype(torch.float32),
+                    T.Normalize(mean=data_config["mean"], std=data_config["std"]),
+                ]
             )
+
+            # (num_classes, labels) 0/1 matrix: one matmul sums every label's
+            # probability mass for the whole batch
+            self._labels = LABELS
+            self._label_masks = _create_label_masks(
+                num_classes=self._model.num_classes,
+                indices=[self._cat_indices, self._dog_indices],
+            ).to(self._device)
+
+            if compile_model:
+                self._model = torch.compile(self._model)
+
             self._logger.info(f"Model {model_name} loaded successfully.")
             self._logger.info(f"Input size: {data_config.get('input_size')}")
             self._logger.info(f"Interpolation: {data_config.get('interpolation')}")
@@ -76,71 +122,111 @@ class PretrainedImageClassifier(ImageClassifier):
             raise
 
     def classify(self, images: list[Image]) -> list[Classification]:
-        classifications: List[Classification] = []
+        classifications = [
+            classification
+            for image_classifications in self.classify_each(images)
+            for classification in image_classifications
+        ]
+        self._logger.info(
+            f"Classification complete. Found {len(classifications)} cats/dogs."
+        )
+        return classifications
+
+    def classify_each(self, images: list[Image]) -> list[list[Classification]]:
         if not images:
-            return classifications
+            return []
 
         self._logger.info(f"Classifying {len(images)} image(s)...")
-        with torch.no_grad():  # Disable gradient calculations for inference
-            for i, image in enumerate(images):
+        results: List[List[Classification]] = []
+        grad_mode = torch.inference_mode if self._inference_mode else torch.no_grad
+        with grad_mode():  # Disable gradient tracking for inference
+            for start in range(0, len(images), self._max_batch_size):
+                batch = images[start : start + self._max_batch_size]
                 try:
-                    pil_image = image.pil_image
-                    if pil_image is None:
-                        self._logger.warning(
-                            f"Skipping image {i} as PIL image is None."
-                        )
-                        continue
-
-                    # Apply preprocessing
-                    input_tensor = self._transforms(pil_image).unsqueeze(
-                        0
-                    )  # Add batch dimension
-                    input_tensor = input_tensor.to(self._device)
-
-                    # Run inference
-                    output = self._model(input_tensor)
-                    # Apply Softmax to get probabilities
-                    probabilities = torch.nn.functional.softmax(output[0], dim=0)
-
-                    # Check probabilities for cat/dog classes
-                    prob_cat = torch.sum(probabilities[self._cat_indices]).item()
-                    prob_dog = torch.sum(probabilities[self._dog_indices]).item()
-
-                    # Create placeholder bounding box covering the whole image (0.0 to 1.0)
-                    # as this classifier doesn't provide localization.
-                    placeholder_bbox = BoundingBox(
-                        x_min=0.0, y_min=0.0, x_max=1.0, y_max=1.0
-                    )
-
-                    # Add classifications for both cat and dog if their probabilities are significant
-                    if prob_cat > 0.1:  # Threshold for cat detection
-                        classifications.append(
-                            Classification(
-                                label="cat",
-                                weight=prob_cat,
-                                bounding_box=placeholder_bbox,
-                            )
-                        )
-
-                    if prob_dog > 0.1:  # Threshold for dog detection
-                        classifications.append(
-                            Classification(
-                                label="dog",
-                                weight=prob_dog,
-                                bounding_box=placeholder_bbox,
-                            )
-                        )
-
-                    self._logger.debug(
-                        f"Image {i}: Cat Prob={prob_cat:.4f}, Dog Prob={prob_dog:.4f}"
-                    )
-
+                    results.extend(self._classify_batch(batch))
                 except Exception as e:
                     self._logger.error(
-                        f"Error processing image {i}: {e}", exc_info=True
+                        f"Error processing images {start}-{start + len(batch) - 1}: {e}",
+                        exc_info=True,
                     )
-
-        self._logger.info(
-            f"Classification complete. Found {len(classifications)} cats/dogs."
-        )
-        return classifications
+                    results.extend([] for _ in batch)
+        return results
+
+    def warm_up(self) -> None:
+        _, height, _ = self._input_size
+        self.classify_each(images=to_warm_up_images(height, self._max_batch_size))
+
+    def _classify_batch(self, images: list[Image]) -> List[List[Classification]]:
+        input_batch = torch.stack([self._to_input_tensor(image) for image in images])
+        input_batch = input_batch.to(self._device, memory_format=self._memory_format)
+
+        output = self._model(input_batch)
+        probabilities = torch.nn.functional.softmax(output, dim=1)
+
+        # (batch, labels) probability mass, copied to the host once per batch
+        label_probabilities = (probabilities @ self._label_masks).cpu().tolist()
+
+        # This classifier doesn't localize, so boxes cover the whole image
+        # (0.0 to 1.0).
+        results: List[List[Classification]] = []
+        for i, image_probabilities in enumerate(label_probabilities):
+            self._logger.debug(
+                f"Image {i}: "
+                + ", ".join(
+                    f"{label} Prob={probability:.4f}"
+                    for label, probability in zip(self._labels, image_probabilities)
+                )
+            )
+            results.append(
+                [
+                    Classification(
+                        label=label,
+                        weight=probability,
+                        bounding_box=BoundingBox(
+                            x_min=0.0, y_min=0.0, x_max=1.0, y_max=1.0
+                        ),
+                    )
+                    for label, probability in zip(self._labels, image_probabilities)
+                    if probability > MIN_PROBABILITY
+                ]
+            )
+        return results
+
+    def _to_input_tensor(self, image: Image) -> torch.Tensor:
+        array = np.atleast_3d(image.np_array)
+        if array.shape[2] == 1:
+            array = np.repeat(array, 3, axis=2)
+
+        # HWC uint8 view of the frame; slicing off alpha keeps positive strides
+        tensor = torch.from_numpy(array[:, :, :3]).permute(2, 0, 1)
+        tensor = self._resize(tensor)
+
+        # Reorder channels after resizing so only the small crop is flipped
+        if image.channel_order == ChannelOrder.BGR:
+            tensor = tensor.flip(0)
+
+        return self._normalize(tensor)
+
+
+def _create_resize_transform(data_config: dict[str, Any]) -> T.Compose:
+    """Tensor equivalent of timm's eval-time resize and center crop."""
+    _, height, width = data_config["input_size"]
+    crop_pct = data_config.get("crop_pct") or 1.0
+    interpolation = T.InterpolationMode(data_config.get("interpolation", "bilinear"))
+    return T.Compose(
+        [
+            T.Resize(
+                math.floor(min(height, width) / crop_pct),
+                interpolation=interpolation,
+                antialias=True,
+            ),
+            T.CenterCrop((height, width)),
+        ]
+    )
+
+
+def _create_label_masks(num_classes: int, indices: list[list[int]]) -> torch.Tensor:
+    masks = torch.zeros((num_classes, len(indices)), dtype=torch.float32)
+    for column, label_indices in enumerate(indices):
+        masks[label_indices, column] = 1.0
+    return masks
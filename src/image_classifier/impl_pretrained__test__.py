@@ -0,0 +1,11 @@
+import torch
+from src.image_classifier.impl_pretrained import _create_label_masks
+
+
+def test_label_masks_sum_probability_mass_per_label() -> None:
+    masks = _create_label_masks(num_classes=5, indices=[[0, 1], [3]])
+    probabilities = torch.tensor([[0.1, 0.2, 0.3, 0.4, 0.0], [0.0, 0.0, 0.0, 0.5, 0.5]])
+
+    label_probabilities = probabilities @ masks
+
+    assert torch.allclose(label_probabilities, torch.tensor([[0.3, 0.4], [0.0, 0.5]]))
@@ -0,0 +1,192 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Optional, Union
+import threading
+import numpy as np
+from src.image.channel_order import ChannelOrder
+from src.image.image import Image
+from src.library.life_cycle import LifeCycle
+from .interface import ImageClassifier, Classification
+
+DEFAULT_MAX_WORKERS = 1
+
+
+@dataclass(frozen=True)
+class _Frame:
+    """Where one image lives inside a shared memory block."""
+
+    offset: int
+    shape: tuple[int, ...]
+    dtype: str
+    channel_order: ChannelOrder
+
+
+class ProcessPoolImageClassifier(ImageClassifier, LifeCycle):
+    """
+    Runs another ImageClassifier in worker processes so inference does not
+    compete with the GUI, HTTP server and camera threads for the GIL.
+
+    create_image_classifier is called once in each worker to load the model, so
+    it must be picklable (a module-level function or functools.partial). Frames
+    are copied once into a shared memory block per call instead of pickled.
+    """
+
+    _create_image_classifier: Callable[[], ImageClassifier]
+    _max_workers: int
+    _executor: Optional[ProcessPoolExecutor]
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        create_image_classifier: Callable[[], ImageClassifier],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self._create_image_classifier = create_image_classifier
+        self._max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                return
+            # Spawn rather than fork: forking a process that already runs
+            # threads and torch is not safe.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._create_image_classifier,),
+            )
+
+    def stop(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def classify(self, images: list[Image]) -> list[Classification]:
+        if not images:
+            return []
+        return self._run_in_worker(images=images, each=False)
+
+    def classify_each(self, images: list[Image]) -> list[list[Classification]]:
+        if not images:
+            return []
+        return self._run_in_worker(images=images, each=True)
+
+    def warm_up(self) -> None:
+        """Workers warm up as they start; wait until every worker has."""
+        self.start()
+        assert self._executor is not None
+        futures = [
+            self._executor.submit(_is_worker_ready) for _ in range(self._max_workers)
+        ]
+        for future in futures:
+            future.result()
+
+    def _run_in_worker(self, images: list[Image], each: bool) -> Any:
+        self.start()
+        assert self._executor is not None
+
+        arrays = [image.np_array for image in images]
+        shared_memory = SharedMemory(
+            create=True, size=max(1, sum(array.nbytes for array in arrays))
+        )
+
+        try:
+            frames = _write_frames(
+                shared_memory=shared_memory,
+                arrays=arrays,
+                channel_orders=[image.channel_order for image in images],
+            )
+            future = self._executor.submit(
+                _classify_in_worker, shared_memory.name, frames, each
+            )
+            return future.result()
+        finally:
+            shared_memory.close()
+            shared_memory.unlink()
+
+
+def _write_frames(
+    shared_memory: SharedMemory,
+    arrays: list[np.ndarray],
+    channel_orders: list[ChannelOrder],
+) -> list[_Frame]:
+    frames = []
+    offset = 0
+
+    for array, channel_order in zip(arrays, channel_orders):
+        destination = np.ndarray(
+            array.shape, dtype=array.dtype, buffer=shared_memory.buf, offset=offset
+        )
+        destination[...] = array
+        frames.append(
+            _Frame(
+                offset=offset,
+                shape=array.shape,
+                dtype=array.dtype.str,
+                channel_order=channel_order,
+            )
+        )
+        offset += array.nbytes
+
+    return frames
+
+
+_worker_image_classifier: Optional[ImageClassifier] = None
+
+
+def _init_worker(create_image_classifier: Callable[[], ImageClassifier]) -> None:
+    global _worker_image_classifier
+    _worker_image_classifier = create_image_classifier()
+    _worker_image_classifier.warm_up()
+
+
+def _is_worker_ready() -> bool:
+    return _worker_image_classifier is not None
+
+
+def _classify_in_worker(
+    shared_memory_name: str, frames: list[_Frame], each: bool
+) -> Union[list[Classification], list[list[Classification]]]:
+    assert _worker_image_classifier is not None
+
+    shared_memory = SharedMemory(name=shared_memory_name)
+    images: list[Image] = []
+
+    try:
+        images = [
+            Image.from_np_array(
+                np.ndarray(
+                    frame.shape,
+                    dtype=np.dtype(frame.dtype),
+                    buffer=shared_memory.buf,
+                    offset=frame.offset,
+                ),
+                channel_order=frame.channel_order,
+            )
+            for frame in frames
+        ]
+        return (
+            _worker_image_classifier.classify_each(images=images)
+            if each
+            else _worker_image_classifier.classify(images=images)
+        )
+    finally:
+        # Views into the block must be gone before it can be closed.
+        images = []
+        try:
+            shared_memory.close()
+        except BufferError:
+            # A traceback in flight can still hold views; the mapping is then
+            # released when it is collected, and the classifier's own error
+            # is the one that surfaces.
+            pass
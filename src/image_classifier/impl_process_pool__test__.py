@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+from src.image.channel_order import ChannelOrder
+from src.image.image import Image
+from src.image_classifier.bounding_box import BoundingBox
+from src.image_classifier.classification import Classification
+from src.image_classifier.impl_process_pool import ProcessPoolImageClassifier
+from src.image_classifier.interface import ImageClassifier
+
+
+class _EchoImageClassifier(ImageClassifier):
+    """Reports what arrived in the worker so the test can check the frames."""
+
+    def classify(self, images: list[Image]) -> list[Classification]:
+        return [
+            Classification(
+                label=image.channel_order.value,
+                weight=float(image.np_array[0, 0, 0]),
+                bounding_box=BoundingBox(x_max=image.width, y_max=image.height),
+            )
+            for image in images
+        ]
+
+
+def test_frames_reach_worker_through_shared_memory() -> None:
+    image_classifier = ProcessPoolImageClassifier(
+        create_image_classifier=_EchoImageClassifier
+    )
+
+    images = [
+        Image.from_np_array(np.full((4, 6, 3), 7, dtype=np.uint8)),
+        Image.from_np_array(
+            np.full((2, 3, 3), 9, dtype=np.uint8), channel_order=ChannelOrder.BGR
+        ),
+    ]
+
+    try:
+        results = image_classifier.classify(images=images)
+    finally:
+        image_classifier.stop()
+
+    assert results == [
+        Classification(
+            label="rgb", weight=7, bounding_box=BoundingBox(x_max=6, y_max=4)
+        ),
+        Classification(
+            label="bgr", weight=9, bounding_box=BoundingBox(x_max=3, y_max=2)
+        ),
+    ]
+
+
+def test_classify_each_keeps_results_per_image() -> None:
+    image_classifier = ProcessPoolImageClassifier(
+        create_image_classifier=_EchoImageClassifier
+    )
+
+    images = [
+        Image.from_np_array(np.full((4, 6, 3), value, dtype=np.uint8))
+        for value in (3, 5)
+    ]
+
+    try:
+        results = image_classifier.classify_each(images=images)
+    finally:
+        image_classifier.stop()
+
+    assert [[c.weight for c in result] for result in results] == [[3], [5]]
+
+
+class _WarmUpReportingImageClassifier(ImageClassifier):
+    def __init__(self) -> None:
+        self._warm = False
+
+    def warm_up(self) -> None:
+        self._warm = True
+
+    def classify(self, images: list[Image]) -> list[Classification]:
+        return [Classification(label="warm" if self._warm else "cold")]
+
+
+def test_workers_warm_up_before_classifying() -> None:
+    image_classifier = ProcessPoolImageClassifier(
+        create_image_classifier=_WarmUpReportingImageClassifier
+    )
+
+    try:
+        image_classifier.warm_up()
+        results = image_classifier.classify(
+            images=[Image.from_np_array(np.zeros((2, 2, 3), dtype=np.uint8))]
+        )
+    finally:
+        image_classifier.stop()
+
+    assert results == [Classification(label="warm")]
+
+
+class _FailingImageClassifier(ImageClassifier):
+    def classify(self, images: list[Image]) -> list[Classification]:
+        raise ValueError(f"cannot classify {len(images)} images")
+
+
+class _ViewHoldingImageClassifier(ImageClassifier):
+    """Exports the worker's shared memory mapping, so closing it raises BufferError."""
+
+    def __init__(self) -> None:
+        self._views: list[np.ndarray] = []
+
+    def classify(self, images: list[Image]) -> list[Classification]:
+        # Held by the traceback while the worker closes the block.
+        view = np.frombuffer(images[0].np_array.base, dtype=np.uint8)
+        if images[0].np_array[0, 0, 0] == 0:
+            raise ValueError(f"cannot classify {view.size} bytes")
+        # Held past the call.
+        self._views.append(view)
+        return [Classification(label="held")]
+
+
+def test_classifier_error_reaches_the_caller() -> None:
+    image_classifier = ProcessPoolImageClassifier(
+        create_image_classifier=_FailingImageClassifier
+    )
+
+    try:
+        with pytest.raises(ValueError, match="cannot classify 1 images"):
+            image_classifier.classify(
+                images=[Image.from_np_array(np.zeros((2, 2, 3), dtype=np.uint8))]
+            )
+    finally:
+        image_classifier.stop()
+
+
+def test_view_held_while_closing_does_not_mask_the_result() -> None:
+    image_classifier = ProcessPoolImageClassifier(
+        create_image_classifier=_ViewHoldingImageClassifier
+    )
+
+    try:
+        with pytest.raises(ValueError, match="cannot classify"):
+            image_classifier.classify(
+                images=[Image.from_np_array(np.zeros((2, 2, 3), dtype=np.uint8))]
+            )
+        results = image_classifier.classify(
+            images=[Image.from_np_array(np.ones((2, 2, 3), dtype=np.uint8))]
+        )
+    finally:
+        image_classifier.stop()
+
+    assert results == [Classification(label="held")]
@@ -1,9 +1,12 @@
+import numpy as np
 from ultralytics import YOLO  # type: ignore
+from src.image.channel_order import ChannelOrder
 from src.image.image import Image
 from src.image_classifier.bounding_box import BoundingBox
-from .interface import ImageClassifier, Classification
+from src.image_classifier.crop import CropTransform, crop_and_resize, validate_region
+from .interface import ImageClassifier, Classification, to_warm_up_images
 from enum import Enum
-from typing import Iterator
+from typing import Iterator, Optional
 
 
 class YoloModelSize(Enum):
@@ -19,6 +22,8 @@ class YoloModelSize(Enum):
 
 COCO_DATASET_CLASS_INDICES = {"cat": 15, "dog": 16}
 DEFAULT_CONFIDENCE_THRESHOLD = 0.5
+DEFAULT_MAX_BATCH_SIZE = 8
+DEFAULT_IMAGE_SIZE = 640
 
 
 class YoloImageClassifier(ImageClassifier):
@@ -26,51 +31,104 @@ class YoloImageClassifier(ImageClassifier):
         self,
         model_size: YoloModelSize,
         confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        region_of_interest: Optional[BoundingBox] = None,
+        image_size: int = DEFAULT_IMAGE_SIZE,
     ) -> None:
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        if image_size < 32:
+            raise ValueError(f"image_size must be at least 32, got {image_size}")
+        if region_of_interest is not None:
+            validate_region(region_of_interest)
+
         self._model = YOLO(model_size.to_filename())
         self._confidence_threshold = confidence_threshold
         self._class_indices = COCO_DATASET_CLASS_INDICES
+        self._max_batch_size = max_batch_size
+        self._region_of_interest = region_of_interest
+        self._image_size = image_size
 
     def classify(self, images: list[Image]) -> list[Classification]:
+        return [
+            classification
+            for classifications in self._classify_images(images)
+            for classification in classifications
+        ]
+
+    def classify_each(self, images: list[Image]) -> list[list[Classification]]:
         return list(self._classify_images(images))
 
+    def warm_up(self) -> None:
+        self.classify_each(
+            images=to_warm_up_images(self._image_size, self._max_batch_size)
+        )
+
     def _classify_images(
         self,
         images: list[Image],
-    ) -> Iterator[Classification]:
-        for image in images:
+    ) -> Iterator[list[Classification]]:
+        for batch in _to_batches(images, self._max_batch_size):
+            inputs = [
+                crop_and_resize(
+                    _to_model_input(image),
+                    region=self._region_of_interest,
+                    max_size=self._image_size,
+                )
+                for image in batch
+            ]
             results = self._model(
-                source=image.pil_image,
+                source=[np.ascontiguousarray(array) for array, _ in inputs],
                 conf=self._confidence_threshold,
                 classes=list(self._class_indices.values()),
+                imgsz=self._image_size,
                 verbose=False,
             )
-            yield from self._classify_image(results=results)
+            for result, (_, transform) in zip(results, inputs):
+                yield list(self._classify_image(result=result, transform=transform))
 
     def _classify_image(
         self,
-        results: list,
+        result,
+        transform: CropTransform,
     ) -> Iterator[Classification]:
+        boxes = result.boxes
+        # Boxes are relative to the cropped, resized input; map them back
+        # so callers always see full-frame pixel coordinates.
+        xyxy = transform.to_frame(boxes.xyxy.cpu().numpy())
+        confidences = boxes.conf.cpu().numpy()
+        class_ids = boxes.cls.cpu().numpy().astype(int)
 
-        for result in results:
-            boxes = result.boxes
+        for (x_min, y_min, x_max, y_max), confidence, class_id in zip(
+            xyxy.tolist(), confidences.tolist(), class_ids.tolist()
+        ):
+            label = next(
+                (k for k, v in self._class_indices.items() if v == class_id),
+                "unknown",
+            )
 
-            for box in boxes:
-                confidence = float(box.conf[0])
-                class_id = int(box.cls[0])
+            bounding_box = BoundingBox(
+                x_min=x_min,
+                y_min=y_min,
+                x_max=x_max,
+                y_max=y_max,
+            )
 
-                label = next(
-                    (k for k, v in self._class_indices.items() if v == class_id),
-                    "unknown",
-                )
+            yield Classification(
+                label=label, weight=confidence, bounding_box=bounding_box
+            )
 
-                bounding_box = BoundingBox(
-                    x_min=float(box.xyxy[0][0]),
-                    y_min=float(box.xyxy[0][1]),
-                    x_max=float(box.xyxy[0][2]),
-                    y_max=float(box.xyxy[0][3]),
-                )
 
-                yield Classification(
-                    label=label, weight=confidence, bounding_box=bounding_box
-                )
+def _to_batches(images: list[Image], max_batch_size: int) -> Iterator[list[Image]]:
+    for start in range(0, len(images), max_batch_size):
+        yield images[start : start + max_batch_size]
+
+
+def _to_model_input(image: Image) -> np.ndarray:
+    """
+    Ultralytics expects numpy sources in OpenCV's BGR channel order. Returns a
+    view where possible so cropping happens before anything is copied.
+    """
+    if image.channels == 1:
+        return np.repeat(np.atleast_3d(image.np_array), 3, axis=2)
+    return image.to_np_array(ChannelOrder.BGR)[:, :, :3]
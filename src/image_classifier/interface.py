@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+import numpy as np
+from src.image.channel_order import ChannelOrder
 from src.image.image import Image
 from src.image_classifier.classification import Classification
 
@@ -7,3 +9,28 @@ class ImageClassifier(ABC):
     @abstractmethod
     def classify(self, images: list[Image]) -> list[Classification]:
         pass
+
+    def classify_each(self, images: list[Image]) -> list[list[Classification]]:
+        """
+        Classifications per image, in the order of images. Implementations that
+        run images as one model batch should override this; the default
+        classifies one image at a time.
+        """
+        return [self.classify(images=[image]) for image in images]
+
+    def warm_up(self) -> None:
+        """
+        Pay model loading and first-inference setup now rather than on the
+        first real frame. Returns once the classifier runs at steady-state
+        speed. The default does nothing.
+        """
+        pass
+
+
+def to_warm_up_images(image_size: int, batch_size: int) -> list[Image]:
+    """Blank frames at the model's input size for warm-up inference."""
+    array = np.zeros((image_size, image_size, 3), dtype=np.uint8)
+    return [
+        Image.from_np_array(array, channel_order=ChannelOrder.BGR)
+        for _ in range(batch_size)
+    ]
@@ -0,0 +1,49 @@
+import numpy as np
+
+
+def non_max_suppression(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    class_ids: np.ndarray,
+    iou_threshold: float,
+    max_detections: int = 300,
+) -> np.ndarray:
+    """
+    Indices of the boxes to keep, highest score first. boxes is (N, 4) as
+    x_min, y_min, x_max, y_max. Boxes only suppress boxes of the same class:
+    each class is shifted by a large offset so boxes of different classes
+    never overlap, as ultralytics does.
+    """
+    if len(boxes) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    offset = class_ids.astype(np.float32)[:, None] * (float(boxes.max()) + 1)
+    shifted = boxes.astype(np.float32) + offset
+    x_min, y_min, x_max, y_max = shifted.T
+    areas = np.clip(x_max - x_min, 0, None) * np.clip(y_max - y_min, 0, None)
+
+    order = np.argsort(-scores, kind="stable")
+    keep: list[int] = []
+
+    while order.size > 0 and len(keep) < max_detections:
+        best, rest = order[0], order[1:]
+        keep.append(int(best))
+
+        overlap_width = np.clip(
+            np.minimum(x_max[best], x_max[rest]) - np.maximum(x_min[best], x_min[rest]),
+            0,
+            None,
+        )
+        overlap_height = np.clip(
+            np.minimum(y_max[best], y_max[rest]) - np.maximum(y_min[best], y_min[rest]),
+            0,
+            None,
+        )
+        intersection = overlap_width * overlap_height
+        union = areas[best] + areas[rest] - intersection
+        iou = np.divide(
+            intersection, union, out=np.zeros_like(intersection), where=union > 0
+        )
+        order = rest[iou <= iou_threshold]
+
+    return np.array(keep, dtype=np.int64)
@@ -0,0 +1,24 @@
+import numpy as np
+from src.image_classifier.nms import non_max_suppression
+
+
+def test_overlapping_boxes_of_one_class_keep_the_best() -> None:
+    boxes = np.array(
+        [[0, 0, 10, 10], [1, 1, 11, 11], [50, 50, 60, 60]], dtype=np.float32
+    )
+    scores = np.array([0.6, 0.9, 0.7], dtype=np.float32)
+    class_ids = np.array([0, 0, 0])
+
+    keep = non_max_suppression(boxes, scores, class_ids, iou_threshold=0.5)
+
+    assert keep.tolist() == [1, 2]
+
+
+def test_boxes_of_different_classes_do_not_suppress_each_other() -> None:
+    boxes = np.array([[0, 0, 10, 10], [0, 0, 10, 10]], dtype=np.float32)
+    scores = np.array([0.8, 0.9], dtype=np.float32)
+    class_ids = np.array([15, 16])
+
+    keep = non_max_suppression(boxes, scores, class_ids, iou_threshold=0.5)
+
+    assert keep.tolist() == [1, 0]
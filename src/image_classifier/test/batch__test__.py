@@ -0,0 +1,28 @@
+from src.assets import assets_dir
+from src.image.image import Image
+from src.image_classifier.impl_yolo import YoloImageClassifier, YoloModelSize
+import pytest
+
+
+@pytest.mark.slow
+def test_batch_matches_single_image_results() -> None:
+    image_classifier = YoloImageClassifier(
+        model_size=YoloModelSize.EXTRA_LARGE,
+        max_batch_size=2,
+    )
+
+    images = [
+        Image.from_file(assets_dir("images/dog_clear_front/1.jpeg")),
+        Image.from_file(assets_dir("images/cat_clear_front/1.jpeg")),
+        Image.from_file(assets_dir("images/empty_security_footage/1.jpeg")),
+    ]
+
+    batched = image_classifier.classify(images=images)
+
+    single = [
+        classification
+        for image in images
+        for classification in image_classifier.classify(images=[image])
+    ]
+
+    assert [c.label for c in batched] == [c.label for c in single]
@@ -0,0 +1,53 @@
+from src.assets import assets_dir
+from src.image.image import Image
+from src.image_classifier.bounding_box import BoundingBox
+from src.image_classifier.impl_yolo import YoloImageClassifier, YoloModelSize
+import pytest
+
+# torch letterboxes to the minimal stride-aligned rectangle while ONNX runs on
+# the full square, so scores and boxes differ slightly.
+WEIGHT_TOLERANCE = 0.05
+# In full-frame pixels.
+BOX_TOLERANCE = 8.0
+
+
+@pytest.mark.slow
+def test_onnx_matches_torch_results() -> None:
+    pytest.importorskip("onnxruntime")
+    from src.image_classifier.impl_onnx import OnnxYoloImageClassifier
+
+    images = [
+        Image.from_file(assets_dir("images/dog_clear_front/1.jpeg")),
+        Image.from_file(assets_dir("images/cat_clear_front/1.jpeg")),
+        Image.from_file(assets_dir("images/empty_security_footage/1.jpeg")),
+    ]
+
+    torch_results = YoloImageClassifier(model_size=YoloModelSize.NANO).classify_each(
+        images=images
+    )
+    onnx_results = OnnxYoloImageClassifier(model_size=YoloModelSize.NANO).classify_each(
+        images=images
+    )
+
+    assert [[c.label for c in result] for result in onnx_results] == [
+        [c.label for c in result] for result in torch_results
+    ]
+    for onnx_result, torch_result in zip(onnx_results, torch_results):
+        for onnx_classification, torch_classification in zip(onnx_result, torch_result):
+            assert onnx_classification.weight == pytest.approx(
+                torch_classification.weight, abs=WEIGHT_TOLERANCE
+            )
+            assert onnx_classification.bounding_box is not None
+            assert torch_classification.bounding_box is not None
+            assert _to_xyxy(onnx_classification.bounding_box) == pytest.approx(
+                _to_xyxy(torch_classification.bounding_box), abs=BOX_TOLERANCE
+            )
+
+
+def _to_xyxy(bounding_box: BoundingBox) -> list[float]:
+    return [
+        bounding_box.x_min,
+        bounding_box.y_min,
+        bounding_box.x_max,
+        bounding_box.y_max,
+    ]
@@ -0,0 +1,165 @@
+from typing import Callable, Generic, TypeVar, Optional, List
+import asyncio
+import queue
+import logging
+from src.library.effect_executor import AsyncEffectExecutor
+from src.library.life_cycle import LifeCycle
+from src.library.pub_sub import Delivery, PubSub, Sub
+
+Model = TypeVar("Model")
+Msg = TypeVar("Msg")
+Effect = TypeVar("Effect")
+
+
+class _LoopQueue(queue.Queue[Msg]):
+    """
+    The queue.Queue that interpret_effect puts msgs on, forwarding every put
+    to an asyncio.Queue on the loop. Safe to put from any thread.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, msgs: "asyncio.Queue[Optional[Msg]]"
+    ) -> None:
+        super().__init__()
+        self._loop = loop
+        self._msgs = msgs
+
+    def put(
+        self, item: Msg, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        self._loop.call_soon_threadsafe(self._msgs.put_nowait, item)
+
+    def put_nowait(self, item: Msg) -> None:
+        self.put(item)
+
+
+class AsyncStateMachine(Generic[Model, Msg, Effect], LifeCycle):
+    """
+    StateMachine on an asyncio loop, with the same init, transition and
+    interpret_effect. Msgs are awaited instead of polled and effects run as
+    tasks through an AsyncEffectExecutor, which hands their blocking bodies to
+    threads. This lets a door share the loop of an HTTP server.
+
+    start must be called on the loop; stop may be called from any thread.
+    """
+
+    _init: Callable[[], tuple[Model, List[Effect]]]
+    _transition: Callable[[Model, Msg], tuple[Model, List[Effect]]]
+    _interpret_effect: Callable[[Model, Effect, queue.Queue[Msg]], None]
+    _msg_queue: Optional[_LoopQueue[Msg]]
+    _msgs_in: Optional["asyncio.Queue[Optional[Msg]]"]
+    _model: Optional[Model]
+    _task: Optional["asyncio.Task[None]"]
+    _loop: Optional[asyncio.AbstractEventLoop]
+    _logger: logging.Logger
+    _models: PubSub[Model]
+    _msgs: PubSub[Msg]
+    _should_log: bool
+    _effect_executor: AsyncEffectExecutor[Effect]
+
+    def __init__(
+        self,
+        init: Callable[[], tuple[Model, List[Effect]]],
+        transition: Callable[[Model, Msg], tuple[Model, List[Effect]]],
+        interpret_effect: Callable[[Model, Effect, queue.Queue[Msg]], None],
+        logger: logging.Logger,
+        should_log: bool = False,
+        effect_executor: Optional[AsyncEffectExecutor[Effect]] = None,
+    ) -> None:
+        self._init = init
+        self._transition = transition
+        self._interpret_effect = interpret_effect
+        self._msg_queue = None
+        self._msgs_in = None
+        self._model = None
+        self._models = PubSub[Model](delivery=Delivery.CONFLATED)
+        self._msgs = PubSub[Msg](delivery=Delivery.QUEUED)
+        self._task = None
+        self._loop = None
+        self._logger = logger.getChild("state_machine")
+        self._should_log = should_log
+        self._effect_executor = (
+            effect_executor
+            if effect_executor is not None
+            else AsyncEffectExecutor[Effect](logger=self._logger)
+        )
+
+    def models(self) -> Sub[Model]:
+        return self._models
+
+    def msgs(self) -> Sub[Msg]:
+        return self._msgs
+
+    def _submit_effect(self, model: Model, effect: Effect) -> None:
+        if self._should_log:
+            self._logger.info("Effect: %s", effect)
+
+        msg_queue = self._msg_queue
+        assert msg_queue is not None
+        self._effect_executor.submit(
+            effect,
+            lambda: self._interpret_effect(model, effect, msg_queue),
+        )
+
+    def _handle_output(self, model: Model, effects: List[Effect]) -> None:
+        self._models.publish(model)
+        self._model = model
+        for effect in effects:
+            self._submit_effect(model, effect)
+
+    async def _run(self) -> None:
+        msgs_in = self._msgs_in
+        assert msgs_in is not None
+
+        model, effects = self._init()
+        self._handle_output(model, effects)
+
+        while True:
+            msg = await msgs_in.get()
+            if msg is None:
+                return
+
+            if self._model is None:
+                continue
+
+            self._msgs.publish(msg)
+            model, effects = self._transition(self._model, msg)
+
+            if self._should_log:
+                self._logger.info(
+                    f"Transition:\n\tmodel={self._model.__dict__}\n\tmsg={msg.__dict__}\n\tnew_model={model.__dict__}\n\teffects=[{', '.join(str(effect.__dict__) for effect in effects)}]"
+                )
+            self._handle_output(model, effects)
+
+    def start(self) -> None:
+        self._logger.info("Starting")
+        if self._task is not None and not self._task.done():
+            self._logger.info("Already started")
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._msgs_in = asyncio.Queue()
+        self._msg_queue = _LoopQueue(self._loop, self._msgs_in)
+        self._effect_executor.start()
+        self._task = self._loop.create_task(self._run())
+
+        self._logger.info("Started")
+
+    def stop(self) -> None:
+        self._logger.info("Stopping")
+        if self._task is None or self._loop is None:
+            self._logger.info("Already stopped")
+            return
+
+        msgs_in = self._msgs_in
+        assert msgs_in is not None
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(msgs_in.put_nowait, None)
+        self._task = None
+
+        self._effect_executor.stop()
+        # Subscriber threads would otherwise outlive the machine.
+        self._models.close()
+        self._msgs.close()
+
+        self._logger.info("Stopped")
@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+import asyncio
+import logging
+import queue
+import threading
+from src.library.async_state_machine import AsyncStateMachine
+
+
+@dataclass(frozen=True)
+class _MsgAdd:
+    amount: int
+
+
+@dataclass(frozen=True)
+class _EffectAdd:
+    amount: int
+
+
+def _init() -> tuple[int, list[_EffectAdd]]:
+    return 0, [_EffectAdd(amount=1), _EffectAdd(amount=2)]
+
+
+def _transition(model: int, msg: _MsgAdd) -> tuple[int, list[_EffectAdd]]:
+    return model + msg.amount, []
+
+
+def test_effects_run_off_the_loop_and_feed_msgs_back() -> None:
+    loop_threads: set[int] = set()
+    effect_threads: set[int] = set()
+
+    def interpret_effect(
+        model: int, effect: _EffectAdd, msg_queue: queue.Queue[_MsgAdd]
+    ) -> None:
+        effect_threads.add(threading.get_ident())
+        msg_queue.put(_MsgAdd(amount=effect.amount))
+
+    state_machine = AsyncStateMachine[int, _MsgAdd, _EffectAdd](
+        init=_init,
+        transition=_transition,
+        interpret_effect=interpret_effect,
+        logger=logging.getLogger("test"),
+    )
+    models: list[int] = []
+    done = threading.Event()
+
+    def on_model(model: int) -> None:
+        models.append(model)
+        if model == 3:
+            done.set()
+
+    state_machine.models().subscribe(on_model)
+
+    async def run() -> None:
+        loop_threads.add(threading.get_ident())
+        state_machine.start()
+        try:
+            assert await asyncio.to_thread(done.wait, 1)
+        finally:
+            state_machine.stop()
+
+    asyncio.run(run())
+
+    assert models[-1] == 3
+    assert effect_threads and not effect_threads & loop_threads
+    # Stopping also ends the subscribers' delivery threads.
+    assert state_machine._models._subs == []
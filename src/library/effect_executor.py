@@ -0,0 +1,304 @@
+from collections import deque
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+import asyncio
+import logging
+import threading
+from src.library.life_cycle import LifeCycle
+
+Effect = TypeVar("Effect")
+
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass
+class _Pending(Generic[Effect]):
+    key: Hashable
+    supersession_key: Optional[Hashable]
+    effect: Effect
+    run: Callable[[], None]
+
+
+class EffectExecutor(Generic[Effect], LifeCycle):
+    """
+    Runs effects on a bounded pool of worker threads so slow effects never
+    block the caller.
+
+    Effects are grouped by a key (their type by default). A group can be
+    limited to a number of concurrently running effects, and a group can be
+    marked as superseding: submitting an effect drops any effect of the same
+    group that is still waiting for a worker, since only the newest matters.
+    to_supersession_key replaces the superseding groups when supersession
+    needs a finer key than concurrency, e.g. per camera under a shared limit;
+    it returns None for effects that are never superseded.
+    """
+
+    _to_key: Callable[[Effect], Hashable]
+    _concurrency_limits: dict[Hashable, int]
+    _superseding_keys: set[Hashable]
+    _to_supersession_key: Optional[Callable[[Effect], Optional[Hashable]]]
+    _max_workers: int
+    _pending: deque[_Pending[Effect]]
+    _running_counts: dict[Hashable, int]
+    _condition: threading.Condition
+    _workers: list[threading.Thread]
+    _running: bool
+    _logger: logging.Logger
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        to_key: Optional[Callable[[Effect], Hashable]] = None,
+        concurrency_limits: Optional[dict[Hashable, int]] = None,
+        superseding_keys: Optional[set[Hashable]] = None,
+        to_supersession_key: Optional[Callable[[Effect], Optional[Hashable]]] = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self._to_key = to_key if to_key is not None else type
+        self._concurrency_limits = dict(concurrency_limits or {})
+        self._superseding_keys = set(superseding_keys or set())
+        self._to_supersession_key = to_supersession_key
+        self._max_workers = max_workers
+        self._pending = deque()
+        self._running_counts = {}
+        self._condition = threading.Condition()
+        self._workers = []
+        self._running = False
+        self._logger = logger.getChild("effect_executor")
+
+    def submit(self, effect: Effect, run: Callable[[], None]) -> None:
+        """Queue an effect; run is called on a worker thread."""
+        key = self._to_key(effect)
+        supersession_key = (
+            self._to_supersession_key(effect)
+            if self._to_supersession_key is not None
+            else (key if key in self._superseding_keys else None)
+        )
+
+        with self._condition:
+            _supersede(self._pending, supersession_key, self._logger)
+            self._pending.append(
+                _Pending(
+                    key=key,
+                    supersession_key=supersession_key,
+                    effect=effect,
+                    run=run,
+                )
+            )
+            self._condition.notify()
+
+    def pending_count(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def _take_runnable(self) -> Optional[_Pending[Effect]]:
+        """Caller holds the lock."""
+        return _take_runnable(
+            self._pending, self._concurrency_limits, self._running_counts
+        )
+
+    def _worker(self) -> None:
+        while True:
+            with self._condition:
+                pending = self._take_runnable()
+                while pending is None and self._running:
+                    self._condition.wait()
+                    pending = self._take_runnable()
+
+                if pending is None:
+                    return
+
+                self._running_counts[pending.key] = (
+                    self._running_counts.get(pending.key, 0) + 1
+                )
+
+            try:
+                pending.run()
+            except Exception:
+                self._logger.exception("Effect failed: %s", pending.effect)
+            finally:
+                with self._condition:
+                    self._running_counts[pending.key] -= 1
+                    # A freed slot may unblock an effect another worker skipped.
+                    self._condition.notify_all()
+
+    def start(self) -> None:
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+
+        self._workers = [
+            threading.Thread(target=self._worker, daemon=True)
+            for _ in range(self._max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def stop(self) -> None:
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            self._pending.clear()
+            self._condition.notify_all()
+
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+
+class AsyncEffectExecutor(Generic[Effect], LifeCycle):
+    """
+    EffectExecutor for an asyncio loop: same grouping, concurrency limits and
+    supersession, but every effect runs as a task on the loop that started
+    the executor, and its blocking body is handed to executor (the loop's
+    default thread pool when None). max_workers bounds how many effects run
+    at once, so a door never takes more than that many pool threads.
+
+    start and submit must be called on the loop; stop may be called from any
+    thread.
+    """
+
+    _to_key: Callable[[Effect], Hashable]
+    _concurrency_limits: dict[Hashable, int]
+    _superseding_keys: set[Hashable]
+    _to_supersession_key: Optional[Callable[[Effect], Optional[Hashable]]]
+    _max_workers: int
+    _executor: Optional[Executor]
+    _pending: deque[_Pending[Effect]]
+    _running_counts: dict[Hashable, int]
+    _tasks: set[asyncio.Task[None]]
+    _loop: Optional[asyncio.AbstractEventLoop]
+    _running: bool
+    _logger: logging.Logger
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        to_key: Optional[Callable[[Effect], Hashable]] = None,
+        concurrency_limits: Optional[dict[Hashable, int]] = None,
+        superseding_keys: Optional[set[Hashable]] = None,
+        to_supersession_key: Optional[Callable[[Effect], Optional[Hashable]]] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self._to_key = to_key if to_key is not None else type
+        self._concurrency_limits = dict(concurrency_limits or {})
+        self._superseding_keys = set(superseding_keys or set())
+        self._to_supersession_key = to_supersession_key
+        self._max_workers = max_workers
+        self._executor = executor
+        self._pending = deque()
+        self._running_counts = {}
+        self._tasks = set()
+        self._loop = None
+        self._running = False
+        self._logger = logger.getChild("effect_executor")
+
+    def submit(self, effect: Effect, run: Callable[[], None]) -> None:
+        """Queue an effect; run is called on an executor thread."""
+        key = self._to_key(effect)
+        supersession_key = (
+            self._to_supersession_key(effect)
+            if self._to_supersession_key is not None
+            else (key if key in self._superseding_keys else None)
+        )
+
+        _supersede(self._pending, supersession_key, self._logger)
+        self._pending.append(
+            _Pending(
+                key=key,
+                supersession_key=supersession_key,
+                effect=effect,
+                run=run,
+            )
+        )
+        self._dispatch()
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def _dispatch(self) -> None:
+        while self._running and len(self._tasks) < self._max_workers:
+            pending = _take_runnable(
+                self._pending, self._concurrency_limits, self._running_counts
+            )
+            if pending is None:
+                return
+
+            self._running_counts[pending.key] = (
+                self._running_counts.get(pending.key, 0) + 1
+            )
+            assert self._loop is not None
+            task = self._loop.create_task(self._run(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending: _Pending[Effect]) -> None:
+        assert self._loop is not None
+        try:
+            await self._loop.run_in_executor(self._executor, pending.run)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._logger.exception("Effect failed: %s", pending.effect)
+        finally:
+            self._running_counts[pending.key] -= 1
+            # A freed slot may unblock an effect that was skipped.
+            self._loop.call_soon(self._dispatch)
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._running = True
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+
+        assert self._loop is not None
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._cancel)
+
+    def _cancel(self) -> None:
+        """Drop waiting effects. Bodies already on a thread run to completion."""
+        self._pending.clear()
+        for task in list(self._tasks):
+            task.cancel()
+
+
+def _supersede(
+    pending: deque[_Pending[Effect]],
+    supersession_key: Optional[Hashable],
+    logger: logging.Logger,
+) -> None:
+    if supersession_key is None:
+        return
+    superseded = [p for p in pending if p.supersession_key == supersession_key]
+    for p in superseded:
+        pending.remove(p)
+        logger.debug("Superseded: %s", p.effect)
+
+
+def _take_runnable(
+    pending: deque[_Pending[Effect]],
+    concurrency_limits: dict[Hashable, int],
+    running_counts: dict[Hashable, int],
+) -> Optional[_Pending[Effect]]:
+    """Remove and return the oldest pending effect whose group has a free slot."""
+    for p in pending:
+        limit = concurrency_limits.get(p.key)
+        if limit is None or running_counts.get(p.key, 0) < limit:
+            pending.remove(p)
+            return p
+    return None
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import threading
+from src.library.effect_executor import AsyncEffectExecutor, EffectExecutor
+
+
+def test_slow_effect_does_not_block_others() -> None:
+    executor = EffectExecutor[str](logger=logging.getLogger("test"), max_workers=2)
+    executor.start()
+
+    release = threading.Event()
+    fast_done = threading.Event()
+
+    executor.submit("slow", release.wait)
+    executor.submit("fast", fast_done.set)
+
+    assert fast_done.wait(timeout=1)
+
+    release.set()
+    executor.stop()
+
+
+def test_concurrency_limit_and_supersession() -> None:
+    executor = EffectExecutor[str](
+        logger=logging.getLogger("test"),
+        max_workers=4,
+        to_key=lambda effect: effect.split(":")[0],
+        concurrency_limits={"classify": 1},
+        superseding_keys={"classify"},
+    )
+    executor.start()
+
+    release = threading.Event()
+    started = threading.Event()
+    ran: list[str] = []
+    last_done = threading.Event()
+
+    def first() -> None:
+        started.set()
+        release.wait()
+        ran.append("classify:1")
+
+    executor.submit("classify:1", first)
+    assert started.wait(timeout=1)
+
+    executor.submit("classify:2", lambda: ran.append("classify:2"))
+    executor.submit("classify:3", lambda: (ran.append("classify:3"), last_done.set()))
+
+    assert executor.pending_count() == 1
+
+    release.set()
+    assert last_done.wait(timeout=1)
+    executor.stop()
+
+    assert ran == ["classify:1", "classify:3"]
+
+
+def test_async_executor_applies_concurrency_limit_and_supersession() -> None:
+    async def run() -> list[str]:
+        executor = AsyncEffectExecutor[str](
+            logger=logging.getLogger("test"),
+            max_workers=4,
+            to_key=lambda effect: effect.split(":")[0],
+            concurrency_limits={"classify": 1},
+            superseding_keys={"classify"},
+        )
+        executor.start()
+
+        release = threading.Event()
+        started = threading.Event()
+        ran: list[str] = []
+        last_done = threading.Event()
+
+        def first() -> None:
+            started.set()
+            release.wait()
+            ran.append("classify:1")
+
+        executor.submit("classify:1", first)
+        await asyncio.to_thread(started.wait, 1)
+
+        executor.submit("classify:2", lambda: ran.append("classify:2"))
+        executor.submit(
+            "classify:3", lambda: (ran.append("classify:3"), last_done.set())
+        )
+        assert executor.pending_count() == 1
+
+        release.set()
+        assert await asyncio.to_thread(last_done.wait, 1)
+        executor.stop()
+        return ran
+
+    assert asyncio.run(run()) == ["classify:1", "classify:3"]
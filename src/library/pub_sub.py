@@ -1,10 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Callable, Generic, List
+from collections import deque
+from enum import Enum
+from typing import TypeVar, Callable, Generic, List, Optional
+import logging
 import queue
+import threading
 
 T = TypeVar("T")
 U = TypeVar("U")
 
+DEFAULT_MAX_PENDING = 100
+DEFAULT_MAX_QUEUED = 100
+
+_logger = logging.getLogger(__name__)
+
 
 class Pub(ABC, Generic[T]):
     @abstractmethod
@@ -14,7 +23,11 @@ class Pub(ABC, Generic[T]):
 
 class Sub(ABC, Generic[T]):
     @abstractmethod
-    def subscribe(self, observer: Callable[[T], None]) -> Callable[[], None]:
+    def subscribe(
+        self,
+        observer: Callable[[T], None],
+        delivery: "Optional[Delivery]" = None,
+    ) -> Callable[[], None]:
         pass
 
     @abstractmethod
@@ -28,33 +41,243 @@ class Sub(ABC, Generic[T]):
         pass
 
 
+class Overflow(Enum):
+    """What to drop when the pending buffer is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+class Delivery(Enum):
+    """How published values reach a subscriber."""
+
+    # Called on the publisher's thread before publish returns.
+    INLINE = "inline"
+    # Queued and called on the subscriber's own thread, in order. The oldest
+    # queued value is dropped once max_queued are waiting.
+    QUEUED = "queued"
+    # Like QUEUED, but only the latest value waits; for state streams where a
+    # consumer only cares about the current state.
+    CONFLATED = "conflated"
+
+
+class _Dispatcher(Generic[T]):
+    """Own thread and bounded queue of one subscriber. put never blocks on it."""
+
+    def __init__(self, observer: Callable[[T], None], max_queued: int) -> None:
+        self._observer = observer
+        self._queue: deque[T] = deque(maxlen=max_queued)
+        self._condition = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name=f"pub_sub-{_name(observer)}", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, value: T) -> None:
+        with self._condition:
+            self._queue.append(value)
+            self._condition.notify()
+
+    def stop(self) -> None:
+        # Not joined: the observer itself may be the one unsubscribing.
+        with self._condition:
+            self._running = False
+            self._queue.clear()
+            self._condition.notify()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._running and not self._queue:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                value = self._queue.popleft()
+            _call(self._observer, value)
+
+
+class Subscription(Generic[T]):
+    """Handle returned by subscribe; calling it unsubscribes in O(1)."""
+
+    __slots__ = ("observer", "active", "_pub_sub", "_dispatcher")
+
+    def __init__(
+        self,
+        observer: Callable[[T], None],
+        pub_sub: "PubSub[T]",
+        dispatcher: "Optional[_Dispatcher[T]]" = None,
+    ) -> None:
+        self.observer = observer
+        self.active = True
+        self._pub_sub = pub_sub
+        self._dispatcher = dispatcher
+
+    def __call__(self) -> None:
+        self._pub_sub._unsubscribe(self)
+
+    def deliver(self, value: T) -> None:
+        if self._dispatcher is None:
+            _call(self.observer, value)
+        else:
+            self._dispatcher.put(value)
+
+    def close(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.stop()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """After unsubscribing, wait for a call still running on its thread."""
+        if self._dispatcher is not None:
+            self._dispatcher.join(timeout=timeout)
+
+
 class PubSub(Sub[T], Pub[T]):
-    def __init__(self) -> None:
-        self._subs: list[Callable[[T], None]] = []
-        self._pending_messages: List[T] = []
+    """
+    Fan-out of published values to subscribers, safe to use from any thread.
+
+    Subscribers are kept in an immutable snapshot that is replaced on change,
+    so publish() only reads one reference and never takes the lock. Values
+    published while nobody is subscribed are held for the first subscriber,
+    up to max_pending of them. An observer that raises is logged and does not
+    keep the value from the other observers.
+
+    Observers are called inline on the publisher's thread by default. With
+    Delivery.QUEUED or Delivery.CONFLATED, set for the whole PubSub or per
+    subscribe call, each observer gets its own thread and bounded queue
+    instead, so a slow observer never holds up the publisher.
+    """
+
+    _subscriptions: dict[Callable[[T], None], Subscription[T]]
+    _snapshot: tuple[Subscription[T], ...]
+    _stale: bool
+    _pending: deque[T]
+    _max_pending: int
+    _overflow: Overflow
+    _delivery: Delivery
+    _max_queued: int
+    _lock: threading.RLock
+
+    def __init__(
+        self,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        overflow: Overflow = Overflow.DROP_OLDEST,
+        delivery: Delivery = Delivery.INLINE,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+    ) -> None:
+        if max_pending < 0:
+            raise ValueError(f"max_pending must not be negative, got {max_pending}")
+        if max_queued < 1:
+            raise ValueError(f"max_queued must be at least 1, got {max_queued}")
 
-    def subscribe(self, observer: Callable[[T], None]) -> Callable[[], None]:
-        if observer not in self._subs:
-            self._subs.append(observer)
+        self._subscriptions = {}
+        self._snapshot = ()
+        self._stale = False
+        self._pending = deque()
+        self._max_pending = max_pending
+        self._overflow = overflow
+        self._delivery = delivery
+        self._max_queued = max_queued
+        self._lock = threading.RLock()
 
-            for message in self._pending_messages:
-                observer(message)
+    @property
+    def _subs(self) -> list[Callable[[T], None]]:
+        """Current observers, for inspection."""
+        return [s.observer for s in self._snapshot if s.active]
 
-            if self._pending_messages and self._subs:
-                self._pending_messages = []
+    @property
+    def _pending_messages(self) -> List[T]:
+        """Values waiting for the first subscriber, for inspection."""
+        with self._lock:
+            return list(self._pending)
 
-        def unsubscribe() -> None:
-            if observer in self._subs:
-                self._subs.remove(observer)
+    def subscribe(
+        self,
+        observer: Callable[[T], None],
+        delivery: Optional[Delivery] = None,
+    ) -> Callable[[], None]:
+        """Delivery defaults to the one this PubSub was created with."""
+        with self._lock:
+            subscription = self._subscriptions.get(observer)
+            if subscription is not None:
+                return subscription
 
-        return unsubscribe
+            subscription = Subscription(
+                observer=observer,
+                pub_sub=self,
+                dispatcher=self._to_dispatcher(observer, delivery or self._delivery),
+            )
+
+            # Replay before joining the snapshot, under the lock, so values
+            # published meanwhile wait and arrive after the pending ones.
+            pending = list(self._pending)
+            self._pending.clear()
+            for value in pending:
+                subscription.deliver(value)
+
+            self._subscriptions[observer] = subscription
+            self._rebuild_snapshot()
+            return subscription
+
+    def _unsubscribe(self, subscription: Subscription[T]) -> None:
+        with self._lock:
+            if not subscription.active:
+                return
+            subscription.active = False
+            if self._subscriptions.get(subscription.observer) is subscription:
+                del self._subscriptions[subscription.observer]
+            subscription.close()
+            # Publish skips inactive entries; the snapshot is rebuilt lazily.
+            self._stale = True
+
+    def close(self) -> None:
+        """Unsubscribe everyone, stopping their threads. Subscribing again still works."""
+        with self._lock:
+            for subscription in list(self._subscriptions.values()):
+                self._unsubscribe(subscription)
 
     def publish(self, value: T) -> None:
-        if not self._subs:
-            self._pending_messages.append(value)
-        else:
-            for observer in self._subs:
-                observer(value)
+        if self._stale:
+            with self._lock:
+                self._rebuild_snapshot()
+
+        snapshot = self._snapshot
+
+        if not snapshot:
+            with self._lock:
+                snapshot = self._snapshot
+                if not snapshot:
+                    self._hold(value)
+                    return
+
+        for subscription in snapshot:
+            if subscription.active:
+                subscription.deliver(value)
+
+    def _hold(self, value: T) -> None:
+        """Keep a value for the first subscriber. Caller holds the lock."""
+        if len(self._pending) < self._max_pending:
+            self._pending.append(value)
+        elif self._overflow == Overflow.DROP_OLDEST and self._max_pending > 0:
+            self._pending.popleft()
+            self._pending.append(value)
+
+    def _to_dispatcher(
+        self, observer: Callable[[T], None], delivery: Delivery
+    ) -> Optional[_Dispatcher[T]]:
+        if delivery == Delivery.QUEUED:
+            return _Dispatcher(observer, max_queued=self._max_queued)
+        if delivery == Delivery.CONFLATED:
+            return _Dispatcher(observer, max_queued=1)
+        return None
+
+    def _rebuild_snapshot(self) -> None:
+        """Caller holds the lock."""
+        self._snapshot = tuple(self._subscriptions.values())
+        self._stale = False
 
     def enqueue(self, q: queue.Queue[T]) -> Callable[[], None]:
         """Subscribe to PubSub and enqueue messages onto the given queue forever."""
@@ -65,11 +288,28 @@ class PubSub(Sub[T], Pub[T]):
         return self.subscribe(enqueue_message)
 
     def map(self, mapper: Callable[[T], U]) -> "PubSub[U]":
-        new_pub_sub = PubSub[U]()
+        # Mapping is cheap; the mapped PubSub delivers to its own subscribers.
+        new_pub_sub = PubSub[U](
+            max_pending=self._max_pending,
+            overflow=self._overflow,
+            delivery=self._delivery,
+            max_queued=self._max_queued,
+        )
 
         def new_observer(value: T) -> None:
             new_value = mapper(value)
             new_pub_sub.publish(new_value)
 
-        self.subscribe(new_observer)
+        self.subscribe(new_observer, delivery=Delivery.INLINE)
         return new_pub_sub
+
+
+def _call(observer: Callable[[T], None], value: T) -> None:
+    try:
+        observer(value)
+    except Exception:
+        _logger.exception("Subscriber %r failed", observer)
+
+
+def _name(observer: Callable[[T], None]) -> str:
+    return getattr(observer, "__qualname__", type(observer).__name__)
@@ -0,0 +1,241 @@
+import threading
+from src.library.pub_sub import Delivery, Overflow, PubSub, Subscription
+
+
+def test_pending_buffer_drops_oldest_when_full() -> None:
+    pub_sub = PubSub[int](max_pending=2, overflow=Overflow.DROP_OLDEST)
+    for value in range(4):
+        pub_sub.publish(value)
+
+    received: list[int] = []
+    pub_sub.subscribe(received.append)
+
+    assert received == [2, 3]
+
+
+def test_pending_buffer_drops_newest_when_full() -> None:
+    pub_sub = PubSub[int](max_pending=2, overflow=Overflow.DROP_NEWEST)
+    for value in range(4):
+        pub_sub.publish(value)
+
+    received: list[int] = []
+    pub_sub.subscribe(received.append)
+
+    assert received == [0, 1]
+
+
+def test_failing_subscriber_does_not_affect_others() -> None:
+    pub_sub = PubSub[int]()
+    received: list[int] = []
+
+    def fail(value: int) -> None:
+        raise RuntimeError("boom")
+
+    pub_sub.subscribe(fail)
+    pub_sub.subscribe(received.append)
+    pub_sub.publish(1)
+    pub_sub.publish(2)
+
+    assert received == [1, 2]
+
+
+def test_unsubscribe_handle_only_removes_its_own_subscription() -> None:
+    pub_sub = PubSub[int]()
+    received: list[int] = []
+
+    unsubscribe = pub_sub.subscribe(received.append)
+    unsubscribe()
+    pub_sub.subscribe(received.append)
+    unsubscribe()
+    pub_sub.publish(1)
+
+    assert received == [1]
+
+
+def test_unsubscribing_during_publish_is_safe() -> None:
+    pub_sub = PubSub[int]()
+    received: list[int] = []
+    unsubscribes = []
+
+    def unsubscribe_all(value: int) -> None:
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+
+    unsubscribes.append(pub_sub.subscribe(unsubscribe_all))
+    unsubscribes.append(pub_sub.subscribe(received.append))
+    pub_sub.publish(1)
+    pub_sub.publish(2)
+
+    assert received == []
+    assert pub_sub._subs == []
+
+
+def test_concurrent_publishers_and_subscribers() -> None:
+    pub_sub = PubSub[int]()
+    received: list[int] = []
+    lock = threading.Lock()
+
+    def observer(value: int) -> None:
+        with lock:
+            received.append(value)
+
+    pub_sub.subscribe(observer)
+
+    def publish(offset: int) -> None:
+        for value in range(1000):
+            pub_sub.publish(offset + value)
+
+    def churn() -> None:
+        for _ in range(1000):
+            pub_sub.subscribe(lambda value: None)()
+
+    threads = [
+        threading.Thread(target=publish, args=(offset,)) for offset in (0, 1000)
+    ] + [threading.Thread(target=churn)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(received) == list(range(2000))
+
+
+def test_no_value_is_lost_while_the_first_subscriber_joins() -> None:
+    pub_sub = PubSub[int](max_pending=10_000)
+    received: list[int] = []
+
+    publisher = threading.Thread(
+        target=lambda: [pub_sub.publish(value) for value in range(5000)]
+    )
+    publisher.start()
+    pub_sub.subscribe(received.append)
+    publisher.join()
+
+    assert received == list(range(5000))
+
+
+def test_queued_subscriber_does_not_block_publisher() -> None:
+    pub_sub = PubSub[int](delivery=Delivery.QUEUED)
+    release = threading.Event()
+    done = threading.Event()
+    received: list[int] = []
+
+    def slow(value: int) -> None:
+        release.wait()
+        received.append(value)
+        if value == 2:
+            done.set()
+
+    pub_sub.subscribe(slow)
+    for value in range(3):
+        pub_sub.publish(value)
+
+    assert received == []
+    release.set()
+    assert done.wait(timeout=1)
+    assert received == [0, 1, 2]
+
+
+def test_queued_subscriber_drops_oldest_when_behind() -> None:
+    pub_sub = PubSub[int](delivery=Delivery.QUEUED, max_queued=2)
+    started = threading.Event()
+    release = threading.Event()
+    done = threading.Event()
+    received: list[int] = []
+
+    def slow(value: int) -> None:
+        started.set()
+        release.wait()
+        received.append(value)
+        if value == 9:
+            done.set()
+
+    pub_sub.subscribe(slow)
+    pub_sub.publish(0)
+    assert started.wait(timeout=1)
+    for value in range(1, 10):
+        pub_sub.publish(value)
+
+    release.set()
+    assert done.wait(timeout=1)
+    assert received == [0, 8, 9]
+
+
+def test_conflated_subscriber_only_gets_latest_value() -> None:
+    pub_sub = PubSub[int]()
+    release = threading.Event()
+    done = threading.Event()
+    received: list[int] = []
+
+    def slow(value: int) -> None:
+        release.wait()
+        received.append(value)
+        if value == 9:
+            done.set()
+
+    pub_sub.subscribe(slow, delivery=Delivery.CONFLATED)
+    for value in range(10):
+        pub_sub.publish(value)
+
+    release.set()
+    assert done.wait(timeout=1)
+    assert received[-1] == 9
+    assert len(received) <= 2
+
+
+def test_inline_and_queued_subscribers_mix() -> None:
+    pub_sub = PubSub[int]()
+    inline: list[int] = []
+    queued: list[int] = []
+    done = threading.Event()
+
+    def on_queued(value: int) -> None:
+        queued.append(value)
+        if value == 1:
+            done.set()
+
+    pub_sub.subscribe(inline.append)
+    pub_sub.subscribe(on_queued, delivery=Delivery.QUEUED)
+    pub_sub.publish(0)
+    pub_sub.publish(1)
+
+    assert inline == [0, 1]
+    assert done.wait(timeout=1)
+    assert queued == [0, 1]
+
+
+def test_unsubscribed_queued_subscriber_stops_receiving() -> None:
+    pub_sub = PubSub[int](delivery=Delivery.QUEUED)
+    started = threading.Event()
+    release = threading.Event()
+    received: list[int] = []
+
+    def slow(value: int) -> None:
+        started.set()
+        release.wait()
+        received.append(value)
+
+    subscription = pub_sub.subscribe(slow)
+    assert isinstance(subscription, Subscription)
+    pub_sub.publish(1)
+    assert started.wait(timeout=1)
+
+    subscription()
+    pub_sub.publish(2)
+    release.set()
+    subscription.join(timeout=1)
+
+    assert received == [1]
+
+
+def test_close_stops_every_subscriber_thread() -> None:
+    pub_sub = PubSub[int](delivery=Delivery.QUEUED)
+    subscriptions = [pub_sub.subscribe(lambda value: None) for _ in range(2)]
+
+    pub_sub.close()
+    for subscription in subscriptions:
+        assert isinstance(subscription, Subscription)
+        subscription.join(timeout=1)
+        assert not subscription.active
+
+    assert pub_sub._subs == []
@@ -0,0 +1,310 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+import heapq
+import itertools
+import logging
+import threading
+import time
+from src.library.life_cycle import LifeCycle
+from src.library.pub_sub import Delivery, PubSub, Sub, Subscription
+
+DEFAULT_MAX_BLOCKING_WORKERS = 2
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class Timer:
+    """Handle returned by call_every and call_later; calling it cancels the timer."""
+
+    callback: Callable[[], None]
+    blocking: bool
+    scheduler: "Scheduler"
+    interval: Optional[timedelta] = None
+    active: bool = True
+    # Set while a blocking run is in flight, so runs never overlap.
+    busy: threading.Event = field(default_factory=threading.Event)
+
+    def __call__(self) -> None:
+        self.scheduler._cancel(self)
+
+
+@dataclass(eq=False)
+class _Schedule:
+    """All timers of one interval, fired together on one drift-free deadline."""
+
+    seconds: Optional[float]
+    deadline: float
+    timers: tuple[Timer, ...] = ()
+
+
+class TickSource(PubSub[datetime]):
+    """
+    The current time every interval, with a timer only while subscribed.
+    start_timer starts a timer calling its callback every interval and
+    returns the function that cancels it.
+    """
+
+    _start_timer: Callable[[Callable[[], None]], Callable[[], None]]
+    _timer: Optional[Callable[[], None]]
+
+    def __init__(
+        self, start_timer: Callable[[Callable[[], None]], Callable[[], None]]
+    ) -> None:
+        # A tick nobody saw is stale by the next one.
+        super().__init__(max_pending=0)
+        self._start_timer = start_timer
+        self._timer = None
+
+    def subscribe(
+        self,
+        observer: Callable[[datetime], None],
+        delivery: Optional[Delivery] = None,
+    ) -> Callable[[], None]:
+        with self._lock:
+            subscription = super().subscribe(observer, delivery=delivery)
+            if self._timer is None:
+                self._timer = self._start_timer(lambda: self.publish(datetime.now()))
+            return subscription
+
+    def _unsubscribe(self, subscription: Subscription[datetime]) -> None:
+        with self._lock:
+            super()._unsubscribe(subscription)
+            if not self._subscriptions and self._timer is not None:
+                self._timer()
+                self._timer = None
+
+
+class Scheduler(LifeCycle):
+    """
+    Runs timers from one thread off a heap of monotonic deadlines.
+
+    Deadlines advance by the interval from the first run rather than from
+    when the previous run finished, so timers do not drift; runs missed
+    while the thread was held up are skipped, not fired in a burst. Timers
+    with the same interval share one schedule and fire together, so any
+    number of subscribers at one rate cost one heap entry.
+
+    Callbacks run on the scheduler thread and must be quick. Pass
+    blocking=True for callbacks that do I/O: they run on a small pool and a
+    run is skipped while the previous one is still going.
+    """
+
+    _heap: list[tuple[float, int, _Schedule]]
+    _schedules: dict[float, _Schedule]
+    _tick_sources: dict[float, TickSource]
+    _counter: itertools.count
+    _condition: threading.Condition
+    _thread: Optional[threading.Thread]
+    _executor: Optional[ThreadPoolExecutor]
+    _max_blocking_workers: int
+    _running: bool
+
+    def __init__(
+        self, max_blocking_workers: int = DEFAULT_MAX_BLOCKING_WORKERS
+    ) -> None:
+        if max_blocking_workers < 1:
+            raise ValueError(
+                f"max_blocking_workers must be at least 1, got {max_blocking_workers}"
+            )
+
+        self._heap = []
+        self._schedules = {}
+        self._tick_sources = {}
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._executor = None
+        self._max_blocking_workers = max_blocking_workers
+        self._running = False
+
+    def call_every(
+        self,
+        interval: timedelta,
+        callback: Callable[[], None],
+        blocking: bool = False,
+    ) -> Timer:
+        """Call callback every interval, starting now."""
+        seconds = interval.total_seconds()
+        if seconds <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+
+        timer = Timer(
+            callback=callback, blocking=blocking, scheduler=self, interval=interval
+        )
+        with self._condition:
+            schedule = self._schedules.get(seconds)
+            if schedule is None:
+                schedule = _Schedule(seconds=seconds, deadline=time.monotonic())
+                self._schedules[seconds] = schedule
+                self._push(schedule)
+            schedule.timers = (*schedule.timers, timer)
+        return timer
+
+    def call_later(
+        self,
+        delay: timedelta,
+        callback: Callable[[], None],
+        blocking: bool = False,
+    ) -> Timer:
+        """Call callback once after delay."""
+        timer = Timer(callback=callback, blocking=blocking, scheduler=self)
+        with self._condition:
+            self._push(
+                _Schedule(
+                    seconds=None,
+                    deadline=time.monotonic() + max(delay.total_seconds(), 0),
+                    timers=(timer,),
+                )
+            )
+        return timer
+
+    def ticks(self, interval: timedelta) -> Sub[datetime]:
+        """
+        The current time every interval. Every caller asking for the same
+        interval gets the same source, whose timer runs only while it has
+        subscribers.
+        """
+        seconds = interval.total_seconds()
+        if seconds <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+
+        with self._condition:
+            tick_source = self._tick_sources.get(seconds)
+            if tick_source is None:
+                tick_source = TickSource(
+                    start_timer=lambda callback: self.call_every(interval, callback)
+                )
+                self._tick_sources[seconds] = tick_source
+            return tick_source
+
+    def _cancel(self, timer: Timer) -> None:
+        with self._condition:
+            if not timer.active:
+                return
+            timer.active = False
+            if timer.interval is None:
+                return
+            seconds = timer.interval.total_seconds()
+            schedule = self._schedules.get(seconds)
+            if schedule is None:
+                return
+            schedule.timers = tuple(t for t in schedule.timers if t is not timer)
+            if not schedule.timers:
+                # Its heap entry is dropped when it comes up.
+                del self._schedules[seconds]
+
+    def _push(self, schedule: _Schedule) -> None:
+        """Caller holds the lock."""
+        heapq.heappush(self._heap, (schedule.deadline, next(self._counter), schedule))
+        self._condition.notify()
+
+    def _next_due(self) -> Optional[_Schedule]:
+        """Wait for the earliest deadline. None once stopped."""
+        with self._condition:
+            while self._running:
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+
+                deadline, _, schedule = self._heap[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(timeout=remaining)
+                    continue
+
+                heapq.heappop(self._heap)
+                if schedule.seconds is not None:
+                    if self._schedules.get(schedule.seconds) is not schedule:
+                        continue
+                    schedule.deadline = _next_deadline(
+                        schedule.deadline, schedule.seconds, time.monotonic()
+                    )
+                    self._push(schedule)
+                return schedule
+            return None
+
+    def _run(self) -> None:
+        while True:
+            schedule = self._next_due()
+            if schedule is None:
+                return
+            for timer in schedule.timers:
+                if timer.active:
+                    self._fire(timer)
+
+    def _fire(self, timer: Timer) -> None:
+        if not timer.blocking:
+            _call(timer.callback)
+            return
+
+        if timer.busy.is_set():
+            return
+        timer.busy.set()
+
+        def run() -> None:
+            try:
+                _call(timer.callback)
+            finally:
+                timer.busy.clear()
+
+        assert self._executor is not None
+        self._executor.submit(run)
+
+    def start(self) -> None:
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_blocking_workers, thread_name_prefix="scheduler"
+        )
+        self._thread = threading.Thread(target=self._run, daemon=True, name="scheduler")
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            self._condition.notify_all()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_default_scheduler: Optional[Scheduler] = None
+_default_scheduler_lock = threading.Lock()
+
+
+def default_scheduler() -> Scheduler:
+    """The process-wide scheduler, started on first use."""
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = Scheduler()
+            _default_scheduler.start()
+        return _default_scheduler
+
+
+def _next_deadline(deadline: float, seconds: float, now: float) -> float:
+    """The first deadline on the interval's grid that is still ahead of now."""
+    next_deadline = deadline + seconds
+    if next_deadline <= now:
+        missed = int((now - next_deadline) // seconds) + 1
+        next_deadline += missed * seconds
+    return next_deadline
+
+
+def _call(callback: Callable[[], None]) -> None:
+    try:
+        callback()
+    except Exception:
+        _logger.exception("Timer callback %r failed", callback)
@@ -0,0 +1,158 @@
+from datetime import timedelta
+import threading
+import time
+from src.library.scheduler import Scheduler
+
+INTERVAL = timedelta(seconds=0.02)
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_ticks_do_not_drift_with_slow_callbacks() -> None:
+    scheduler = Scheduler()
+    scheduler.start()
+    fired: list[float] = []
+
+    def slow() -> None:
+        fired.append(time.monotonic())
+        time.sleep(INTERVAL.total_seconds() / 2)
+
+    timer = scheduler.call_every(INTERVAL, slow)
+    try:
+        assert _wait_for(lambda: len(fired) >= 11)
+    finally:
+        timer()
+        scheduler.stop()
+
+    elapsed = fired[10] - fired[0]
+    assert abs(elapsed - 10 * INTERVAL.total_seconds()) < INTERVAL.total_seconds()
+
+
+def test_timers_with_the_same_interval_share_one_schedule() -> None:
+    scheduler = Scheduler()
+    scheduler.start()
+    first = threading.Event()
+    second = threading.Event()
+
+    timers = [
+        scheduler.call_every(INTERVAL, first.set),
+        scheduler.call_every(INTERVAL, second.set),
+    ]
+    try:
+        assert len(scheduler._schedules) == 1
+        assert first.wait(timeout=1) and second.wait(timeout=1)
+    finally:
+        for timer in timers:
+            timer()
+        scheduler.stop()
+
+    assert scheduler._schedules == {}
+
+
+def test_cancelled_timer_stops_firing() -> None:
+    scheduler = Scheduler()
+    scheduler.start()
+    fired: list[int] = []
+    kept: list[int] = []
+
+    timer = scheduler.call_every(INTERVAL, lambda: fired.append(1))
+    keeper = scheduler.call_every(INTERVAL, lambda: kept.append(1))
+    try:
+        assert _wait_for(lambda: len(fired) >= 1)
+        timer()
+        count = len(fired)
+        assert _wait_for(lambda: len(kept) >= count + 3)
+        assert len(fired) == count
+    finally:
+        keeper()
+        scheduler.stop()
+
+
+def test_blocking_runs_never_overlap() -> None:
+    scheduler = Scheduler()
+    scheduler.start()
+    running = 0
+    max_running = 0
+    runs = 0
+    lock = threading.Lock()
+
+    def poll() -> None:
+        nonlocal running, max_running, runs
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(INTERVAL.total_seconds() * 3)
+        with lock:
+            running -= 1
+            runs += 1
+
+    timer = scheduler.call_every(INTERVAL, poll, blocking=True)
+    try:
+        assert _wait_for(lambda: runs >= 3)
+    finally:
+        timer()
+        scheduler.stop()
+
+    assert max_running == 1
+
+
+def test_call_later_fires_once() -> None:
+    scheduler = Scheduler()
+    scheduler.start()
+    fired: list[float] = []
+    started_at = time.monotonic()
+
+    scheduler.call_later(INTERVAL, lambda: fired.append(time.monotonic()))
+    try:
+        assert _wait_for(lambda: len(fired) == 1)
+        time.sleep(INTERVAL.total_seconds() * 3)
+    finally:
+        scheduler.stop()
+
+    assert len(fired) == 1
+    assert fired[0] - started_at >= INTERVAL.total_seconds()
+
+
+def test_ticks_of_the_same_interval_are_one_source() -> None:
+    scheduler = Scheduler()
+    scheduler.start()
+    ticked = threading.Event()
+    try:
+        tick_source = scheduler.ticks(INTERVAL)
+        assert scheduler.ticks(INTERVAL) is tick_source
+        unsubscribe = tick_source.subscribe(lambda now: ticked.set())
+        assert ticked.wait(timeout=1)
+        unsubscribe()
+    finally:
+        scheduler.stop()
+
+
+def test_tick_timer_runs_only_while_subscribed() -> None:
+    scheduler = Scheduler()
+    scheduler.start()
+    try:
+        tick_source = scheduler.ticks(INTERVAL)
+        assert scheduler._schedules == {}
+
+        unsubscribe_first = tick_source.subscribe(lambda now: None)
+        unsubscribe_second = tick_source.subscribe(lambda now: None)
+        assert len(scheduler._schedules) == 1
+
+        unsubscribe_first()
+        assert len(scheduler._schedules) == 1
+        unsubscribe_second()
+        assert scheduler._schedules == {}
+
+        ticked = threading.Event()
+        unsubscribe = tick_source.subscribe(lambda now: ticked.set())
+        assert ticked.wait(timeout=1)
+        unsubscribe()
+    finally:
+        scheduler.stop()
@@ -1,7 +1,5 @@
 from typing import Optional, Dict, Any
 import logging
-import threading
-import time
 from datetime import timedelta
 from src.library.smart_plug.interface import (
     SmartPlug,
@@ -14,13 +12,17 @@ from src.library.smart_plug.interface import (
 )
 from src.library.life_cycle import LifeCycle
 from src.library.pub_sub import PubSub
+from src.library.scheduler import Scheduler, Timer, default_scheduler
 
 
 class FakeSmartPlug(SmartPlug, LifeCycle):
     """A fake implementation of the SmartPlug interface for testing purposes."""
 
     def __init__(
-        self, logger: logging.Logger, config: Optional[Dict[str, Any]] = None
+        self,
+        logger: logging.Logger,
+        config: Optional[Dict[str, Any]] = None,
+        scheduler: Optional[Scheduler] = None,
     ) -> None:
         """
         Initialize a fake smart plug.
@@ -28,13 +30,15 @@ class FakeSmartPlug(SmartPlug, LifeCycle):
         Args:
             logger: Logger instance
             config: Optional configuration dictionary
+            scheduler: Scheduler to poll on; the process-wide one by default
         """
         self._logger = logger.getChild("fake_smart_plug")
         self._config = config or {}
         self._state = SmartPlugState.UNKNOWN
         self._pub_sub = PubSub[SmartPlugEvent]()
         self._is_running = False
-        self._polling_thread: Optional[threading.Thread] = None
+        self._scheduler = scheduler if scheduler is not None else default_scheduler()
+        self._polling_timer: Optional[Timer] = None
         self._polling_interval = timedelta(
             seconds=self._config.get("polling_interval", 10.0)
         )
@@ -60,6 +64,10 @@ class FakeSmartPlug(SmartPlug, LifeCycle):
         self._logger.info("Stopping fake smart plug")
         self._is_running = False
 
+        if self._polling_timer is not None:
+            self._polling_timer()
+            self._polling_timer = None
+
         if self._connected:
             self._state = SmartPlugState.OFF
             self._connected = False
@@ -128,38 +136,35 @@ class FakeSmartPlug(SmartPlug, LifeCycle):
         return self._pub_sub
 
     def _start_polling(self) -> None:
-        """Start the polling thread."""
-        self._logger.debug("Starting polling thread")
-        if self._polling_thread is None or not self._polling_thread.is_alive():
-            self._polling_thread = threading.Thread(target=self._polling_loop)
-            self._polling_thread.daemon = True
-            self._polling_thread.start()
+        """Start polling on the scheduler."""
+        self._logger.debug("Starting polling")
+        if self._polling_timer is None:
+            self._polling_timer = self._scheduler.call_every(
+                self._polling_interval, self._poll, blocking=True
+            )
             self._logger.debug(
-                f"Polling thread started with interval {self._polling_interval.total_seconds()} seconds"
+                f"Polling started with interval {self._polling_interval.total_seconds()} seconds"
             )
 
-    def _polling_loop(self) -> None:
-        """Polling loop to simulate device updates."""
-        self._logger.debug("Entering polling loop")
-        while self._is_running and self._connected:
-            try:
-
-                if self._config.get("simulate_state_changes", False):
-                    self._simulate_state_change()
-
-                if self._state == SmartPlugState.ON and self._config.get(
-                    "report_power_usage", True
-                ):
-                    power = self.get_power_usage()
-                    if power is not None:
-                        self._pub_sub.publish(
-                            SmartPlugPowerUsageEvent("power_usage", power)
-                        )
-
-                time.sleep(self._polling_interval.total_seconds())
-            except Exception as e:
-                self._logger.error(f"Error in polling loop: {e}")
-                time.sleep(1.0)
+    def _poll(self) -> None:
+        """Simulate one device update."""
+        if not self._is_running or not self._connected:
+            return
+
+        try:
+            if self._config.get("simulate_state_changes", False):
+                self._simulate_state_change()
+
+            if self._state == SmartPlugState.ON and self._config.get(
+                "report_power_usage", True
+            ):
+                power = self.get_power_usage()
+                if power is not None:
+                    self._pub_sub.publish(
+                        SmartPlugPowerUsageEvent("power_usage", power)
+                    )
+        except Exception as e:
+            self._logger.error(f"Error while polling: {e}")
 
     def _simulate_state_change(self) -> None:
         """Simulate random state changes for testing."""
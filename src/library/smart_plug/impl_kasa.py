@@ -12,6 +12,7 @@ from src.library.smart_plug.interface import (
 )
 from src.library.life_cycle import LifeCycle
 from src.library.pub_sub import PubSub
+from src.library.scheduler import Scheduler, Timer, default_scheduler
 import logging
 import time
 import threading
@@ -27,16 +28,24 @@ class KasaSmartPlug(SmartPlug, LifeCycle):
     _retry_interval: timedelta = timedelta(seconds=5.0)
     _is_running: bool = False
     _connection_thread: Optional[threading.Thread] = None
-    _polling_thread: Optional[threading.Thread] = None
+    _scheduler: Scheduler
+    _polling_timer: Optional[Timer] = None
+    _retry_polling_at: float = 0.0
     _polling_interval: timedelta = timedelta(seconds=1.0)
     _max_retries: int = 3
     _retry_delay: timedelta = timedelta(seconds=1.0)
     _event_loop: Optional[asyncio.AbstractEventLoop] = None
     _connection_event: threading.Event = threading.Event()
 
-    def __init__(self, logger: logging.Logger, ip_address: str) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        ip_address: str,
+        scheduler: Optional[Scheduler] = None,
+    ) -> None:
         self._logger = logger.getChild("kasa_smart_plug")
         self._ip_address = ip_address
+        self._scheduler = scheduler if scheduler is not None else default_scheduler()
         self._plug = None
         self._state = SmartPlugState.UNKNOWN
         self._pub_sub = PubSub[SmartPlugEvent]()
@@ -87,54 +96,48 @@ class KasaSmartPlug(SmartPlug, LifeCycle):
 
     def _start_polling(self) -> None:
         self._logger.debug("Starting polling mechanism")
-        if self._polling_thread is None or not self._polling_thread.is_alive():
-            self._polling_thread = self._create_thread(self._polling_loop)
-            self._polling_thread.start()
+        if self._polling_timer is None:
+            # Polls hit the network, so they run off the scheduler thread.
+            self._polling_timer = self._scheduler.call_every(
+                self._polling_interval, self._poll, blocking=True
+            )
             self._logger.info(
                 f"Started state polling every {self._polling_interval.total_seconds()} seconds"
             )
 
-    def _polling_loop(self) -> None:
-        self._logger.debug("Entering polling loop")
-        # Create a new event loop for this thread
-        polling_event_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(polling_event_loop)
+    def _poll(self) -> None:
+        if not self._is_running or self._plug is None:
+            return
+        if time.monotonic() < self._retry_polling_at:
+            return
 
         try:
-            while self._is_running and self._plug is not None:
-                try:
-                    self._logger.debug("Polling current device state")
-                    previous_state = self._state
+            self._logger.debug("Polling current device state")
+            previous_state = self._state
 
-                    # Create a new event loop for each poll to avoid closed loop issues
-                    poll_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(poll_loop)
-                    current_state = self.get_state()
-                    poll_loop.close()
+            # Create a new event loop for each poll to avoid closed loop issues
+            poll_loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(poll_loop)
+            current_state = self.get_state()
+            poll_loop.close()
 
-                    self._logger.debug(
-                        f"Poll result: device state is {current_state.name}"
-                    )
+            self._logger.debug(f"Poll result: device state is {current_state.name}")
 
-                    if previous_state != current_state:
-                        self._logger.info(f"Plug state changed: {current_state.name}")
-                        self._pub_sub.publish(
-                            SmartPlugStateChangedEvent("state_changed", current_state)
-                        )
-                        # Update local state to match physical state
-                        self._state = current_state
-
-                    time.sleep(self._polling_interval.total_seconds())
-                except Exception as e:
-                    self._logger.error(f"Error during state polling: {e}")
-                    self._logger.debug(
-                        f"Will retry polling in {self._retry_interval.total_seconds()} seconds"
-                    )
-                    time.sleep(self._retry_interval.total_seconds())
-        finally:
-            # Clean up the event loop
-            if not polling_event_loop.is_closed():
-                polling_event_loop.close()
+            if previous_state != current_state:
+                self._logger.info(f"Plug state changed: {current_state.name}")
+                self._pub_sub.publish(
+                    SmartPlugStateChangedEvent("state_changed", current_state)
+                )
+                # Update local state to match physical state
+                self._state = current_state
+        except Exception as e:
+            self._logger.error(f"Error during state polling: {e}")
+            self._logger.debug(
+                f"Will retry polling in {self._retry_interval.total_seconds()} seconds"
+            )
+            self._retry_polling_at = (
+                time.monotonic() + self._retry_interval.total_seconds()
+            )
 
     async def _async_start(self) -> None:
         self._logger.debug(f"Discovering Kasa device at {self._ip_address}")
@@ -194,7 +197,9 @@ class KasaSmartPlug(SmartPlug, LifeCycle):
             except Exception as e:
                 self._logger.error(f"Failed to turn off plug during shutdown: {e}")
 
-        self._join_thread(self._polling_thread)
+        if self._polling_timer is not None:
+            self._polling_timer()
+            self._polling_timer = None
         self._join_thread(self._connection_thread)
 
         self._logger.debug("Publishing SmartPlugDisconnectedEvent")
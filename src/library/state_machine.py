@@ -1,9 +1,10 @@
 from typing import Callable, Generic, TypeVar, Optional, List
 import queue
 import threading
+from src.library.effect_executor import EffectExecutor
 from src.library.life_cycle import LifeCycle
 import logging
-from src.library.pub_sub import PubSub, Sub
+from src.library.pub_sub import Delivery, PubSub, Sub
 
 Model = TypeVar("Model")
 Msg = TypeVar("Msg")
@@ -22,6 +23,7 @@ class StateMachine(Generic[Model, Msg, Effect], LifeCycle):
     _models: PubSub[Model]
     _msgs: PubSub[Msg]
     _should_log: bool
+    _effect_executor: EffectExecutor[Effect]
 
     def __init__(
         self,
@@ -30,28 +32,36 @@ class StateMachine(Generic[Model, Msg, Effect], LifeCycle):
         interpret_effect: Callable[[Model, Effect, queue.Queue[Msg]], None],
         logger: logging.Logger,
         should_log: bool = False,
+        effect_executor: Optional[EffectExecutor[Effect]] = None,
     ) -> None:
         self._init = init
         self._transition = transition
         self._interpret_effect = interpret_effect
         self._msg_queue = queue.Queue[Msg]()
         self._model = None
-        self._models = PubSub[Model]()
-        self._msgs = PubSub[Msg]()
+        # Publishing must never wait on a slow subscriber such as a GUI; model
+        # subscribers only care about the latest model.
+        self._models = PubSub[Model](delivery=Delivery.CONFLATED)
+        self._msgs = PubSub[Msg](delivery=Delivery.QUEUED)
         self._running = False
         self._thread = None
         self._logger = logger.getChild("state_machine")
         self._should_log = should_log
+        self._effect_executor = (
+            effect_executor
+            if effect_executor is not None
+            else EffectExecutor[Effect](logger=self._logger)
+        )
 
-    def _interpret_effect_thread(self, effect: Effect) -> None:
+    def _submit_effect(self, model: Model, effect: Effect) -> None:
+        """Hand the effect to the executor so the message loop never waits on it."""
         if self._should_log:
             self._logger.info("Effect: %s", effect)
 
-        thread = threading.Thread(
-            target=self._interpret_effect, args=(self._model, effect, self._msg_queue)
+        self._effect_executor.submit(
+            effect,
+            lambda: self._interpret_effect(model, effect, self._msg_queue),
         )
-        thread.start()
-        thread.join()
 
     def models(self) -> Sub[Model]:
         return self._models
@@ -63,16 +73,13 @@ class StateMachine(Generic[Model, Msg, Effect], LifeCycle):
         self._models.publish(model)
         self._model = model
         for effect in effects:
-            self._interpret_effect_thread(effect)
+            self._submit_effect(model, effect)
 
     def _run(self) -> None:
         model, effects = self._init()
 
         self._handle_output(model, effects)
 
-        for effect in effects:
-            self._interpret_effect_thread(effect)
-
         while self._running:
             try:
                 msg = self._msg_queue.get(timeout=0.1)
@@ -103,6 +110,7 @@ class StateMachine(Generic[Model, Msg, Effect], LifeCycle):
             return
 
         self._running = True
+        self._effect_executor.start()
         self._thread = threading.Thread(target=self._run)
         self._thread.daemon = True
         self._thread.start()
@@ -121,4 +129,9 @@ class StateMachine(Generic[Model, Msg, Effect], LifeCycle):
             self._thread.join()
             self._thread = None
 
+        self._effect_executor.stop()
+        # Subscriber threads would otherwise outlive the machine.
+        self._models.close()
+        self._msgs.close()
+
         self._logger.info("Stopped")
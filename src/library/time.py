@@ -1,18 +1,92 @@
-from .pub_sub import PubSub, Sub
+from .pub_sub import Sub
+from .scheduler import TickSource, default_scheduler
 from datetime import datetime, timedelta
+from typing import Callable, Optional
+import asyncio
 import threading
-import time
 
 
 def ticks(interval: timedelta) -> Sub[datetime]:
-    pub_sub = PubSub[datetime]()
+    """
+    Ticks from the process-wide scheduler. Callers asking for the same
+    interval share one timer, which is cancelled once the last one
+    unsubscribes.
+    """
+    return default_scheduler().ticks(interval)
 
-    def tick_thread() -> None:
-        while True:
-            pub_sub.publish(datetime.now())
-            time.sleep(interval.total_seconds())
 
-    thread = threading.Thread(target=tick_thread, daemon=True)
-    thread.start()
+_loop_tick_sources: dict[asyncio.AbstractEventLoop, dict[float, TickSource]] = {}
+_loop_tick_sources_lock = threading.Lock()
 
-    return pub_sub
+
+def loop_ticks(
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> Callable[[timedelta], Sub[datetime]]:
+    """
+    Tick sources on timers of an asyncio loop (the running one by default)
+    instead of the scheduler thread, by interval. Like ticks, callers on the
+    same loop asking for the same interval share one timer, which runs only
+    while subscribed. Sources may be subscribed to from any thread.
+    """
+    running_loop = loop if loop is not None else asyncio.get_running_loop()
+
+    def to_tick_source(interval: timedelta) -> Sub[datetime]:
+        seconds = interval.total_seconds()
+        if seconds <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+
+        with _loop_tick_sources_lock:
+            for closed_loop in [l for l in _loop_tick_sources if l.is_closed()]:
+                del _loop_tick_sources[closed_loop]
+            tick_sources = _loop_tick_sources.setdefault(running_loop, {})
+            tick_source = tick_sources.get(seconds)
+            if tick_source is None:
+                tick_source = TickSource(
+                    start_timer=lambda callback: _LoopTimer(
+                        running_loop, seconds, callback
+                    )
+                )
+                tick_sources[seconds] = tick_source
+            return tick_source
+
+    return to_tick_source
+
+
+class _LoopTimer:
+    """
+    Calls callback on the loop every seconds until called. Deadlines advance
+    by the interval from the first tick, so slow observers do not make the
+    ticks drift, and late ticks are skipped rather than fired in a burst.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        seconds: float,
+        callback: Callable[[], None],
+    ) -> None:
+        self._loop = loop
+        self._seconds = seconds
+        self._callback = callback
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._cancelled = False
+        loop.call_soon_threadsafe(lambda: self._tick(loop.time()))
+
+    def __call__(self) -> None:
+        self._cancelled = True
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._cancel)
+
+    def _tick(self, deadline: float) -> None:
+        if self._cancelled:
+            return
+        self._callback()
+        next_deadline = deadline + self._seconds
+        while next_deadline <= self._loop.time():
+            next_deadline += self._seconds
+        self._handle = self._loop.call_at(next_deadline, self._tick, next_deadline)
+
+    def _cancel(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta
+import asyncio
+import threading
+from src.library.time import loop_ticks
+
+INTERVAL = timedelta(seconds=0.01)
+
+
+def test_loop_ticks_fire_on_the_loop_and_stop_when_unsubscribed() -> None:
+    async def run() -> None:
+        loop_thread = threading.get_ident()
+        to_tick_source = loop_ticks()
+        tick_source = to_tick_source(INTERVAL)
+        assert to_tick_source(INTERVAL) is tick_source
+
+        tick_threads: list[int] = []
+        ticked = asyncio.Event()
+
+        def on_tick(now: datetime) -> None:
+            tick_threads.append(threading.get_ident())
+            ticked.set()
+
+        # Doors subscribe from effect threads.
+        unsubscribe = await asyncio.to_thread(tick_source.subscribe, on_tick)
+        await asyncio.wait_for(ticked.wait(), timeout=1)
+        await asyncio.to_thread(unsubscribe)
+
+        await asyncio.sleep(INTERVAL.total_seconds())
+        ticks_at_unsubscribe = len(tick_threads)
+        await asyncio.sleep(INTERVAL.total_seconds() * 5)
+
+        assert set(tick_threads) == {loop_thread}
+        assert len(tick_threads) == ticks_at_unsubscribe
+
+    asyncio.run(run())
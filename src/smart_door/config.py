@@ -1,15 +1,41 @@
 from dataclasses import dataclass, field
 from datetime import timedelta
+from typing import Optional
+from src.image_classifier.bounding_box import BoundingBox
 from src.image_classifier.classification_config import ClassificationConfig
 
 
 @dataclass
 class Config:
-    tick_rate: timedelta = timedelta(seconds=1 / 2)
-    minimal_rate_camera_process: timedelta = timedelta(seconds=1 / 5)
+    tick_rate: timedelta = timedelta(seconds=1)
+    minimal_rate_camera_process: timedelta = timedelta(seconds=1 / 2)
+    # Adaptive cadence: the rates above apply while nothing is going on; the
+    # active ones while a pet on the open or close list is in view or the door
+    # is counting down to open or close.
+    adaptive_rate_enabled: bool = True
+    tick_rate_active: timedelta = timedelta(seconds=1 / 10)
+    minimal_rate_camera_process_active: timedelta = timedelta(seconds=1 / 5)
     minimal_duration_will_open: timedelta = timedelta(seconds=3)
     minimal_duration_will_close: timedelta = timedelta(seconds=3)
     max_classification_runs: int = 3
+    motion_gate_enabled: bool = True
+    motion_thumbnail_width: int = 64
+    motion_pixel_threshold: int = 25
+    motion_min_changed_ratio: float = 0.01
+    motion_max_skip_duration: timedelta = timedelta(seconds=10)
+    # Normalized (0..1) region around the door; None classifies the whole frame.
+    classification_region_of_interest: Optional[BoundingBox] = None
+    classification_image_size: int = 640
+    # Reuse classifications of a near-identical recent frame of the same camera
+    # (perceptual hash).
+    classification_cache_enabled: bool = False
+    classification_cache_max_distance: int = 4
+    classification_cache_ttl: timedelta = timedelta(seconds=10)
+    # Run a nano model first and the large model only when a weight of an
+    # open/close list label falls in [min_weight, max_weight).
+    classification_cascade_enabled: bool = True
+    classification_cascade_min_weight: float = 0.25
+    classification_cascade_max_weight: float = 0.75
     classification_close_list: list[ClassificationConfig] = field(
         default_factory=lambda: [
             ClassificationConfig(label="cat", min_weight=0.5),
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
-from typing import Literal, Union
+from datetime import timedelta
+from typing import Literal, Optional, Union
 from src.image.image import Image
+from src.smart_door.core.model import CameraId, DEFAULT_CAMERA_ID
 
 
 @dataclass
@@ -15,12 +17,14 @@ class EffectCloseDoor:
 
 @dataclass
 class EffectCaptureImage:
+    camera_id: CameraId = DEFAULT_CAMERA_ID
     type: Literal["capture_image"] = "capture_image"
 
 
 @dataclass
 class EffectClassifyImages:
     images: list[Image]
+    camera_id: CameraId = DEFAULT_CAMERA_ID
     type: Literal["classify_images"] = "classify_images"
 
 
@@ -36,9 +40,16 @@ class EffectSubscribeDoor:
 
 @dataclass
 class EffectSubscribeTick:
+    # Replaces any earlier tick subscription; None ticks at config.tick_rate.
+    interval: Optional[timedelta] = None
     type: Literal["subscribe_tick"] = "subscribe_tick"
 
 
+@dataclass
+class EffectWarmUpClassifier:
+    type: Literal["warm_up_classifier"] = "warm_up_classifier"
+
+
 Effect = Union[
     EffectOpenDoor,
     EffectCloseDoor,
@@ -47,4 +58,5 @@ Effect = Union[
     EffectSubscribeCamera,
     EffectSubscribeDoor,
     EffectSubscribeTick,
+    EffectWarmUpClassifier,
 ]
@@ -1,16 +1,22 @@
 from dataclasses import dataclass, field
-from typing import Literal, Union
+from typing import Literal, Optional, Union
 from enum import Enum, auto
-from datetime import datetime
+from datetime import datetime, timedelta
 from src.image.image import Image
 from src.image_classifier.classification import Classification
 from src.smart_door.config import Config
 
+# Identifies a camera; single camera setups use the default id.
+CameraId = str
+DEFAULT_CAMERA_ID: CameraId = "main"
+
 
 @dataclass
 class _ModelBase:
     type: str
     config: Config = field(default_factory=Config)
+    # Cold-start cost: how long the classifier took to warm up, once it has.
+    classifier_warm_up_duration: Optional[timedelta] = None
 
 
 class ConnectionState(Enum):
@@ -25,6 +31,8 @@ class ConnectionState(Enum):
 class ModelConnecting(_ModelBase):
     camera: ConnectionState = field(default=ConnectionState.Connecting)
     door: ConnectionState = field(default=ConnectionState.Connecting)
+    classifier: ConnectionState = field(default=ConnectionState.Connecting)
+    cameras_connected: list[CameraId] = field(default_factory=list)
     type: Literal["connecting"] = "connecting"
 
 
@@ -49,6 +57,8 @@ class ModelCamera:
     state: CameraState = field(default=CameraState.Idle)
     state_start_time: datetime = field(default_factory=datetime.now)
     classification_runs: list[ClassificationRun] = field(default_factory=list)
+    frames_captured: int = 0
+    frames_skipped_no_motion: int = 0
 
 
 class DoorState(Enum):
@@ -69,7 +79,9 @@ class ModelDoor:
 
 @dataclass
 class ModelReady(_ModelBase):
-    camera: ModelCamera = field(default_factory=ModelCamera)
+    cameras: dict[CameraId, ModelCamera] = field(
+        default_factory=lambda: {DEFAULT_CAMERA_ID: ModelCamera()}
+    )
     door: ModelDoor = field(default_factory=ModelDoor)
     type: Literal["ready"] = "ready"
 
@@ -83,11 +95,56 @@ def is_camera_connected(model: Model) -> bool:
     return True
 
 
+def to_motion_skip_ratio(model: Model) -> float:
+    if not isinstance(model, ModelReady):
+        return 0.0
+    frames_captured = sum(c.frames_captured for c in model.cameras.values())
+    if frames_captured == 0:
+        return 0.0
+    frames_skipped = sum(c.frames_skipped_no_motion for c in model.cameras.values())
+    return frames_skipped / frames_captured
+
+
+def is_cadence_active(model: Model) -> bool:
+    """A pet on the open or close list is in view, or the door is counting down."""
+    if not isinstance(model, ModelReady):
+        return False
+
+    if model.door.state in (DoorState.WillOpen, DoorState.WillClose):
+        return True
+
+    labels = {
+        classification_config.label
+        for classification_config in (
+            model.config.classification_open_list
+            + model.config.classification_close_list
+        )
+    }
+    return any(
+        classification.label in labels
+        for classification in to_latest_classifications(model)
+    )
+
+
+def to_tick_rate(model: Model) -> timedelta:
+    if model.config.adaptive_rate_enabled and is_cadence_active(model):
+        return model.config.tick_rate_active
+    return model.config.tick_rate
+
+
+def to_minimal_rate_camera_process(model: Model) -> timedelta:
+    if model.config.adaptive_rate_enabled and is_cadence_active(model):
+        return model.config.minimal_rate_camera_process_active
+    return model.config.minimal_rate_camera_process
+
+
 def to_latest_classifications(model: Model) -> list[Classification]:
+    """Classifications of every camera's recent runs, fused for the door decision."""
     if isinstance(model, ModelReady):
         classifications: list[Classification] = [
             classification
-            for classification_run in model.camera.classification_runs
+            for camera_id in sorted(model.cameras)
+            for classification_run in model.cameras[camera_id].classification_runs
             for classification in classification_run.classifications
         ]
         return classifications
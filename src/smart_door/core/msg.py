@@ -1,11 +1,11 @@
 from dataclasses import dataclass, field
 from typing import Literal, Optional, Union
-from datetime import datetime
+from datetime import datetime, timedelta
 from src.image_classifier.classification import Classification
 from src.image.image import Image
 from src.device_camera.event import EventCamera
 from src.device_door.event import EventDoor
-from src.smart_door.core.model import ClassificationRun
+from src.smart_door.core.model import CameraId, ClassificationRun, DEFAULT_CAMERA_ID
 
 
 @dataclass
@@ -21,6 +21,7 @@ class MsgTick(_MsgBase):
 @dataclass
 class MsgCameraEvent(_MsgBase):
     camera_event: Optional[EventCamera] = None
+    camera_id: CameraId = DEFAULT_CAMERA_ID
     type: Literal["camera_event"] = "camera_event"
 
 
@@ -43,15 +44,24 @@ class MsgDoorOpenDone(_MsgBase):
 @dataclass
 class MsgImageCaptureDone(_MsgBase):
     images: list[Image] = field(default_factory=list)
+    motion_ratio: Optional[float] = None
+    camera_id: CameraId = DEFAULT_CAMERA_ID
     type: Literal["image_capture_done"] = "image_capture_done"
 
 
 @dataclass
 class MsgImageClassifyDone(_MsgBase):
     classification_run: ClassificationRun = field(default_factory=ClassificationRun)
+    camera_id: CameraId = DEFAULT_CAMERA_ID
     type: Literal["image_classify_done"] = "image_classify_done"
 
 
+@dataclass
+class MsgClassifierWarmUpDone(_MsgBase):
+    duration: timedelta = field(default_factory=timedelta)
+    type: Literal["classifier_warm_up_done"] = "classifier_warm_up_done"
+
+
 Msg = Union[
     MsgTick,
     MsgCameraEvent,
@@ -60,4 +70,5 @@ Msg = Union[
     MsgDoorOpenDone,
     MsgImageCaptureDone,
     MsgImageClassifyDone,
+    MsgClassifierWarmUpDone,
 ]
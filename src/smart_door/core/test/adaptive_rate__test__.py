@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+from dataclasses import replace
+from typing import Optional
+from src.image_classifier.classification import Classification
+from src.smart_door.config import Config
+from src.smart_door.core.effect import Effect, EffectCaptureImage, EffectSubscribeTick
+from src.smart_door.core.model import (
+    DEFAULT_CAMERA_ID,
+    CameraState,
+    ClassificationRun,
+    DoorState,
+    Model,
+    ModelReady,
+    to_tick_rate,
+)
+from src.smart_door.core.msg import MsgImageClassifyDone, MsgTick
+from src.smart_door.core.test.fixture import BaseFixture
+
+
+class Fixture(BaseFixture):
+    def __init__(self, config: Optional[Config] = None) -> None:
+        super().__init__()
+        model, _ = self.init()
+        model, _ = self.transition_to_ready_state(
+            model=replace(model, config=config if config is not None else Config())
+        )
+        self.model = model
+
+    def classify(self, model: ModelReady, label: str) -> tuple[Model, list[Effect]]:
+        """Finish a classification run of the camera with one detection of label."""
+        model = replace(
+            model,
+            cameras={
+                DEFAULT_CAMERA_ID: replace(
+                    model.cameras[DEFAULT_CAMERA_ID], state=CameraState.Classifying
+                )
+            },
+        )
+        return self.transition(
+            model=model,
+            msg=MsgImageClassifyDone(
+                classification_run=ClassificationRun(
+                    classifications=[Classification(label=label, weight=0.9)],
+                    finished_at=datetime.now(),
+                )
+            ),
+        )
+
+
+def _tick_intervals(effects: list[Effect]) -> list[Optional[timedelta]]:
+    return [e.interval for e in effects if isinstance(e, EffectSubscribeTick)]
+
+
+def test_idle_door_ticks_at_the_idle_rate() -> None:
+    f = Fixture()
+
+    assert to_tick_rate(f.model) == f.model.config.tick_rate
+
+    model, effects = f.classify(model=f.model, label="person")
+
+    assert to_tick_rate(model) == model.config.tick_rate
+    assert _tick_intervals(effects) == []
+
+
+def test_pet_in_view_switches_to_the_active_rate() -> None:
+    f = Fixture()
+
+    model, effects = f.classify(model=f.model, label="dog")
+
+    assert _tick_intervals(effects) == [model.config.tick_rate_active]
+
+
+def test_active_rate_captures_sooner() -> None:
+    f = Fixture()
+    model, _ = f.classify(model=f.model, label="cat")
+    assert isinstance(model, ModelReady)
+
+    camera = model.cameras[DEFAULT_CAMERA_ID]
+    model, effects = f.transition(
+        model=model,
+        msg=MsgTick(
+            happened_at=camera.state_start_time
+            + (model.config.minimal_rate_camera_process_active * 1.5)
+        ),
+    )
+
+    assert model.config.minimal_rate_camera_process_active * 1.5 < (
+        model.config.minimal_rate_camera_process
+    )
+    assert any(isinstance(effect, EffectCaptureImage) for effect in effects)
+
+
+def test_door_countdown_keeps_the_active_rate() -> None:
+    f = Fixture()
+    model = replace(f.model, door=replace(f.model.door, state=DoorState.WillClose))
+
+    assert to_tick_rate(model) == model.config.tick_rate_active
+
+
+def test_return_to_idle_rate_once_the_door_has_closed() -> None:
+    f = Fixture()
+    started_at = datetime.now()
+    model = replace(
+        f.model,
+        door=replace(
+            f.model.door, state=DoorState.WillClose, state_start_time=started_at
+        ),
+    )
+
+    model, effects = f.transition(
+        model=model,
+        msg=MsgTick(happened_at=started_at + model.config.minimal_duration_will_close),
+    )
+
+    assert isinstance(model, ModelReady)
+    assert model.door.state == DoorState.Closed
+    assert _tick_intervals(effects) == [model.config.tick_rate]
+
+
+def test_disabled_adaptive_rate_never_switches() -> None:
+    f = Fixture(config=Config(adaptive_rate_enabled=False))
+
+    model, effects = f.classify(model=f.model, label="dog")
+
+    assert _tick_intervals(effects) == []
+    assert to_tick_rate(model) == model.config.tick_rate
@@ -14,7 +14,7 @@ from src.device_camera.event import EventCameraConnected
 from src.device_door.event import EventDoorConnected
 from src.smart_door.core.effect import Effect
 from src.smart_door.core.model import Model
-from src.smart_door.core.msg import Msg
+from src.smart_door.core.msg import Msg, MsgClassifierWarmUpDone
 
 
 class BaseFixture:
@@ -32,6 +32,8 @@ class BaseFixture:
     def transition_to_ready_state(
         self, model: Model
     ) -> tuple[ModelReady, list[Effect]]:
+        model, _ = transition(model=model, msg=MsgClassifierWarmUpDone())
+
         model, _ = transition(
             model=model,
             msg=MsgCameraEvent(camera_event=EventCameraConnected()),
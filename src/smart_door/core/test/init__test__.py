@@ -3,6 +3,7 @@ from src.smart_door.core import (
     EffectSubscribeCamera,
     EffectSubscribeDoor,
     EffectSubscribeTick,
+    EffectWarmUpClassifier,
 )
 from src.smart_door.core.test.fixture import BaseFixture
 
@@ -15,8 +16,10 @@ def test_init() -> None:
     assert model.type == "connecting"
     assert model.camera == ConnectionState.Connecting
     assert model.door == ConnectionState.Connecting
+    assert model.classifier == ConnectionState.Connecting
 
-    assert len(effects) == 3
+    assert len(effects) == 4
     assert isinstance(effects[0], EffectSubscribeCamera)
     assert isinstance(effects[1], EffectSubscribeDoor)
     assert isinstance(effects[2], EffectSubscribeTick)
+    assert isinstance(effects[3], EffectWarmUpClassifier)
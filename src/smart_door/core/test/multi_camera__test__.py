@@ -0,0 +1,148 @@
+from datetime import datetime
+from src.device_camera.event import EventCameraConnected, EventCameraDisconnected
+from src.device_door.event import EventDoorConnected
+from src.image_classifier.classification import Classification
+from src.smart_door.core.effect import EffectCaptureImage, EffectClassifyImages
+from src.smart_door.core.model import (
+    CameraState,
+    ClassificationRun,
+    DoorState,
+    Model,
+    ModelConnecting,
+    ModelReady,
+)
+from src.smart_door.core.msg import (
+    MsgCameraEvent,
+    MsgClassifierWarmUpDone,
+    MsgDoorEvent,
+    MsgImageCaptureDone,
+    MsgImageClassifyDone,
+    MsgTick,
+)
+from src.smart_door.core.test.fixture import BaseFixture
+
+CAMERA_IDS = ["indoor", "outdoor"]
+
+
+def _transition_to_ready_with_cameras(f: BaseFixture) -> ModelReady:
+    model: Model
+    model, _ = f.init()
+    model, _ = f.transition(model=model, msg=MsgClassifierWarmUpDone())
+
+    for camera_id in CAMERA_IDS:
+        model, _ = f.transition(
+            model=model,
+            msg=MsgCameraEvent(
+                camera_event=EventCameraConnected(), camera_id=camera_id
+            ),
+        )
+
+    model, _ = f.transition(
+        model=model, msg=MsgDoorEvent(door_event=EventDoorConnected())
+    )
+
+    assert isinstance(model, ModelReady)
+    return model
+
+
+def test_every_connected_camera_gets_a_pipeline() -> None:
+    f = BaseFixture()
+
+    model = _transition_to_ready_with_cameras(f)
+
+    assert list(model.cameras) == CAMERA_IDS
+
+    model, effects = f.transition(
+        model=model,
+        msg=MsgTick(
+            happened_at=datetime.now() + model.config.minimal_rate_camera_process
+        ),
+    )
+
+    assert isinstance(model, ModelReady)
+    assert [e.camera_id for e in effects if isinstance(e, EffectCaptureImage)] == (
+        CAMERA_IDS
+    )
+    assert all(c.state == CameraState.Capturing for c in model.cameras.values())
+
+
+def test_capture_results_only_advance_their_own_camera() -> None:
+    f = BaseFixture()
+
+    model = _transition_to_ready_with_cameras(f)
+
+    model, _ = f.transition(
+        model=model,
+        msg=MsgTick(
+            happened_at=datetime.now() + model.config.minimal_rate_camera_process
+        ),
+    )
+
+    model, effects = f.transition(
+        model=model,
+        msg=MsgImageCaptureDone(images=f.device_camera.capture(), camera_id="outdoor"),
+    )
+
+    assert isinstance(model, ModelReady)
+    assert model.cameras["outdoor"].state == CameraState.Classifying
+    assert model.cameras["indoor"].state == CameraState.Capturing
+    assert len(effects) == 1
+    assert isinstance(effects[0], EffectClassifyImages)
+    assert effects[0].camera_id == "outdoor"
+
+
+def test_classifications_of_any_camera_drive_the_door() -> None:
+    f = BaseFixture()
+
+    model = _transition_to_ready_with_cameras(f)
+
+    model, _ = f.transition(
+        model=model,
+        msg=MsgTick(
+            happened_at=datetime.now() + model.config.minimal_rate_camera_process
+        ),
+    )
+
+    images = f.device_camera.capture()
+
+    model, _ = f.transition(
+        model=model, msg=MsgImageCaptureDone(images=images, camera_id="outdoor")
+    )
+
+    model, _ = f.transition(
+        model=model,
+        msg=MsgImageClassifyDone(
+            classification_run=ClassificationRun(
+                classifications=[Classification(label="dog", weight=0.9)],
+                images=images,
+            ),
+            camera_id="outdoor",
+        ),
+    )
+
+    model, _ = f.transition(model=model, msg=MsgTick(happened_at=datetime.now()))
+
+    assert isinstance(model, ModelReady)
+    assert model.door.state == DoorState.WillOpen
+    assert model.cameras["indoor"].classification_runs == []
+
+
+def test_keep_running_on_remaining_cameras_when_one_disconnects() -> None:
+    f = BaseFixture()
+
+    model = _transition_to_ready_with_cameras(f)
+
+    model, _ = f.transition(
+        model=model,
+        msg=MsgCameraEvent(camera_event=EventCameraDisconnected(), camera_id="indoor"),
+    )
+
+    assert isinstance(model, ModelReady)
+    assert list(model.cameras) == ["outdoor"]
+
+    model, _ = f.transition(
+        model=model,
+        msg=MsgCameraEvent(camera_event=EventCameraDisconnected(), camera_id="outdoor"),
+    )
+
+    assert isinstance(model, ModelConnecting)
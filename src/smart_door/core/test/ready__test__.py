@@ -1,7 +1,12 @@
+from datetime import timedelta
 from src.device_camera.event import EventCameraConnected, EventCameraDisconnected
 from src.device_door.event import EventDoorConnected, EventDoorDisconnected
 from src.smart_door.core.model import ConnectionState, ModelConnecting, ModelReady
-from src.smart_door.core.msg import MsgCameraEvent, MsgDoorEvent
+from src.smart_door.core.msg import (
+    MsgCameraEvent,
+    MsgClassifierWarmUpDone,
+    MsgDoorEvent,
+)
 from src.smart_door.core.test.fixture import BaseFixture
 
 
@@ -17,6 +22,8 @@ def test_transition_to_ready_state() -> None:
 
     model, _ = f.init()
 
+    model, _ = f.transition(model=model, msg=MsgClassifierWarmUpDone())
+
     model, _ = f.transition(
         model=model,
         msg=MsgCameraEvent(camera_event=EventCameraConnected()),
@@ -54,3 +61,48 @@ def test_transition_to_connecting_state_when_door_disconnected() -> None:
     assert isinstance(model, ModelConnecting)
     assert model.camera == ConnectionState.Connected
     assert model.door == ConnectionState.Connecting
+
+
+def test_stay_connecting_until_classifier_is_warmed_up() -> None:
+    f = Fixture()
+
+    model, _ = f.init()
+
+    model, _ = f.transition(
+        model=model,
+        msg=MsgCameraEvent(camera_event=EventCameraConnected()),
+    )
+
+    model, _ = f.transition(
+        model=model,
+        msg=MsgDoorEvent(door_event=EventDoorConnected()),
+    )
+
+    assert isinstance(model, ModelConnecting)
+
+    model, _ = f.transition(
+        model=model,
+        msg=MsgClassifierWarmUpDone(duration=timedelta(seconds=2)),
+    )
+
+    assert isinstance(model, ModelReady)
+    assert model.classifier_warm_up_duration == timedelta(seconds=2)
+
+
+def test_classifier_stays_warm_when_door_reconnects() -> None:
+    f = Fixture()
+
+    model, _ = f.transition(
+        model=f.model,
+        msg=MsgDoorEvent(door_event=EventDoorDisconnected()),
+    )
+
+    assert isinstance(model, ModelConnecting)
+    assert model.classifier == ConnectionState.Connected
+
+    model, _ = f.transition(
+        model=model,
+        msg=MsgDoorEvent(door_event=EventDoorConnected()),
+    )
+
+    assert isinstance(model, ModelReady)
@@ -1,4 +1,6 @@
+from dataclasses import replace
 from datetime import datetime, timedelta
+from src.image.image import Image
 from src.smart_door.core import (
     EffectCaptureImage,
     EffectClassifyImages,
@@ -7,7 +9,11 @@ from src.smart_door.core import (
     MsgImageCaptureDone,
     MsgImageClassifyDone,
 )
-from src.smart_door.core.model import ClassificationRun
+from src.smart_door.core.model import (
+    DEFAULT_CAMERA_ID,
+    ClassificationRun,
+    to_motion_skip_ratio,
+)
 from src.smart_door.core.msg import MsgTick
 from src.smart_door.core.test.fixture import BaseFixture
 
@@ -29,7 +35,7 @@ def test_transition_camera_to_capturing_state() -> None:
     assert isinstance(model, ModelReady)
     assert len(effects) == 1
     assert isinstance(effects[0], EffectCaptureImage)
-    assert model.camera.state == CameraState.Capturing
+    assert model.cameras[DEFAULT_CAMERA_ID].state == CameraState.Capturing
 
 
 def test_do_not_transition_to_capturing_state_if_not_enough_time_has_passed() -> None:
@@ -49,7 +55,7 @@ def test_do_not_transition_to_capturing_state_if_not_enough_time_has_passed() ->
     )
 
     assert isinstance(model, ModelReady)
-    assert model.camera.state == CameraState.Idle
+    assert model.cameras[DEFAULT_CAMERA_ID].state == CameraState.Idle
 
 
 def test_transition_to_classifying_state_after_capturing_image() -> None:
@@ -67,7 +73,7 @@ def test_transition_to_classifying_state_after_capturing_image() -> None:
     )
 
     assert isinstance(model, ModelReady)
-    assert model.camera.state == CameraState.Capturing
+    assert model.cameras[DEFAULT_CAMERA_ID].state == CameraState.Capturing
 
     images = f.device_camera.capture()
 
@@ -79,7 +85,7 @@ def test_transition_to_classifying_state_after_capturing_image() -> None:
     assert isinstance(effects[0], EffectClassifyImages)
 
     assert isinstance(model, ModelReady)
-    assert model.camera.state == CameraState.Classifying
+    assert model.cameras[DEFAULT_CAMERA_ID].state == CameraState.Classifying
 
 
 def test_transition_to_idle_state_after_classifying_image() -> None:
@@ -112,7 +118,7 @@ def test_transition_to_idle_state_after_classifying_image() -> None:
     )
 
     assert isinstance(model, ModelReady)
-    assert model.camera.state == CameraState.Idle
+    assert model.cameras[DEFAULT_CAMERA_ID].state == CameraState.Idle
 
 
 def test_transition_to_idle_state_when_capture_has_no_images() -> None:
@@ -130,11 +136,104 @@ def test_transition_to_idle_state_when_capture_has_no_images() -> None:
     )
 
     assert isinstance(model, ModelReady)
-    assert model.camera.state == CameraState.Capturing
+    assert model.cameras[DEFAULT_CAMERA_ID].state == CameraState.Capturing
 
     # Transition with empty images list
     model, effects = f.transition(model=model, msg=MsgImageCaptureDone(images=[]))
 
     assert isinstance(model, ModelReady)
-    assert model.camera.state == CameraState.Idle
+    assert model.cameras[DEFAULT_CAMERA_ID].state == CameraState.Idle
+    assert len(effects) == 0
+
+
+def _transition_to_capturing_with_previous_run(
+    f: BaseFixture,
+) -> tuple[ModelReady, list[Image]]:
+    model, _ = f.init()
+
+    model, _ = f.transition_to_ready_state(model=model)
+
+    images = f.device_camera.capture()
+
+    model = replace(
+        model,
+        cameras={
+            DEFAULT_CAMERA_ID: replace(
+                model.cameras[DEFAULT_CAMERA_ID],
+                classification_runs=[
+                    ClassificationRun(
+                        classifications=[],
+                        images=images,
+                        finished_at=datetime.now(),
+                    )
+                ],
+            )
+        },
+    )
+
+    model, _ = f.transition(
+        model=model,
+        msg=MsgTick(
+            happened_at=datetime.now() + model.config.minimal_rate_camera_process
+        ),
+    )
+
+    assert isinstance(model, ModelReady)
+    assert model.cameras[DEFAULT_CAMERA_ID].state == CameraState.Capturing
+
+    return model, images
+
+
+def test_skip_classifying_when_no_motion_since_latest_run() -> None:
+    f = BaseFixture()
+
+    model, images = _transition_to_capturing_with_previous_run(f)
+
+    model, effects = f.transition(
+        model=model,
+        msg=MsgImageCaptureDone(images=images, motion_ratio=0.0),
+    )
+
+    assert isinstance(model, ModelReady)
+    assert model.cameras[DEFAULT_CAMERA_ID].state == CameraState.Idle
     assert len(effects) == 0
+    assert len(model.cameras[DEFAULT_CAMERA_ID].classification_runs) == 1
+    assert to_motion_skip_ratio(model) == 1.0
+
+
+def test_classify_when_motion_since_latest_run() -> None:
+    f = BaseFixture()
+
+    model, images = _transition_to_capturing_with_previous_run(f)
+
+    model, effects = f.transition(
+        model=model,
+        msg=MsgImageCaptureDone(
+            images=images,
+            motion_ratio=model.config.motion_min_changed_ratio,
+        ),
+    )
+
+    assert isinstance(model, ModelReady)
+    assert model.cameras[DEFAULT_CAMERA_ID].state == CameraState.Classifying
+    assert isinstance(effects[0], EffectClassifyImages)
+    assert to_motion_skip_ratio(model) == 0.0
+
+
+def test_classify_without_motion_when_latest_run_is_stale() -> None:
+    f = BaseFixture()
+
+    model, images = _transition_to_capturing_with_previous_run(f)
+
+    model, effects = f.transition(
+        model=model,
+        msg=MsgImageCaptureDone(
+            happened_at=datetime.now() + model.config.motion_max_skip_duration,
+            images=images,
+            motion_ratio=0.0,
+        ),
+    )
+
+    assert isinstance(model, ModelReady)
+    assert model.cameras[DEFAULT_CAMERA_ID].state == CameraState.Classifying
+    assert isinstance(effects[0], EffectClassifyImages)
@@ -3,7 +3,12 @@ from dataclasses import replace
 from src.image_classifier.classification import Classification
 from src.device_door.event import EventDoorOpened, EventDoorClosed
 from src.smart_door.core.effect import EffectCloseDoor
-from src.smart_door.core.model import ClassificationRun, DoorState, ModelReady
+from src.smart_door.core.model import (
+    DEFAULT_CAMERA_ID,
+    ClassificationRun,
+    DoorState,
+    ModelReady,
+)
 from src.smart_door.core.msg import MsgTick, MsgDoorEvent
 from src.smart_door.core.test.fixture import BaseFixture
 
@@ -21,16 +26,18 @@ class Fixture(BaseFixture):
         self.model = replace(
             model,
             door=replace(model.door, state=door_state, state_start_time=datetime.now()),
-            camera=replace(
-                model.camera,
-                classification_runs=[
-                    ClassificationRun(
-                        classifications=classifications,
-                        images=[],
-                        finished_at=datetime.now(),
-                    ),
-                ],
-            ),
+            cameras={
+                DEFAULT_CAMERA_ID: replace(
+                    model.cameras[DEFAULT_CAMERA_ID],
+                    classification_runs=[
+                        ClassificationRun(
+                            classifications=classifications,
+                            images=[],
+                            finished_at=datetime.now(),
+                        ),
+                    ],
+                )
+            },
         )
 
 
@@ -2,7 +2,13 @@ from datetime import datetime, timedelta
 from dataclasses import replace
 from src.image_classifier.classification import Classification
 from src.smart_door.core.effect import EffectOpenDoor
-from src.smart_door.core.model import ClassificationRun, DoorState, Model, ModelReady
+from src.smart_door.core.model import (
+    DEFAULT_CAMERA_ID,
+    ClassificationRun,
+    DoorState,
+    Model,
+    ModelReady,
+)
 from src.smart_door.core.msg import MsgImageClassifyDone, MsgTick, MsgImageCaptureDone
 from src.smart_door.core.test.fixture import BaseFixture
 
@@ -23,16 +29,18 @@ class Fixture(BaseFixture):
         self.model = replace(
             model,
             door=replace(model.door, state=door_state, state_start_time=datetime.now()),
-            camera=replace(
-                model.camera,
-                classification_runs=[
-                    ClassificationRun(
-                        classifications=classifications,
-                        images=[],
-                        finished_at=datetime.now(),
-                    ),
-                ],
-            ),
+            cameras={
+                DEFAULT_CAMERA_ID: replace(
+                    model.cameras[DEFAULT_CAMERA_ID],
+                    classification_runs=[
+                        ClassificationRun(
+                            classifications=classifications,
+                            images=[],
+                            finished_at=datetime.now(),
+                        ),
+                    ],
+                )
+            },
         )
 
 
@@ -74,14 +82,16 @@ def test_bail_on_will_open_if_no_object_is_detected() -> None:
     model, _ = f.transition(
         model=replace(
             model,
-            camera=replace(
-                model.camera,
-                classification_runs=[
-                    ClassificationRun(
-                        classifications=[], images=[], finished_at=datetime.now()
-                    )
-                ],
-            ),
+            cameras={
+                DEFAULT_CAMERA_ID: replace(
+                    model.cameras[DEFAULT_CAMERA_ID],
+                    classification_runs=[
+                        ClassificationRun(
+                            classifications=[], images=[], finished_at=datetime.now()
+                        )
+                    ],
+                )
+            },
         ),
         msg=MsgTick(happened_at=datetime.now()),
     )
@@ -94,14 +104,16 @@ def test_bail_on_will_close_if_open_object_is_detected() -> None:
     f = Fixture(door_state=DoorState.WillClose)
     model: Model = replace(
         f.model,
-        camera=replace(
-            f.model.camera,
-            classification_runs=[
-                ClassificationRun(
-                    classifications=[], images=[], finished_at=datetime.now()
-                ),
-            ],
-        ),
+        cameras={
+            DEFAULT_CAMERA_ID: replace(
+                f.model.cameras[DEFAULT_CAMERA_ID],
+                classification_runs=[
+                    ClassificationRun(
+                        classifications=[], images=[], finished_at=datetime.now()
+                    ),
+                ],
+            )
+        },
     )
     model, _ = f.transition(
         model=model,
@@ -113,18 +125,20 @@ def test_bail_on_will_close_if_open_object_is_detected() -> None:
     model, _ = f.transition(
         model=replace(
             model,
-            camera=replace(
-                model.camera,
-                classification_runs=[
-                    ClassificationRun(
-                        classifications=[
-                            Classification(label="dog", weight=0.5),
-                        ],
-                        images=[],
-                        finished_at=datetime.now(),
-                    ),
-                ],
-            ),
+            cameras={
+                DEFAULT_CAMERA_ID: replace(
+                    model.cameras[DEFAULT_CAMERA_ID],
+                    classification_runs=[
+                        ClassificationRun(
+                            classifications=[
+                                Classification(label="dog", weight=0.5),
+                            ],
+                            images=[],
+                            finished_at=datetime.now(),
+                        ),
+                    ],
+                )
+            },
         ),
         msg=MsgTick(happened_at=datetime.now()),
     )
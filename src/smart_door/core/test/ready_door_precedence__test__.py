@@ -1,7 +1,12 @@
 from datetime import datetime
 from dataclasses import replace
 from src.image_classifier.classification import Classification
-from src.smart_door.core.model import ClassificationRun, DoorState, ModelReady
+from src.smart_door.core.model import (
+    DEFAULT_CAMERA_ID,
+    ClassificationRun,
+    DoorState,
+    ModelReady,
+)
 from src.smart_door.core.msg import MsgTick
 from src.smart_door.core.test.fixture import BaseFixture
 
@@ -23,16 +28,18 @@ class Fixture(BaseFixture):
         self.model = replace(
             model,
             door=replace(model.door, state=door_state, state_start_time=datetime.now()),
-            camera=replace(
-                model.camera,
-                classification_runs=[
-                    ClassificationRun(
-                        classifications=classifications,
-                        images=[],
-                        finished_at=datetime.now(),
-                    )
-                ],
-            ),
+            cameras={
+                DEFAULT_CAMERA_ID: replace(
+                    model.cameras[DEFAULT_CAMERA_ID],
+                    classification_runs=[
+                        ClassificationRun(
+                            classifications=classifications,
+                            images=[],
+                            finished_at=datetime.now(),
+                        )
+                    ],
+                )
+            },
         )
 
 
@@ -1,10 +1,13 @@
 from src.smart_door.core.transition_connecting import transition_connecting
 from src.smart_door.core.transition_ready import transition_ready
+from typing import Optional
+from src.smart_door.config import Config
 from .model import (
     Model,
     ModelConnecting,
     ModelReady,
     ConnectionState,
+    to_tick_rate,
 )
 from .msg import (
     Msg,
@@ -14,24 +17,40 @@ from .effect import (
     EffectSubscribeCamera,
     EffectSubscribeDoor,
     EffectSubscribeTick,
+    EffectWarmUpClassifier,
 )
 
 
-def init() -> tuple[Model, list[Effect]]:
+def init(config: Optional[Config] = None) -> tuple[Model, list[Effect]]:
+    model = ModelConnecting(
+        config=config if config is not None else Config(),
+        camera=ConnectionState.Connecting,
+        door=ConnectionState.Connecting,
+        classifier=ConnectionState.Connecting,
+    )
     return (
-        ModelConnecting(
-            camera=ConnectionState.Connecting,
-            door=ConnectionState.Connecting,
-        ),
+        model,
         [
             EffectSubscribeCamera(),
             EffectSubscribeDoor(),
-            EffectSubscribeTick(),
+            EffectSubscribeTick(interval=to_tick_rate(model)),
+            EffectWarmUpClassifier(),
         ],
     )
 
 
 def transition(model: Model, msg: Msg) -> tuple[Model, list[Effect]]:
+    """Re-subscribes to ticks whenever the transition changes the cadence."""
+    model_new, effects = _transition(model=model, msg=msg)
+
+    tick_rate = to_tick_rate(model_new)
+    if tick_rate != to_tick_rate(model):
+        effects = [*effects, EffectSubscribeTick(interval=tick_rate)]
+
+    return model_new, effects
+
+
+def _transition(model: Model, msg: Msg) -> tuple[Model, list[Effect]]:
     if isinstance(model, ModelConnecting):
         return transition_connecting(model=model, msg=msg)
 
@@ -9,12 +9,15 @@ from .model import (
     ModelDoor,
     ConnectionState,
     CameraState,
+    CameraId,
+    DEFAULT_CAMERA_ID,
     DoorState,
 )
 from .msg import (
     Msg,
     MsgCameraEvent,
     MsgDoorEvent,
+    MsgClassifierWarmUpDone,
 )
 from .effect import (
     Effect,
@@ -24,14 +27,25 @@ from .effect import (
 def transition_connecting(
     model: ModelConnecting, msg: Msg
 ) -> tuple[Model, list[Effect]]:
+    cameras_connected = _transition_connecting_cameras(model.cameras_connected, msg)
+
     model_new = ModelConnecting(
-        camera=_transition_connecting_camera(model.camera, msg),
+        config=model.config,
+        classifier_warm_up_duration=(
+            msg.duration
+            if isinstance(msg, MsgClassifierWarmUpDone)
+            else model.classifier_warm_up_duration
+        ),
+        camera=_transition_connecting_camera(model.camera, cameras_connected, msg),
         door=_transition_connecting_door(model.door, msg),
+        classifier=_transition_connecting_classifier(model.classifier, msg),
+        cameras_connected=cameras_connected,
     )
 
     is_ready = (
         model_new.camera == ConnectionState.Connected
         and model_new.door == ConnectionState.Connected
+        and model_new.classifier == ConnectionState.Connected
     )
 
     if not is_ready:
@@ -39,11 +53,16 @@ def transition_connecting(
 
     return (
         ModelReady(
-            camera=ModelCamera(
-                state=CameraState.Idle,
-                state_start_time=datetime.now(),
-                classification_runs=[],
-            ),
+            config=model.config,
+            classifier_warm_up_duration=model_new.classifier_warm_up_duration,
+            cameras={
+                camera_id: ModelCamera(
+                    state=CameraState.Idle,
+                    state_start_time=datetime.now(),
+                    classification_runs=[],
+                )
+                for camera_id in cameras_connected or [DEFAULT_CAMERA_ID]
+            },
             door=ModelDoor(
                 state=DoorState.Closed,
                 state_start_time=datetime.now(),
@@ -68,16 +87,43 @@ def _transition_connecting_door(
     return connection_state
 
 
-def _transition_connecting_camera(
+def _transition_connecting_classifier(
     connection_state: ConnectionState, msg: Msg
 ) -> ConnectionState:
+    """Ready once warmed up; a warmed up classifier stays ready."""
+    if isinstance(msg, MsgClassifierWarmUpDone):
+        return ConnectionState.Connected
+
+    return connection_state
+
+
+def _transition_connecting_cameras(
+    cameras_connected: list[CameraId], msg: Msg
+) -> list[CameraId]:
     if not isinstance(msg, MsgCameraEvent):
-        return connection_state
+        return cameras_connected
 
     if isinstance(msg.camera_event, EventCameraConnected):
-        return ConnectionState.Connected
+        if msg.camera_id in cameras_connected:
+            return cameras_connected
+        return [*cameras_connected, msg.camera_id]
 
     if isinstance(msg.camera_event, EventCameraDisconnected):
+        return [c for c in cameras_connected if c != msg.camera_id]
+
+    return cameras_connected
+
+
+def _transition_connecting_camera(
+    connection_state: ConnectionState, cameras_connected: list[CameraId], msg: Msg
+) -> ConnectionState:
+    """Connected while at least one camera is."""
+    if not isinstance(msg, MsgCameraEvent):
+        return connection_state
+
+    if isinstance(msg.camera_event, (EventCameraConnected, EventCameraDisconnected)):
+        if cameras_connected:
+            return ConnectionState.Connected
         return ConnectionState.Connecting
 
     return connection_state
@@ -1,10 +1,12 @@
-from src.device_camera.event import EventCameraDisconnected
+from dataclasses import replace
+from src.device_camera.event import EventCameraConnected, EventCameraDisconnected
 from src.device_door.event import EventDoorDisconnected
 from src.smart_door.core.transition_ready_door.transition_ready_door import (
     transition_ready_door,
 )
 from .model import (
     Model,
+    ModelCamera,
     ModelConnecting,
     ModelReady,
     ConnectionState,
@@ -24,21 +26,24 @@ def transition_ready(model: ModelReady, msg: Msg) -> tuple[Model, list[Effect]]:
     if isinstance(msg, MsgCameraEvent) and isinstance(
         msg.camera_event, EventCameraDisconnected
     ):
-        return (
-            ModelConnecting(
-                camera=ConnectionState.Connecting,
-                door=ConnectionState.Connected,
-            ),
-            [],
-        )
+        return _transition_ready_camera_disconnected(model=model, msg=msg)
+
+    if isinstance(msg, MsgCameraEvent) and isinstance(
+        msg.camera_event, EventCameraConnected
+    ):
+        return _transition_ready_camera_connected(model=model, msg=msg)
 
     if isinstance(msg, MsgDoorEvent) and isinstance(
         msg.door_event, EventDoorDisconnected
     ):
         return (
             ModelConnecting(
+                config=model.config,
+                classifier_warm_up_duration=model.classifier_warm_up_duration,
                 camera=ConnectionState.Connected,
                 door=ConnectionState.Connecting,
+                classifier=ConnectionState.Connected,
+                cameras_connected=list(model.cameras),
             ),
             [],
         )
@@ -46,17 +51,61 @@ def transition_ready(model: ModelReady, msg: Msg) -> tuple[Model, list[Effect]]:
     return _transition_ready_main(model=model, msg=msg)
 
 
+def _transition_ready_camera_disconnected(
+    model: ModelReady, msg: MsgCameraEvent
+) -> tuple[Model, list[Effect]]:
+    """Keep running on the remaining cameras; reconnect once none are left."""
+    cameras = {
+        camera_id: camera
+        for camera_id, camera in model.cameras.items()
+        if camera_id != msg.camera_id
+    }
+
+    if cameras:
+        return replace(model, cameras=cameras), []
+
+    return (
+        ModelConnecting(
+            config=model.config,
+            classifier_warm_up_duration=model.classifier_warm_up_duration,
+            camera=ConnectionState.Connecting,
+            door=ConnectionState.Connected,
+            classifier=ConnectionState.Connected,
+        ),
+        [],
+    )
+
+
+def _transition_ready_camera_connected(
+    model: ModelReady, msg: MsgCameraEvent
+) -> tuple[Model, list[Effect]]:
+    if msg.camera_id in model.cameras:
+        return model, []
+
+    cameras = {
+        **model.cameras,
+        msg.camera_id: ModelCamera(state_start_time=msg.happened_at),
+    }
+    return replace(model, cameras=cameras), []
+
+
 def _transition_ready_main(model: ModelReady, msg: Msg) -> tuple[Model, list[Effect]]:
     effects_new: list[Effect] = []
 
-    camera, effects = transition_ready_camera(model=model, camera=model.camera, msg=msg)
-    effects_new.extend(effects)
+    cameras = {}
+    for camera_id, camera in model.cameras.items():
+        cameras[camera_id], effects = transition_ready_camera(
+            model=model, camera_id=camera_id, camera=camera, msg=msg
+        )
+        effects_new.extend(effects)
 
     door, effects = transition_ready_door(model=model, door=model.door, msg=msg)
     effects_new.extend(effects)
 
     model_new = ModelReady(
-        camera=camera,
+        config=model.config,
+        classifier_warm_up_duration=model.classifier_warm_up_duration,
+        cameras=cameras,
         door=door,
     )
 
@@ -1,7 +1,10 @@
+from dataclasses import replace
 from .model import (
+    CameraId,
     ModelReady,
     ModelCamera,
     CameraState,
+    to_minimal_rate_camera_process,
 )
 from .msg import (
     Msg,
@@ -17,17 +20,24 @@ from .effect import (
 
 
 def transition_ready_camera(
-    model: ModelReady, camera: ModelCamera, msg: Msg
+    model: ModelReady, camera_id: CameraId, camera: ModelCamera, msg: Msg
 ) -> tuple[ModelCamera, list[Effect]]:
+    """Capture and classify pipeline of one camera; ticks drive every camera."""
+    if (
+        isinstance(msg, (MsgImageCaptureDone, MsgImageClassifyDone))
+        and msg.camera_id != camera_id
+    ):
+        return camera, []
+
     effects_new: list[Effect] = []
 
     camera_new, effects = _transition_camera_idle_to_capturing(
-        model=model, camera=camera, msg=msg
+        model=model, camera_id=camera_id, camera=camera, msg=msg
     )
     effects_new.extend(effects)
 
     camera_new, effects = _transition_camera_capturing_to_classifying(
-        camera=camera_new, msg=msg
+        model=model, camera_id=camera_id, camera=camera_new, msg=msg
     )
     effects_new.extend(effects)
 
@@ -40,7 +50,7 @@ def transition_ready_camera(
 
 
 def _transition_camera_idle_to_capturing(
-    model: ModelReady, camera: ModelCamera, msg: Msg
+    model: ModelReady, camera_id: CameraId, camera: ModelCamera, msg: Msg
 ) -> tuple[ModelCamera, list[Effect]]:
     if not isinstance(msg, MsgTick):
         return camera, []
@@ -49,7 +59,7 @@ def _transition_camera_idle_to_capturing(
         return camera, []
 
     should_capture = (
-        camera.state_start_time + model.config.minimal_rate_camera_process
+        camera.state_start_time + to_minimal_rate_camera_process(model)
         < msg.happened_at
     )
 
@@ -57,17 +67,13 @@ def _transition_camera_idle_to_capturing(
         return camera, []
 
     return (
-        ModelCamera(
-            state=CameraState.Capturing,
-            state_start_time=msg.happened_at,
-            classification_runs=camera.classification_runs,
-        ),
-        [EffectCaptureImage()],
+        replace(camera, state=CameraState.Capturing, state_start_time=msg.happened_at),
+        [EffectCaptureImage(camera_id=camera_id)],
     )
 
 
 def _transition_camera_capturing_to_classifying(
-    camera: ModelCamera, msg: Msg
+    model: ModelReady, camera_id: CameraId, camera: ModelCamera, msg: Msg
 ) -> tuple[ModelCamera, list[Effect]]:
     if not isinstance(msg, MsgImageCaptureDone):
         return camera, []
@@ -76,20 +82,51 @@ def _transition_camera_capturing_to_classifying(
         return camera, []
 
     if not msg.images:
-        camera_new = ModelCamera(
+        camera_new = replace(
+            camera, state=CameraState.Idle, state_start_time=msg.happened_at
+        )
+        return camera_new, []
+
+    if _should_skip_no_motion(model=model, camera=camera, msg=msg):
+        camera_new = replace(
+            camera,
             state=CameraState.Idle,
             state_start_time=msg.happened_at,
-            classification_runs=camera.classification_runs,
+            frames_captured=camera.frames_captured + 1,
+            frames_skipped_no_motion=camera.frames_skipped_no_motion + 1,
         )
         return camera_new, []
 
-    camera_new = ModelCamera(
+    camera_new = replace(
+        camera,
         state=CameraState.Classifying,
         state_start_time=msg.happened_at,
-        classification_runs=camera.classification_runs,
+        frames_captured=camera.frames_captured + 1,
     )
 
-    return camera_new, [EffectClassifyImages(images=msg.images)]
+    return camera_new, [EffectClassifyImages(images=msg.images, camera_id=camera_id)]
+
+
+def _should_skip_no_motion(
+    model: ModelReady, camera: ModelCamera, msg: MsgImageCaptureDone
+) -> bool:
+    """
+    Keep the latest classification run instead of classifying again when the
+    scene has not changed since it was taken. A run older than
+    motion_max_skip_duration is always refreshed.
+    """
+    if not model.config.motion_gate_enabled:
+        return False
+
+    if msg.motion_ratio is None or not camera.classification_runs:
+        return False
+
+    if msg.motion_ratio >= model.config.motion_min_changed_ratio:
+        return False
+
+    latest_run = camera.classification_runs[0]
+    elapsed_time = msg.happened_at - latest_run.finished_at
+    return elapsed_time < model.config.motion_max_skip_duration
 
 
 def _transition_camera_classifying_to_idle(
@@ -109,7 +146,8 @@ def _transition_camera_classifying_to_idle(
         : model.config.max_classification_runs
     ]
 
-    camera_new = ModelCamera(
+    camera_new = replace(
+        camera,
         state=CameraState.Idle,
         state_start_time=msg.happened_at,
         classification_runs=classification_runs_new,
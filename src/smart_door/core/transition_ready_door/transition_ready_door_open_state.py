@@ -5,6 +5,7 @@ from ..model import (
     DoorState,
     ModelDoor,
     ModelReady,
+    to_latest_classifications,
 )
 from ..msg import (
     Msg,
@@ -57,14 +58,8 @@ def _transition_from_will_open_to_opened(
 def _transition_to_will_open(
     model: ModelReady, door: ModelDoor, msg: Msg
 ) -> tuple[ModelDoor, list[Effect]]:
-    classifications: list[Classification] = [
-        classification
-        for classification_run in model.camera.classification_runs
-        for classification in classification_run.classifications
-    ]
-
     should_open = _does_have_open_list_objects(
-        classifications=classifications,
+        classifications=to_latest_classifications(model=model),
         open_list=model.config.classification_open_list,
     )
 
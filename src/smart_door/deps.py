@@ -1,13 +1,32 @@
+from src.image.motion_detector import MotionDetector
 from src.image_classifier.interface import ImageClassifier
 from src.device_camera.interface import DeviceCamera
 from src.device_door.interface import DeviceDoor
 from logging import Logger
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+import threading
+from src.library.pub_sub import Sub
+from src.library.time import ticks
+from src.smart_door.core.model import CameraId
 
 
 @dataclass
 class Deps:
     image_classifier: ImageClassifier
-    device_camera: DeviceCamera
+    # What each camera's frames are classified with; the shared classifier or
+    # that camera's cache in front of it.
+    camera_image_classifiers: dict[CameraId, ImageClassifier]
+    device_cameras: dict[CameraId, DeviceCamera]
     device_door: DeviceDoor
+    motion_detectors: dict[CameraId, MotionDetector]
     logger: Logger
+    # Tick source for an interval.
+    ticks: Callable[[timedelta], Sub[datetime]] = ticks
+    # Cancels the current tick subscription when the cadence changes.
+    unsubscribe_ticks: Optional[Callable[[], None]] = None
+    # Set once the door stops. A subscribe effect still running on a thread
+    # must not subscribe after that, so both go through ticks_lock.
+    stopped: bool = False
+    ticks_lock: threading.Lock = field(default_factory=threading.Lock)
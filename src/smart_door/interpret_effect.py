@@ -1,6 +1,10 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+import time
+from typing import Optional
 from src.device_camera.event import EventCamera
-from src.smart_door.core.model import ClassificationRun, Model
+from src.device_camera.interface import DeviceCamera
+from src.image.image import Image
+from src.smart_door.core.model import CameraId, ClassificationRun, Model, ModelReady
 from .core import (
     Effect,
     Msg,
@@ -9,6 +13,7 @@ from .core import (
     EffectSubscribeCamera,
     EffectSubscribeDoor,
     EffectSubscribeTick,
+    EffectWarmUpClassifier,
     EffectOpenDoor,
     EffectCloseDoor,
     MsgImageCaptureDone,
@@ -18,21 +23,20 @@ from .core import (
     MsgTick,
     MsgDoorEvent,
     MsgCameraEvent,
+    MsgClassifierWarmUpDone,
 )
 import queue
 from .deps import Deps
-from src.library.time import ticks
 
 
 def interpret_effect(
     deps: Deps, model: Model, effect: Effect, msg_queue: queue.Queue[Msg]
 ) -> None:
     if isinstance(effect, EffectSubscribeCamera):
-        deps.device_camera.events().subscribe(
-            lambda camera_event: msg_queue.put(
-                MsgCameraEvent(camera_event=camera_event)
+        for camera_id, device_camera in deps.device_cameras.items():
+            _subscribe_camera(
+                camera_id=camera_id, device_camera=device_camera, msg_queue=msg_queue
             )
-        )
 
     if isinstance(effect, EffectSubscribeDoor):
         deps.device_door.events().subscribe(
@@ -40,16 +44,44 @@ def interpret_effect(
         )
 
     if isinstance(effect, EffectSubscribeTick):
-        ticks(interval=model.config.tick_rate).subscribe(
-            lambda now: msg_queue.put(MsgTick(happened_at=now))
+        interval = (
+            effect.interval if effect.interval is not None else model.config.tick_rate
         )
+        with deps.ticks_lock:
+            if deps.unsubscribe_ticks is not None:
+                deps.unsubscribe_ticks()
+                deps.unsubscribe_ticks = None
+            if not deps.stopped:
+                deps.unsubscribe_ticks = deps.ticks(interval).subscribe(
+                    lambda now: msg_queue.put(MsgTick(happened_at=now))
+                )
+
+    if isinstance(effect, EffectWarmUpClassifier):
+        started_at = time.monotonic()
+        try:
+            deps.image_classifier.warm_up()
+        except Exception:
+            # Carry on cold rather than never getting ready.
+            deps.logger.exception("Classifier warm-up failed")
+        duration = timedelta(seconds=time.monotonic() - started_at)
+        deps.logger.info("Classifier warmed up in %.2fs", duration.total_seconds())
+        msg_queue.put(MsgClassifierWarmUpDone(duration=duration))
 
     if isinstance(effect, EffectCaptureImage):
-        images = deps.device_camera.capture()
-        msg_queue.put(MsgImageCaptureDone(images=images))
+        images = deps.device_cameras[effect.camera_id].capture()
+        motion_ratio = _to_motion_ratio(
+            deps=deps, model=model, camera_id=effect.camera_id, images=images
+        )
+        msg_queue.put(
+            MsgImageCaptureDone(
+                images=images, motion_ratio=motion_ratio, camera_id=effect.camera_id
+            )
+        )
 
     if isinstance(effect, EffectClassifyImages):
-        classifications = deps.image_classifier.classify(images=effect.images)
+        classifications = deps.camera_image_classifiers[effect.camera_id].classify(
+            images=effect.images
+        )
         finished_at = datetime.now()
         msg_queue.put(
             MsgImageClassifyDone(
@@ -57,7 +89,8 @@ def interpret_effect(
                     classifications=classifications,
                     images=effect.images,
                     finished_at=finished_at,
-                )
+                ),
+                camera_id=effect.camera_id,
             )
         )
 
@@ -68,3 +101,32 @@ def interpret_effect(
     if isinstance(effect, EffectCloseDoor):
         deps.device_door.close()
         msg_queue.put(MsgDoorCloseDone())
+
+
+def _subscribe_camera(
+    camera_id: CameraId, device_camera: DeviceCamera, msg_queue: queue.Queue[Msg]
+) -> None:
+    device_camera.events().subscribe(
+        lambda camera_event: msg_queue.put(
+            MsgCameraEvent(camera_event=camera_event, camera_id=camera_id)
+        )
+    )
+
+
+def _to_motion_ratio(
+    deps: Deps, model: Model, camera_id: CameraId, images: list[Image]
+) -> Optional[float]:
+    """Compare the capture against the frames of the camera's latest classification run."""
+    if not isinstance(model, ModelReady) or not model.config.motion_gate_enabled:
+        return None
+
+    camera = model.cameras.get(camera_id)
+    if camera is None or not camera.classification_runs:
+        return None
+
+    return deps.motion_detectors[camera_id].changed_ratio(
+        images=images,
+        references=camera.classification_runs[0].images,
+        thumbnail_width=model.config.motion_thumbnail_width,
+        pixel_threshold=model.config.motion_pixel_threshold,
+    )
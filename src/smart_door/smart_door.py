@@ -1,45 +1,190 @@
+from datetime import datetime, timedelta
+from enum import Enum
 from logging import Logger
 import queue
+from typing import Any, Callable, Hashable, Optional, Union
+from src.image.motion_detector import MotionDetector
+from src.image_classifier.impl_caching import CacheStats, CachingImageClassifier
+from src.image_classifier.impl_cascade import CascadeImageClassifier, CascadeStats
 from src.image_classifier.interface import ImageClassifier
 from src.device_camera.interface import DeviceCamera
 from src.device_door.interface import DeviceDoor
+from src.library.async_state_machine import AsyncStateMachine
+from src.library.effect_executor import AsyncEffectExecutor, EffectExecutor
 from src.library.life_cycle import LifeCycle
 from src.library.pub_sub import Sub
 from src.library.state_machine import StateMachine
+from src.library.time import loop_ticks
 from src.smart_door.config import Config
 from src.smart_door.core import transition, init
-from src.smart_door.core.effect import Effect
-from src.smart_door.core.model import Model
+from src.smart_door.core.effect import (
+    Effect,
+    EffectCaptureImage,
+    EffectClassifyImages,
+    EffectCloseDoor,
+    EffectOpenDoor,
+    EffectSubscribeTick,
+)
+from src.smart_door.core.model import CameraId, Model
 from src.smart_door.core.msg import Msg
 from .interpret_effect import interpret_effect
 from .deps import Deps
 
 
+# One capture and one inference at a time per camera; a newer request replaces
+# one of the same camera that is still waiting. Cameras classify concurrently
+# so a batching classifier can run their frames as one batch. Door commands
+# share a group so open and close never race, and tick subscriptions are
+# switched one at a time with the newest cadence winning.
+EFFECT_MAX_WORKERS = 4
+EFFECT_CONCURRENCY_LIMITS: dict[Hashable, int] = {
+    EffectOpenDoor: 1,
+    EffectSubscribeTick: 1,
+}
+EFFECT_CAMERA_CONCURRENCY_LIMIT = 1
+
+
+def _to_effect_key(effect: Effect) -> Hashable:
+    if isinstance(effect, EffectCloseDoor):
+        return EffectOpenDoor
+    if isinstance(effect, (EffectCaptureImage, EffectClassifyImages)):
+        return (type(effect), effect.camera_id)
+    return type(effect)
+
+
+def _to_effect_supersession_key(effect: Effect) -> Optional[Hashable]:
+    """A newer capture or classify only replaces a pending one of the same camera."""
+    if isinstance(effect, (EffectCaptureImage, EffectClassifyImages)):
+        return (type(effect), effect.camera_id)
+    if isinstance(effect, EffectSubscribeTick):
+        return EffectSubscribeTick
+    return None
+
+
+class Runtime(Enum):
+    # Own message loop thread and effect worker threads.
+    THREADS = "threads"
+    # Tasks on the asyncio loop that calls start, e.g. an HTTP server's.
+    ASYNCIO = "asyncio"
+
+
 class SmartDoor(LifeCycle):
     _deps: Deps
-    _state_machine: StateMachine
+    _state_machine: Union[StateMachine, AsyncStateMachine]
+    _config: Config
+    _runtime: Runtime
+    _ticks_overridden: bool
+    _cascade: Optional[CascadeImageClassifier]
+    _caches: dict[CameraId, CachingImageClassifier]
 
     def __init__(
         self,
         image_classifier: ImageClassifier,
-        device_camera: DeviceCamera,
+        device_cameras: dict[CameraId, DeviceCamera],
         device_door: DeviceDoor,
         logger: Logger,
+        config: Optional[Config] = None,
+        ticks: Optional[Callable[[timedelta], Sub[datetime]]] = None,
+        runtime: Runtime = Runtime.THREADS,
+        fast_image_classifier: Optional[ImageClassifier] = None,
     ) -> None:
+        """
+        Each camera runs its own capture and classify pipeline; their
+        classifications are fused into one door decision and inference for all
+        of them goes through one shared classifier.
+        With the cascade enabled and a fast_image_classifier given, frames go
+        through it first and only ambiguous ones reach image_classifier.
+        With the classification cache enabled each camera gets its own cache,
+        so one camera's scene is never answered with another's.
+        ticks overrides where the door's ticks come from for an interval, by
+        default the process-wide scheduler, or with Runtime.ASYNCIO timers
+        on the door's loop.
+        With Runtime.ASYNCIO, start must be called on the loop to run on.
+        """
+        if not device_cameras:
+            raise ValueError("SmartDoor needs at least one camera")
+
+        self._config = config if config is not None else Config()
+        self._cascade = (
+            CascadeImageClassifier(
+                fast=fast_image_classifier,
+                accurate=image_classifier,
+                labels={
+                    classification.label
+                    for classification in self._config.classification_open_list
+                    + self._config.classification_close_list
+                },
+                min_weight=self._config.classification_cascade_min_weight,
+                max_weight=self._config.classification_cascade_max_weight,
+            )
+            if fast_image_classifier is not None
+            and self._config.classification_cascade_enabled
+            else None
+        )
+        if self._cascade is not None:
+            image_classifier = self._cascade
+        self._caches = (
+            {
+                camera_id: CachingImageClassifier(
+                    image_classifier=image_classifier,
+                    max_distance=self._config.classification_cache_max_distance,
+                    ttl=self._config.classification_cache_ttl,
+                )
+                for camera_id in device_cameras
+            }
+            if self._config.classification_cache_enabled
+            else {}
+        )
         self._deps = Deps(
             image_classifier=image_classifier,
-            device_camera=device_camera,
+            camera_image_classifiers={
+                camera_id: self._caches.get(camera_id, image_classifier)
+                for camera_id in device_cameras
+            },
+            device_cameras=dict(device_cameras),
             device_door=device_door,
+            motion_detectors={
+                camera_id: MotionDetector() for camera_id in device_cameras
+            },
             logger=logger.getChild("smart_door"),
         )
+        self._ticks_overridden = ticks is not None
+        if ticks is not None:
+            self._deps.ticks = ticks
 
-        self._state_machine = StateMachine(
-            init=init,
-            transition=transition,
-            interpret_effect=self._interpret_effect,
+        effect_executor_kwargs: dict[str, Any] = dict(
             logger=self._deps.logger,
+            max_workers=EFFECT_MAX_WORKERS,
+            to_key=_to_effect_key,
+            to_supersession_key=_to_effect_supersession_key,
+            concurrency_limits={
+                **EFFECT_CONCURRENCY_LIMITS,
+                **{
+                    (effect_type, camera_id): EFFECT_CAMERA_CONCURRENCY_LIMIT
+                    for effect_type in (EffectCaptureImage, EffectClassifyImages)
+                    for camera_id in device_cameras
+                },
+            },
         )
 
+        self._runtime = runtime
+        if runtime == Runtime.ASYNCIO:
+            self._state_machine = AsyncStateMachine(
+                init=lambda: init(config=self._config),
+                transition=transition,
+                interpret_effect=self._interpret_effect,
+                logger=self._deps.logger,
+                effect_executor=AsyncEffectExecutor[Effect](**effect_executor_kwargs),
+            )
+        else:
+            self._state_machine = StateMachine(
+                init=lambda: init(config=self._config),
+                transition=transition,
+                interpret_effect=self._interpret_effect,
+                logger=self._deps.logger,
+                effect_executor=EffectExecutor[Effect](**effect_executor_kwargs),
+            )
+
     @property
     def models(self) -> Sub[Model]:
         return self._state_machine.models()
@@ -48,6 +193,19 @@ class SmartDoor(LifeCycle):
     def msgs(self) -> Sub[Msg]:
         return self._state_machine.msgs()
 
+    def classification_cascade_stats(self) -> Optional[CascadeStats]:
+        """How often the cascade escalated, or None without a cascade."""
+        return self._cascade.stats() if self._cascade is not None else None
+
+    def classification_cache_stats(self) -> Optional[CacheStats]:
+        """Cache hits and misses of all cameras, or None with the cache disabled."""
+        if not self._caches:
+            return None
+        stats = [cache.stats() for cache in self._caches.values()]
+        return CacheStats(
+            hits=sum(s.hits for s in stats), misses=sum(s.misses for s in stats)
+        )
+
     def _interpret_effect(
         self, model: Model, effect: Effect, msg_queue: queue.Queue[Msg]
     ) -> None:
@@ -60,10 +218,22 @@ class SmartDoor(LifeCycle):
 
     def start(self) -> None:
         self._deps.logger.info("Starting")
+        with self._deps.ticks_lock:
+            self._deps.stopped = False
+            if self._runtime == Runtime.ASYNCIO and not self._ticks_overridden:
+                # Doors on the same loop share its timers per interval.
+                self._deps.ticks = loop_ticks()
         self._state_machine.start()
         self._deps.logger.info("Started")
 
     def stop(self) -> None:
         self._deps.logger.info("Stopping")
         self._state_machine.stop()
+        # With Runtime.ASYNCIO a subscribe effect can still be running on a
+        # pool thread; the flag keeps it from subscribing after this.
+        with self._deps.ticks_lock:
+            self._deps.stopped = True
+            if self._deps.unsubscribe_ticks is not None:
+                self._deps.unsubscribe_ticks()
+                self._deps.unsubscribe_ticks = None
         self._deps.logger.info("Stopped")
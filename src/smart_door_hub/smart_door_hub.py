@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from logging import Logger
+from typing import Optional
+import threading
+from src.device_camera.interface import DeviceCamera
+from src.device_door.interface import DeviceDoor
+from src.image_classifier.interface import ImageClassifier
+from src.library.life_cycle import LifeCycle
+from src.smart_door.config import Config
+from src.smart_door.core.model import CameraId, Model
+from src.smart_door.smart_door import Runtime, SmartDoor
+
+# Identifies one door and the cameras watching it.
+DoorId = str
+
+
+@dataclass
+class HubDoor:
+    device_door: DeviceDoor
+    device_cameras: dict[CameraId, DeviceCamera]
+
+
+class SmartDoorHub(LifeCycle):
+    """
+    Hosts several doors in one process. Every door runs its own SmartDoor
+    state machine, but they all share one image classifier (so one model is
+    loaded and inference is queued in one place), timers shared per tick
+    interval and one status surface via latest_models().
+
+    The hub owns the door and camera devices; the classifier belongs to the
+    caller since it may outlive the hub. With Runtime.ASYNCIO the doors, their
+    effects and their ticks run on the loop that calls start.
+    """
+
+    _logger: Logger
+    _config: Config
+    _runtime: Runtime
+    _doors: dict[DoorId, HubDoor]
+    _smart_doors: dict[DoorId, SmartDoor]
+    _latest_models: dict[DoorId, Model]
+    _lock: threading.Lock
+    _running: bool
+
+    def __init__(
+        self,
+        image_classifier: ImageClassifier,
+        doors: dict[DoorId, HubDoor],
+        logger: Logger,
+        config: Optional[Config] = None,
+        runtime: Runtime = Runtime.THREADS,
+        fast_image_classifier: Optional[ImageClassifier] = None,
+    ) -> None:
+        if not doors:
+            raise ValueError("SmartDoorHub needs at least one door")
+
+        self._logger = logger.getChild("smart_door_hub")
+        self._config = config if config is not None else Config()
+        self._runtime = runtime
+        self._doors = dict(doors)
+        self._latest_models = {}
+        self._lock = threading.Lock()
+        self._running = False
+
+        self._smart_doors = {
+            door_id: SmartDoor(
+                image_classifier=image_classifier,
+                device_cameras=door.device_cameras,
+                device_door=door.device_door,
+                logger=self._logger.getChild(door_id),
+                config=self._config,
+                runtime=runtime,
+                fast_image_classifier=fast_image_classifier,
+            )
+            for door_id, door in self._doors.items()
+        }
+
+        for door_id, smart_door in self._smart_doors.items():
+            smart_door.models.subscribe(
+                lambda model, door_id=door_id: self._set_latest_model(door_id, model)
+            )
+
+    @property
+    def door_ids(self) -> list[DoorId]:
+        return list(self._smart_doors)
+
+    def smart_door(self, door_id: DoorId) -> SmartDoor:
+        return self._smart_doors[door_id]
+
+    def latest_models(self) -> dict[DoorId, Model]:
+        """Latest model of every door that has started, keyed by door id."""
+        with self._lock:
+            return dict(self._latest_models)
+
+    def _set_latest_model(self, door_id: DoorId, model: Model) -> None:
+        with self._lock:
+            self._latest_models[door_id] = model
+
+    def start(self) -> None:
+        self._logger.info("Starting %d doors", len(self._doors))
+        if self._running:
+            self._logger.info("Already started")
+            return
+        self._running = True
+
+        for door in self._doors.values():
+            door.device_door.start()
+            for device_camera in door.device_cameras.values():
+                device_camera.start()
+
+        for smart_door in self._smart_doors.values():
+            smart_door.start()
+
+        self._logger.info("Started")
+
+    def stop(self) -> None:
+        self._logger.info("Stopping")
+        if not self._running:
+            self._logger.info("Already stopped")
+            return
+        self._running = False
+
+        for smart_door in self._smart_doors.values():
+            smart_door.stop()
+
+        for door in self._doors.values():
+            for device_camera in door.device_cameras.values():
+                device_camera.stop()
+            door.device_door.stop()
+
+        self._logger.info("Stopped")
@@ -0,0 +1,242 @@
+from dataclasses import replace
+from datetime import datetime, timedelta
+import asyncio
+import logging
+import queue
+import threading
+import time
+import numpy as np
+from src.device_camera.impl_fake import FakeDeviceCamera
+from src.device_door.impl_fake import FakeDeviceDoor
+from src.image.image import Image
+from src.image_classifier.classification import Classification
+from src.image_classifier.interface import ImageClassifier
+from src.library.pub_sub import PubSub
+from src.smart_door.config import Config
+from src.smart_door.core.effect import EffectClassifyImages, EffectSubscribeTick
+from src.smart_door.core.model import DEFAULT_CAMERA_ID, ModelCamera, ModelReady
+from src.smart_door.smart_door import Runtime
+from src.smart_door_hub.smart_door_hub import HubDoor, SmartDoorHub
+from src.smart_door_hub.smart_door_hub_http_api import to_door_json
+
+DOOR_IDS = ["front", "back"]
+
+
+class _CountingImageClassifier(ImageClassifier):
+    def __init__(self) -> None:
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def classify(self, images: list[Image]) -> list[Classification]:
+        with self._lock:
+            self.calls += 1
+        return []
+
+
+def _hub_door(logger: logging.Logger) -> HubDoor:
+    no_latency = timedelta(seconds=0)
+    return HubDoor(
+        device_door=FakeDeviceDoor(
+            logger=logger, latency_start=no_latency, latency_stop=no_latency
+        ),
+        device_cameras={
+            DEFAULT_CAMERA_ID: FakeDeviceCamera(
+                logger=logger,
+                latency_capture=no_latency,
+                latency_start=no_latency,
+                latency_stop=no_latency,
+            )
+        },
+    )
+
+
+def test_doors_share_one_classifier_and_tick_source() -> None:
+    logger = logging.getLogger("test")
+    image_classifier = _CountingImageClassifier()
+    hub = SmartDoorHub(
+        image_classifier=image_classifier,
+        doors={door_id: _hub_door(logger) for door_id in DOOR_IDS},
+        logger=logger,
+        config=Config(
+            tick_rate=timedelta(seconds=0.01),
+            minimal_rate_camera_process=timedelta(seconds=0.01),
+            motion_gate_enabled=False,
+        ),
+    )
+
+    hub.start()
+    try:
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            latest_models = hub.latest_models()
+            ready = [
+                door_id
+                for door_id, model in latest_models.items()
+                if isinstance(model, ModelReady)
+                and model.cameras[DEFAULT_CAMERA_ID].classification_runs
+            ]
+            if sorted(ready) == sorted(DOOR_IDS):
+                break
+            time.sleep(0.01)
+    finally:
+        hub.stop()
+
+    assert sorted(ready) == sorted(DOOR_IDS)
+    assert image_classifier.calls >= len(DOOR_IDS)
+    assert hub.door_ids == DOOR_IDS
+
+
+def test_doors_run_on_an_asyncio_loop() -> None:
+    logger = logging.getLogger("test")
+    hub = SmartDoorHub(
+        image_classifier=_CountingImageClassifier(),
+        doors={door_id: _hub_door(logger) for door_id in DOOR_IDS},
+        logger=logger,
+        config=Config(
+            tick_rate=timedelta(seconds=0.01),
+            minimal_rate_camera_process=timedelta(seconds=0.01),
+            motion_gate_enabled=False,
+        ),
+        runtime=Runtime.ASYNCIO,
+    )
+
+    async def run() -> list[str]:
+        hub.start()
+        try:
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                ready = [
+                    door_id
+                    for door_id, model in hub.latest_models().items()
+                    if isinstance(model, ModelReady)
+                    and model.cameras[DEFAULT_CAMERA_ID].classification_runs
+                ]
+                if sorted(ready) == sorted(DOOR_IDS):
+                    break
+                await asyncio.sleep(0.01)
+            return ready
+        finally:
+            hub.stop()
+
+    assert sorted(asyncio.run(run())) == sorted(DOOR_IDS)
+
+
+def test_door_json_reports_motion_skip_ratio() -> None:
+    model = ModelReady(
+        cameras={
+            DEFAULT_CAMERA_ID: replace(
+                ModelCamera(), frames_captured=4, frames_skipped_no_motion=3
+            )
+        }
+    )
+
+    door_json = to_door_json(door_id="front", model=model, now=datetime.now())
+
+    assert door_json["motion_skip_ratio"] == 0.75
+    assert (
+        to_door_json(door_id="front", model=None, now=datetime.now())[
+            "motion_skip_ratio"
+        ]
+        == 0.0
+    )
+
+
+def test_classification_cache_is_kept_per_camera() -> None:
+    logger = logging.getLogger("test")
+    image_classifier = _CountingImageClassifier()
+    door = _hub_door(logger)
+    door.device_cameras["side"] = door.device_cameras[DEFAULT_CAMERA_ID]
+    hub = SmartDoorHub(
+        image_classifier=image_classifier,
+        doors={"front": door},
+        logger=logger,
+        config=Config(classification_cache_enabled=True),
+    )
+    smart_door = hub.smart_door("front")
+    scene = Image.from_np_array(
+        np.random.default_rng(1).integers(0, 256, (60, 80, 3), dtype=np.uint8)
+    )
+
+    for camera_id in [DEFAULT_CAMERA_ID, "side", DEFAULT_CAMERA_ID]:
+        smart_door._interpret_effect(
+            model=ModelReady(),
+            effect=EffectClassifyImages(images=[scene], camera_id=camera_id),
+            msg_queue=queue.Queue(),
+        )
+
+    # The same scene from another camera is not answered from the first's cache.
+    assert image_classifier.calls == 2
+    stats = smart_door.classification_cache_stats()
+    assert stats is not None
+    assert (stats.hits, stats.misses) == (1, 2)
+    assert (
+        to_door_json(
+            door_id="front", model=None, now=datetime.now(), cache_stats=stats
+        )["classification_cache_hit_rate"]
+        == 1 / 3
+    )
+
+
+def test_classification_cache_is_off_by_default() -> None:
+    logger = logging.getLogger("test")
+    hub = SmartDoorHub(
+        image_classifier=_CountingImageClassifier(),
+        doors={"front": _hub_door(logger)},
+        logger=logger,
+    )
+
+    assert hub.smart_door("front").classification_cache_stats() is None
+
+
+def test_cascade_escalation_rate_is_reported() -> None:
+    logger = logging.getLogger("test")
+    fast = _CountingImageClassifier()
+    hub = SmartDoorHub(
+        image_classifier=_CountingImageClassifier(),
+        fast_image_classifier=fast,
+        doors={"front": _hub_door(logger)},
+        logger=logger,
+        config=Config(classification_cascade_enabled=True),
+    )
+    smart_door = hub.smart_door("front")
+
+    smart_door._interpret_effect(
+        model=ModelReady(),
+        effect=EffectClassifyImages(
+            images=[Image.from_np_array(np.zeros((4, 4, 3), dtype=np.uint8))]
+        ),
+        msg_queue=queue.Queue(),
+    )
+
+    stats = smart_door.classification_cascade_stats()
+    assert stats is not None
+    assert (stats.classified, stats.escalated) == (1, 0)
+    assert fast.calls == 1
+    assert (
+        to_door_json(
+            door_id="front", model=None, now=datetime.now(), cascade_stats=stats
+        )["classification_cascade_escalation_rate"]
+        == 0.0
+    )
+
+
+def test_tick_subscription_still_running_at_stop_does_not_subscribe() -> None:
+    logger = logging.getLogger("test")
+    hub = SmartDoorHub(
+        image_classifier=_CountingImageClassifier(),
+        doors={"front": _hub_door(logger)},
+        logger=logger,
+        runtime=Runtime.ASYNCIO,
+    )
+    smart_door = hub.smart_door("front")
+    tick_source = PubSub[datetime]()
+    smart_door._deps.ticks = lambda interval: tick_source
+
+    smart_door.stop()
+    smart_door._interpret_effect(
+        model=ModelReady(),
+        effect=EffectSubscribeTick(interval=timedelta(seconds=1)),
+        msg_queue=queue.Queue(),
+    )
+
+    assert tick_source._subs == []
@@ -0,0 +1,108 @@
+from datetime import datetime
+from typing import Any, Optional
+import logging
+from fastapi import HTTPException
+from src.image_classifier.impl_caching import CacheStats
+from src.image_classifier.impl_cascade import CascadeStats
+from src.shared.http_api import HttpApi
+from src.smart_door.core.door_status import to_door_status
+from src.smart_door.core.model import (
+    Model,
+    ModelReady,
+    is_camera_connected,
+    to_latest_classifications,
+    to_motion_skip_ratio,
+)
+from src.smart_door_hub.smart_door_hub import DoorId, SmartDoorHub
+
+
+class SmartDoorHubHttpApi(HttpApi):
+    def __init__(self, **kwargs):
+        super().__init__()
+        self.logger = kwargs.get("logger")
+        assert isinstance(self.logger, logging.Logger)
+        self.smart_door_hub = kwargs.get("smart_door_hub")
+        assert isinstance(self.smart_door_hub, SmartDoorHub)
+
+        @self.api_router.get("/doors")
+        async def list_doors() -> list[dict[str, Any]]:
+            latest_models = self.smart_door_hub.latest_models()
+            now = datetime.now()
+            return [
+                to_door_json(
+                    door_id=door_id,
+                    model=latest_models.get(door_id),
+                    now=now,
+                    cache_stats=self.smart_door_hub.smart_door(
+                        door_id
+                    ).classification_cache_stats(),
+                    cascade_stats=self.smart_door_hub.smart_door(
+                        door_id
+                    ).classification_cascade_stats(),
+                )
+                for door_id in self.smart_door_hub.door_ids
+            ]
+
+        @self.api_router.get("/doors/{door_id}")
+        async def get_door(door_id: str) -> dict[str, Any]:
+            if door_id not in self.smart_door_hub.door_ids:
+                raise HTTPException(status_code=404, detail="Door not found")
+            model = self.smart_door_hub.latest_models().get(door_id)
+            return to_door_json(
+                door_id=door_id,
+                model=model,
+                now=datetime.now(),
+                cache_stats=self.smart_door_hub.smart_door(
+                    door_id
+                ).classification_cache_stats(),
+                cascade_stats=self.smart_door_hub.smart_door(
+                    door_id
+                ).classification_cascade_stats(),
+            )
+
+
+def to_door_json(
+    door_id: DoorId,
+    model: Optional[Model],
+    now: datetime,
+    cache_stats: Optional[CacheStats] = None,
+    cascade_stats: Optional[CascadeStats] = None,
+) -> dict[str, Any]:
+    return {
+        "door_id": door_id,
+        "type": model.type if model is not None else None,
+        "status": to_door_status(model=model, now=now),
+        "camera_connected": model is not None and is_camera_connected(model),
+        "classifier_warm_up_seconds": (
+            model.classifier_warm_up_duration.total_seconds()
+            if model is not None and model.classifier_warm_up_duration is not None
+            else None
+        ),
+        # Share of captured frames not classified because nothing moved.
+        "motion_skip_ratio": to_motion_skip_ratio(model) if model is not None else 0.0,
+        # Share of classifications answered by the cache; None when it is off.
+        "classification_cache_hit_rate": (
+            cache_stats.hit_rate if cache_stats is not None else None
+        ),
+        # Share of frames the fast model passed on to the accurate one; None
+        # without a cascade.
+        "classification_cascade_escalation_rate": (
+            cascade_stats.escalation_rate if cascade_stats is not None else None
+        ),
+        "cameras": (
+            {
+                camera_id: camera.state.name
+                for camera_id, camera in model.cameras.items()
+            }
+            if isinstance(model, ModelReady)
+            else {}
+        ),
+        "classifications": (
+            [
+                {"label": c.label, "weight": c.weight}
+                for c in to_latest_classifications(model)
+            ]
+            if model is not None
+            else []
+        ),
+    }